@@ -6,6 +6,7 @@ from dash.dependencies import Input, Output
 import plotly.express as px
 import plotly.graph_objs as go
 import pandas as pd
+from data_registry import load_dataset
 import pickle
 
 # Load pre-saved plot
@@ -41,7 +42,7 @@ def render_content(tab):
         ])
 
     elif tab == "expected-goals":
-        df = pd.read_csv("EPL_result.csv")
+        df = load_dataset("EPL_result.csv")
         home_stats = df.groupby('Home').agg(
             Avg_xG_Home=('xG_Home', 'mean'),
             Avg_G_Home=('G_Home', 'mean')
@@ -67,7 +68,7 @@ def render_content(tab):
         ])
 
     elif tab == "other":
-        df = pd.read_csv('Liverpool_2015_2023_Matches.csv')
+        df = load_dataset('Liverpool_2015_2023_Matches.csv')
         df['Venue'] = df.apply(lambda row: 'Home' if row['Home'] == 'Liverpool' else 'Away', axis=1)
 
         def get_result(row):
@@ -0,0 +1,67 @@
+"""Benchmark: row-wise ``apply`` enrichment vs ``match_enrichment.enrich_matches``.
+
+Runs both paths over every row of premier-league-matches.csv (~12k matches),
+checks they agree and prints the timings. Run from the repo root:
+
+    python benchmarks/enrichment_benchmark.py
+"""
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from match_enrichment import enrich_matches  # noqa: E402
+
+TEAM = "Liverpool"
+REPEATS = 5
+
+
+def apply_path(df):
+    """The per-row derivation the dashboards used before enrich_matches."""
+    df = df.copy()
+    df['Venue'] = df.apply(lambda row: 'Home' if row['Home'] == TEAM else 'Away', axis=1)
+
+    def get_result(row):
+        if row['Venue'] == 'Home':
+            own, other = row['HomeGoals'], row['AwayGoals']
+        else:
+            own, other = row['AwayGoals'], row['HomeGoals']
+        return 'Win' if own > other else 'Draw' if own == other else 'Loss'
+
+    df['Result'] = df.apply(get_result, axis=1)
+    df['GoalsFor'] = df.apply(lambda row: row['HomeGoals'] if row['Venue'] == 'Home' else row['AwayGoals'], axis=1)
+    df['GoalsAgainst'] = df.apply(lambda row: row['AwayGoals'] if row['Venue'] == 'Home' else row['HomeGoals'], axis=1)
+    df['Points'] = df['Result'].map({'Win': 3, 'Draw': 1, 'Loss': 0})
+    df['Season'] = df['Season_End_Year'].apply(lambda x: f"{x-1}-{str(x)[2:]}")
+    return df
+
+
+def vectorized_path(df):
+    return enrich_matches(df, team=TEAM, team_matches_only=False)
+
+
+def best_of(func, df):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = func(df)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+if __name__ == "__main__":
+    matches = pd.read_csv("premier-league-matches.csv")
+
+    apply_time, expected = best_of(apply_path, matches)
+    vector_time, actual = best_of(vectorized_path, matches)
+
+    columns = ['Venue', 'Result', 'GoalsFor', 'GoalsAgainst', 'Points', 'Season']
+    for col in columns:
+        assert (expected[col].astype(str).to_numpy() == actual[col].astype(str).to_numpy()).all(), col
+
+    print(f"Rows:        {len(matches):,}")
+    print(f"apply path:  {apply_time * 1000:8.1f} ms")
+    print(f"vectorized:  {vector_time * 1000:8.1f} ms")
+    print(f"speed-up:    {apply_time / vector_time:8.1f}x")
@@ -0,0 +1,60 @@
+"""Benchmark: per-group pandas ``rolling`` vs ``rolling_form.RollingForm``.
+
+Computes every metric over every window for every team-season of the long
+team-match table (~25k rows) both ways, checks they agree and prints the
+timings. Run from the repo root:
+
+    python benchmarks/rolling_form_benchmark.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from rolling_form import METRICS, WINDOWS, RollingForm, rolling_column  # noqa: E402
+from team_match_table import team_match_table, team_match_xg  # noqa: E402
+
+REPEATS = 3
+
+
+def pandas_path(matches):
+    """One grouped ``rolling(w, min_periods=1).mean()`` per metric and window."""
+    rows = matches.sort_values(["Team", "Season", "Date"], kind="stable").reset_index(drop=True)
+    groups = rows.groupby(["Team", "Season"], sort=False)
+    for window in WINDOWS:
+        for metric in METRICS:
+            rows[rolling_column(metric, window)] = (groups[metric].rolling(window, min_periods=1).mean()
+                                                    .reset_index(level=[0, 1], drop=True))
+    return rows
+
+
+def engine_path(matches):
+    return RollingForm(matches, WINDOWS).rows
+
+
+def best_of(func, matches):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = func(matches)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+if __name__ == "__main__":
+    matches = team_match_table().merge(team_match_xg(), on=["Date", "Team"], how="left")
+
+    pandas_time, expected = best_of(pandas_path, matches)
+    engine_time, actual = best_of(engine_path, matches)
+
+    for window in WINDOWS:
+        for metric in METRICS:
+            column = rolling_column(metric, window)
+            assert np.allclose(expected[column], actual[column], rtol=0, atol=1e-9, equal_nan=True), column
+
+    print(f"Rows:           {len(matches):,} x {len(METRICS)} metrics x {len(WINDOWS)} windows")
+    print(f"pandas rolling: {pandas_time * 1000:8.1f} ms")
+    print(f"prefix sums:    {engine_time * 1000:8.1f} ms")
+    print(f"speed-up:       {pandas_time / engine_time:8.1f}x")
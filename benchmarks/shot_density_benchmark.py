@@ -0,0 +1,91 @@
+"""Benchmark: ``sns.kdeplot(levels=100)`` vs ``shot_density`` on the Salah/Firmino grid.
+
+Draws the 2x2 player x venue shot density grid from shots_EPL_1920.csv both
+ways, checks the grid engine against an exact Gaussian KDE evaluated at the
+same cell centres and prints the timings. Run from the repo root:
+
+    python benchmarks/shot_density_benchmark.py
+"""
+import os
+import sys
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+import seaborn as sns  # noqa: E402
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shot_density import density_grid, density_panels, scott_bandwidth  # noqa: E402
+
+KEY_PLAYERS = ["Mohamed Salah", "Roberto Firmino"]
+VENUES = ["Home", "Away"]
+REPEATS = 3
+
+
+def panels_for(shots):
+    return [
+        (f"{player} – {venue} Matches", shots[(shots["player"] == player) & (shots["Venue"] == venue)])
+        for player in KEY_PLAYERS for venue in VENUES
+    ]
+
+
+def seaborn_path(shots):
+    """The 2x2 kdeplot grid the dashboards drew before shot_density."""
+    fig, axes = plt.subplots(2, 2, figsize=(16, 12), sharex=True, sharey=True)
+    for ax, (_, subset) in zip(axes.flat, panels_for(shots)):
+        sns.kdeplot(data=subset, x="X", y="Y", fill=True, thresh=0, levels=100, cmap="Reds", ax=ax)
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def grid_path(shots):
+    fig = density_panels(panels_for(shots), shared_scale=True)
+    fig.to_json()
+
+
+def grids_only(shots):
+    for _, subset in panels_for(shots):
+        density_grid(subset["X"], subset["Y"])
+
+
+def exact_kde(x, y, x_centres, y_centres):
+    """Direct diagonal-bandwidth Gaussian KDE, O(cells x shots)."""
+    bw_x, bw_y = scott_bandwidth(x), scott_bandwidth(y)
+    kx = np.exp(-0.5 * ((x_centres[:, None] - x[None, :]) / bw_x) ** 2)
+    ky = np.exp(-0.5 * ((y_centres[:, None] - y[None, :]) / bw_y) ** 2)
+    return ky @ kx.T / (2 * np.pi * bw_x * bw_y * len(x))
+
+
+def best_of(func, shots):
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(shots)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+if __name__ == "__main__":
+    shots = pd.read_csv("shots_EPL_1920.csv")
+    shots = shots[(shots["h_team"] == "Liverpool") | (shots["a_team"] == "Liverpool")].copy()
+    shots["Venue"] = np.where(shots["h_team"] == "Liverpool", "Home", "Away")
+
+    worst = 0.0
+    for _, subset in panels_for(shots):
+        x, y = subset["X"].to_numpy(), subset["Y"].to_numpy()
+        x_centres, y_centres, grid = density_grid(x, y)
+        exact = exact_kde(x, y, x_centres, y_centres)
+        worst = max(worst, np.abs(grid - exact).max() / exact.max())
+
+    seaborn_time = best_of(seaborn_path, shots)
+    grid_time = best_of(grid_path, shots)
+    grids_time = best_of(grids_only, shots)
+
+    print(f"Shots:           {len(shots):,} (4 panels)")
+    print(f"max grid error:  {worst * 100:8.2f} % of peak density")
+    print(f"sns.kdeplot:     {seaborn_time * 1000:8.1f} ms")
+    print(f"shot_density:    {grid_time * 1000:8.1f} ms  (grids alone {grids_time * 1000:.1f} ms)")
+    print(f"speed-up:        {seaborn_time / grid_time:8.1f}x")
@@ -0,0 +1,107 @@
+"""Benchmark: pandas groupbys vs the same questions as SQL through ``sql_engine``.
+
+Answers three questions both ways, on frames and tables that are already
+loaded, checks the answers agree and prints the timings:
+
+* home win rate by season since 1993, for one team (premier-league-matches.csv)
+* home win rate by season from the football-data results (EPL_Set.csv)
+* goals, shots and win margin per match by season, as in the Attacking tab (epl_final.csv)
+
+Needs duckdb. Run from the repo root:
+
+    python benchmarks/sql_benchmark.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_registry import load_dataset  # noqa: E402
+from sql_engine import HAS_DUCKDB, home_win_rates, sql  # noqa: E402
+
+TEAM = "Liverpool"
+REPEATS = 20
+
+
+def pandas_home_win_rates():
+    df = load_dataset("premier-league-matches.csv")
+    df = df[(df["Season_End_Year"] >= 1993) & (df["Home"] == TEAM)]
+    home_win = (df["HomeGoals"] > df["AwayGoals"]).astype(int)
+    rates = home_win.groupby(df["Season_End_Year"]).agg(["count", "mean"])
+    return rates["count"].to_numpy(), rates["mean"].to_numpy() * 100
+
+
+def sql_home_win_rates():
+    rates = home_win_rates(TEAM)
+    return rates["HomeMatches"].to_numpy(), rates["HomeWinRate"].to_numpy()
+
+
+def pandas_epl_set_rates():
+    df = load_dataset("EPL_Set.csv")
+    rates = (df["FTR"] == "H").groupby(df["Season"], observed=True).mean() * 100
+    return rates.index.astype(str).to_numpy(), rates.to_numpy()
+
+
+def sql_epl_set_rates():
+    rates = sql("""
+        SELECT Season, 100.0 * avg(CASE WHEN FTR = 'H' THEN 1 ELSE 0 END) AS HomeWinRate
+        FROM epl_set GROUP BY Season ORDER BY Season
+    """)
+    return rates["Season"].astype(str).to_numpy(), rates["HomeWinRate"].to_numpy()
+
+
+def pandas_attack_trend():
+    df = load_dataset("epl_final.csv")
+    trend = df.assign(
+        TotalGoals=df["FullTimeHomeGoals"].astype(int) + df["FullTimeAwayGoals"],
+        TotalShots=df["HomeShots"].astype(int) + df["AwayShots"],
+        WinMargin=(df["FullTimeHomeGoals"].astype(int) - df["FullTimeAwayGoals"]).abs(),
+    ).groupby("Season", observed=True)[["TotalGoals", "TotalShots", "WinMargin"]].mean()
+    return trend.to_numpy()
+
+
+def sql_attack_trend():
+    trend = sql("""
+        SELECT Season,
+               avg(FullTimeHomeGoals::INTEGER + FullTimeAwayGoals) AS TotalGoals,
+               avg(HomeShots::INTEGER + AwayShots) AS TotalShots,
+               avg(abs(FullTimeHomeGoals::INTEGER - FullTimeAwayGoals)) AS WinMargin
+        FROM epl_final GROUP BY Season ORDER BY Season
+    """)
+    return trend[["TotalGoals", "TotalShots", "WinMargin"]].to_numpy()
+
+
+def best_of(func):
+    func()  # load and register the data outside the timing
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def _agree(expected, actual):
+    if isinstance(expected, tuple):
+        return all(_agree(e, a) for e, a in zip(expected, actual))
+    if expected.dtype.kind in "OUS":
+        return (expected == actual).all()
+    return np.allclose(expected, actual)
+
+
+if __name__ == "__main__":
+    if not HAS_DUCKDB:
+        sys.exit("duckdb is not installed: pip install duckdb")
+
+    for label, pandas_path, sql_path in [
+        (f"{TEAM} home win rate", pandas_home_win_rates, sql_home_win_rates),
+        ("EPL_Set home win rate", pandas_epl_set_rates, sql_epl_set_rates),
+        ("Attack trend", pandas_attack_trend, sql_attack_trend),
+    ]:
+        pandas_time, expected = best_of(pandas_path)
+        sql_time, actual = best_of(sql_path)
+        assert _agree(expected, actual), label
+        print(f"{label:26s} pandas {pandas_time * 1000:7.2f} ms   "
+              f"sql {sql_time * 1000:7.2f} ms   ({pandas_time / sql_time:4.1f}x)")
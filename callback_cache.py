@@ -0,0 +1,163 @@
+"""Server-side memoization of Dash callback results.
+
+Dash re-runs a callback, and rebuilds its Plotly Express figures, every time
+any session triggers it. ``memoize_callback`` keys each result by the callback
+name, its inputs and a data version and keeps it for ``ttl`` seconds, so the
+same tab requested by many users is built once.
+
+Two backends are provided: ``MemoryCache`` (per process) and ``FileCache``
+(a directory of pickles, shared by every worker process pointed at it). The
+default backend is configured from the environment:
+
+- ``CALLBACK_CACHE_DIR``: use a ``FileCache`` in this directory (default: in memory)
+- ``CALLBACK_CACHE_TTL``: seconds an entry stays valid (default 600)
+- ``CALLBACK_CACHE_MAX_ENTRIES``: entries kept before the oldest are evicted (default 256)
+"""
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+
+class MemoryCache:
+    """In-process LRU of ``key -> (expiry, value)`` holding at most ``max_entries``."""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class FileCache:
+    """Pickled entries in ``directory``, safe to share between worker processes.
+
+    Writes go through a temporary file and ``os.replace``, so readers never see
+    a partial entry. Once more than ``max_entries`` files exist, the least
+    recently written ones are removed.
+    """
+
+    SUFFIX = ".cb.pkl"
+
+    def __init__(self, directory, max_entries=256):
+        self.directory = directory
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def get(self, key):
+        try:
+            with open(self._path(key), "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        if entry[0] < time.time():
+            return None
+        return entry
+
+    def set(self, key, value, ttl):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((time.time() + ttl, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self._path(key))
+        self._prune()
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(self.SUFFIX):
+                path = os.path.join(self.directory, name)
+                try:
+                    entries.append((os.stat(path).st_mtime, path))
+                except OSError:
+                    pass  # removed by another worker
+        return entries
+
+    def _prune(self):
+        entries = self._entries()
+        if len(entries) <= self.max_entries:
+            return
+        for _, path in sorted(entries)[:len(entries) - self.max_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self):
+        for _, path in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def default_backend():
+    """Backend configured by ``CALLBACK_CACHE_DIR`` / ``CALLBACK_CACHE_MAX_ENTRIES``."""
+    max_entries = int(os.environ.get("CALLBACK_CACHE_MAX_ENTRIES", 256))
+    directory = os.environ.get("CALLBACK_CACHE_DIR")
+    if directory:
+        return FileCache(directory, max_entries)
+    return MemoryCache(max_entries)
+
+
+CALLBACK_CACHE = default_backend()
+DEFAULT_TTL = float(os.environ.get("CALLBACK_CACHE_TTL", 600))
+
+
+def callback_key(name, args, kwargs, version=None):
+    """Stable hash of a callback's name, inputs and data version."""
+    payload = repr((name, args, sorted(kwargs.items()), version))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def memoize_callback(ttl=None, version=None, backend=None):
+    """Decorator caching a callback's return value by its arguments.
+
+    ``version`` is a callable returning the current data version (see
+    ``data_registry.dataset_version``); results built from older data are not
+    reused. Arguments must have a stable ``repr`` (strings, numbers, None and
+    containers of them, as Dash passes). The cached value is shared, so the
+    callback must not modify it after returning it.
+    """
+    def decorate(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = backend or CALLBACK_CACHE
+            key = callback_key(name, args, kwargs, version() if version else None)
+            entry = cache.get(key)
+            if entry is not None:
+                return entry[1]
+            value = func(*args, **kwargs)
+            cache.set(key, value, DEFAULT_TTL if ttl is None else ttl)
+            return value
+        return wrapper
+    return decorate
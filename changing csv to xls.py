@@ -34,81 +34,16 @@
   },
   {
    "cell_type": "code",
-   "execution_count": 5,
+   "execution_count": null,
    "id": "b576be4d-8509-46f4-910e-d55a6ad8ab8e",
    "metadata": {},
-   "outputs": [
-    {
-     "data": {
-      "text/plain": [
-       "[None, None, None, None, None, None, None, None, None, None, None, None]"
-      ]
-     },
-     "execution_count": 5,
-     "metadata": {},
-     "output_type": "execute_result"
-    }
-   ],
-   "source": [
-    "import os, pandas as pd\n",
-    "\n",
-    "folder = os.path.expanduser(\"~/Desktop/thesis\")\n",
-    "output = os.path.join(folder, \"converted_xlsx\"); os.makedirs(output, exist_ok=True)\n",
-    "\n",
-    "[ pd.read_csv(os.path.join(folder, f)).to_excel(os.path.join(output, f.replace(\".csv\", \".xlsx\")), index=False)\n",
-    "  for f in os.listdir(folder) if f.endswith(\".csv\") ]\n"
-   ]
-  },
-  {
-   "cell_type": "code",
-   "execution_count": 6,
-   "id": "99cdc0e8-19af-4f25-81fd-e90aaa4553aa",
-   "metadata": {},
-   "outputs": [
-    {
-     "name": "stdout",
-     "output_type": "stream",
-     "text": [
-      "✅ Added EPL_result.xlsx as 'EPL_result'\n",
-      "✅ Added rosters_EPL_1920.xlsx as 'rosters_EPL_1920'\n",
-      "✅ Added stats.xlsx as 'stats'\n",
-      "✅ Added liverpoolfc_managers.xlsx as 'liverpoolfc_managers'\n",
-      "✅ Added match_infos_EPL_1920.xlsx as 'match_infos_EPL_1920'\n",
-      "✅ Added premier-league-matches.xlsx as 'premier-league-matches'\n",
-      "✅ Added shots_EPL_1920.xlsx as 'shots_EPL_1920'\n",
-      "✅ Added Liverpool_Filtered_2015_onwards.xlsx as 'Liverpool_Filtered_2015_onwards'\n",
-      "✅ Added results.xlsx as 'results'\n",
-      "✅ Added epl_final.xlsx as 'epl_final'\n",
-      "✅ Added EPL_Set.xlsx as 'EPL_Set'\n",
-      "✅ Added Liverpool_2015_2023_Matches.xlsx as 'Liverpool_2015_2023_Matches'\n",
-      "\n",
-      "🎉 All files combined into: /Users/sagarchhetri/Desktop/thesis/converted_xlsx/combined_data.xlsx\n"
-     ]
-    }
-   ],
+   "outputs": [],
    "source": [
-    "import os\n",
-    "import pandas as pd\n",
-    "\n",
-    "# 📁 Folder where all .xlsx files are stored\n",
-    "folder_path = os.path.expanduser(\"~/Desktop/thesis/converted_xlsx\")\n",
-    "output_file = os.path.join(folder_path, \"combined_data.xlsx\")\n",
-    "\n",
-    "# 🧾 Create a new Excel writer\n",
-    "with pd.ExcelWriter(output_file, engine='openpyxl') as writer:\n",
-    "    for file in os.listdir(folder_path):\n",
-    "        if file.endswith(\".xlsx\") and file != \"combined_data.xlsx\":\n",
-    "            file_path = os.path.join(folder_path, file)\n",
-    "            try:\n",
-    "                df = pd.read_excel(file_path)\n",
-    "                # Use file name (without extension) as sheet name\n",
-    "                sheet_name = os.path.splitext(file)[0][:31]  # Sheet name max length = 31\n",
-    "                df.to_excel(writer, sheet_name=sheet_name, index=False)\n",
-    "                print(f\"✅ Added {file} as '{sheet_name}'\")\n",
-    "            except Exception as e:\n",
-    "                print(f\"❌ Failed to add {file}: {e}\")\n",
+    "from xlsx_export import export_xlsx\n",
     "\n",
-    "print(f\"\\n🎉 All files combined into: {output_file}\")\n"
+    "# 📁 Converts only new or changed CSVs into converted_xlsx/ and rebuilds combined_data.xlsx\n",
+    "report = export_xlsx()\n",
+    "print(f\"✅ {len(report['converted'])} converted, {len(report['skipped'])} unchanged\")\n"
    ]
   },
   {
@@ -1,25 +1,22 @@
 import dash
-from dash import html, dcc, Input, Output, State
+from dash import html, dcc, Input, Output, State, Patch, ctx, no_update
 import dash_bootstrap_components as dbc
 import plotly.graph_objs as go
 
-# 🚨 Import or load your pre-created Plotly figures here
-# Example: from your_notebook_figures import all_figures
-# all_figures = {
-#     'vs Arsenal': {
-#         'shot_map': ...,
-#         'xg': ...,
-#         'heatmap': ...,
-#         'player_stats': ...,
-#         'tactical': ...
-#     }, ...
-# }
+import os
+import sys
 
-# Dummy placeholder for structure
-all_figures = {}  # <-- REPLACE THIS with your actual dictionary of Plotly figure objects
+# The figure factory lives with the data modules at the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from match_figures import MatchFigureRegistry
 
-# Match options from the keys of your dictionary
-match_options = [{'label': match, 'value': match} for match in all_figures.keys()]
+# 🗂️ Figures per match ('shot_map', 'xg', 'heatmap', 'player_stats', 'tactical'),
+# built the first time a match is opened; only the most recent matches are kept.
+# With CALLBACK_CACHE_DIR set, built matches are shared between worker processes.
+all_figures = MatchFigureRegistry(team="Liverpool")
+
+# Match options from the match index (no figure is built here)
+match_options = all_figures.options()
 
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 app.title = "Liverpool Match Dashboard"
@@ -56,55 +53,95 @@ app.layout = dbc.Container(fluid=True, children=[
 
     html.Div(id="store-wrapper", style={"display": "none"}, children=[
         dcc.Store(id="selected-player"),
-        dcc.Store(id="hovered-region")
+        dcc.Store(id="hovered-region"),
+        # Player highlighted in the figure currently shown by the browser
+        dcc.Store(id="highlighted-player")
     ])
 ])
 
 # ------------- Callbacks ------------- #
 
+TAB_FIGURES = {
+    "tab-shot": "shot_map",
+    "tab-xg": "xg",
+    "tab-heatmap": "heatmap",
+    "tab-player": "player_stats",
+    "tab-tactical": "tactical",
+}
+# Tabs whose figure reflects the selected player
+HIGHLIGHT_TABS = ("tab-shot", "tab-xg")
+
+
+# The cached figures are shared by every session and never modified. The
+# highlight is a set of per-trace property updates: applied to a copy when the
+# tab or match changes, or sent as a Patch touching only the previously and
+# newly highlighted player's traces when the selection changes.
+def shot_highlight_updates(fig, player, highlighted=True):
+    """Yield ``(trace index, marker properties)`` styling ``player``'s shots."""
+    for i, trace in enumerate(fig.data):
+        if player and trace.name == player:
+            if highlighted:
+                yield i, {"color": "gold", "opacity": 1.0, "line": {"color": "black", "width": 2}}
+            else:
+                yield i, {"color": trace.marker.color, "opacity": trace.marker.opacity,
+                          "line": trace.marker.line.to_plotly_json()}
+
+
+def xg_title(fig, selected_player):
+    return f"xG Contribution: {selected_player}" if selected_player else fig.layout.title.text
+
+
+def highlighted_figure(tab, fig, selected_player):
+    """Full figure for ``tab``, with the current highlight applied to a copy."""
+    if not selected_player or tab not in HIGHLIGHT_TABS:
+        return fig
+    fig = go.Figure(fig)
+    if tab == "tab-shot":
+        for i, marker in shot_highlight_updates(fig, selected_player):
+            fig.data[i].marker.update(marker)
+    else:
+        fig.layout.title.text = xg_title(fig, selected_player)
+    return fig
+
+
+def highlight_patch(tab, fig, selected_player, highlighted_player):
+    """Partial update moving the highlight from ``highlighted_player`` to ``selected_player``."""
+    patch = Patch()
+    if tab == "tab-shot":
+        updates = list(shot_highlight_updates(fig, highlighted_player, highlighted=False))
+        updates += shot_highlight_updates(fig, selected_player)
+        for i, marker in updates:
+            patch["data"][i]["marker"].update(marker)
+    else:
+        patch["layout"]["title"]["text"] = xg_title(fig, selected_player)
+    return patch
+
+
 # Main view update based on tab + match + selected player
 @app.callback(
     Output("main-figure", "figure"),
+    Output("highlighted-player", "data"),
     Input("tabs", "active_tab"),
     Input("match-dropdown", "value"),
     Input("selected-player", "data"),
-    Input("hovered-region", "data")
+    Input("hovered-region", "data"),
+    State("highlighted-player", "data")
 )
-def update_view(tab, match, selected_player, hovered_region):
-    if match not in all_figures:
-        return go.Figure()
-
-    figs = all_figures[match]
-
-    if tab == "tab-shot":
-        fig = figs["shot_map"]
-        if selected_player:
-            # Optionally highlight selected player's shots
-            fig.update_traces(
-                selector=dict(name=selected_player),
-                marker=dict(size=12, color="gold", symbol="star")
-            )
-        return fig
-
-    elif tab == "tab-xg":
-        fig = figs["xg"]
-        if selected_player:
-            fig.update_layout(title=f"xG Contribution: {selected_player}")
-        if hovered_region:
-            # Optional: Filter xG by region (not implemented here)
-            pass
-        return fig
-
-    elif tab == "tab-heatmap":
-        return figs["heatmap"]
+def update_view(tab, match, selected_player, hovered_region, highlighted_player):
+    if match not in all_figures or tab not in TAB_FIGURES:
+        return go.Figure(), None
 
-    elif tab == "tab-player":
-        return figs["player_stats"]
+    highlight = selected_player if tab in HIGHLIGHT_TABS else None
 
-    elif tab == "tab-tactical":
-        return figs["tactical"]
+    if ctx.triggered_id in ("selected-player", "hovered-region"):
+        # Same tab and match: only the highlight can change
+        if tab in HIGHLIGHT_TABS and selected_player != highlighted_player:
+            fig = all_figures[match][TAB_FIGURES[tab]]
+            return highlight_patch(tab, fig, selected_player, highlighted_player), highlight
+        # Optional: Filter xG by hovered region (not implemented here)
+        return no_update, no_update
 
-    return go.Figure()
+    return highlighted_figure(tab, all_figures[match][TAB_FIGURES[tab]], selected_player), highlight
 
 # Capture selected player from Player Stats figure
 @app.callback(
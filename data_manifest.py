@@ -0,0 +1,137 @@
+"""Content-hash manifest of the input datasets and the version tokens derived from it.
+
+Every cache layer (``data_registry`` frames and derived tables, the figure and
+callback caches, ``export_figures``) keys on ``dataset_token(path)``: the first
+16 hex digits of the file's SHA-256. A file is only re-hashed when its size or
+modification time changes, so a token costs one ``os.stat`` per call, and
+touching a file without changing it invalidates nothing.
+
+The manifest records the hash, row count, schema, size and mtime of each file
+and is persisted to ``.data_manifest.json`` so other processes can reuse the
+hashes. Run ``python data_manifest.py`` to refresh it for every CSV and XLSX
+file in the repo and print it.
+"""
+import glob
+import json
+import os
+import threading
+
+from data_mirror import REPO_DIR, file_digest, read_mirrored, read_options
+
+MANIFEST_PATH = os.path.join(REPO_DIR, ".data_manifest.json")
+TOKEN_LENGTH = 16
+
+# absolute path -> manifest entry
+_ENTRIES = {}
+_LOADED = False
+_LOCK = threading.Lock()
+
+
+def _load_persisted():
+    global _LOADED
+    try:
+        with open(MANIFEST_PATH) as f:
+            persisted = json.load(f)
+    except (OSError, ValueError):
+        persisted = {}
+    for name, entry in persisted.items():
+        _ENTRIES.setdefault(os.path.join(REPO_DIR, name), entry)
+    _LOADED = True
+
+
+def _save_persisted():
+    # Only files inside the repo are persisted, by relative name
+    persisted = {
+        os.path.relpath(path, REPO_DIR): entry for path, entry in _ENTRIES.items()
+        if os.path.commonpath([path, REPO_DIR]) == REPO_DIR
+    }
+    tmp = f"{MANIFEST_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w") as f:
+            json.dump(persisted, f, indent=1, sort_keys=True)
+        os.replace(tmp, MANIFEST_PATH)
+    except OSError:
+        pass  # read-only checkout: the in-process manifest still works
+
+
+def _describe(path):
+    """Row count and ``{column: dtype}`` (per sheet for workbooks) of ``path``."""
+    if path.endswith(".csv"):
+        df, _ = read_mirrored(path, **read_options(path))
+        return len(df), {str(column): str(dtype) for column, dtype in df.dtypes.items()}
+    if path.endswith(".xlsx"):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(path, read_only=True)
+        try:
+            sheets = {}
+            for sheet in workbook.worksheets:
+                header = next(sheet.iter_rows(max_row=1, values_only=True), ())
+                sheets[sheet.title] = {
+                    "rows": max(0, (sheet.max_row or 0) - 1),
+                    "columns": [str(value) for value in header],
+                }
+        finally:
+            workbook.close()
+        return sum(sheet["rows"] for sheet in sheets.values()), sheets
+    return None, None
+
+
+def manifest_entry(path):
+    """Return ``{"sha256", "token", "rows", "schema", "size", "mtime_ns", "read_options"}`` for ``path``.
+
+    The file is hashed and described only if it is new, its size or mtime
+    changed since the entry was recorded, or it was described with other
+    read options (``data_mirror.READ_OPTIONS``).
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    options = read_options(path)
+    with _LOCK:
+        if not _LOADED:
+            _load_persisted()
+        entry = _ENTRIES.get(path)
+    if entry is not None and entry.get("read_options", {}) != options:
+        entry = None
+    if entry is not None and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+        return entry
+
+    digest = file_digest(path)
+    if entry is not None and entry["sha256"] == digest:
+        # Touched but unchanged: keep the description, refresh the stat
+        entry = {**entry, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    else:
+        rows, schema = _describe(path)
+        entry = {
+            "sha256": digest,
+            "token": digest[:TOKEN_LENGTH],
+            "rows": rows,
+            "schema": schema,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "read_options": options,
+        }
+    with _LOCK:
+        _ENTRIES[path] = entry
+        _save_persisted()
+    return entry
+
+
+def dataset_token(path):
+    """Short content hash of ``path``; changes only when the file's bytes change."""
+    return manifest_entry(path)["token"]
+
+
+def data_manifest(paths=None):
+    """Return ``{file name: entry}`` for ``paths`` (default: every CSV/XLSX in the repo)."""
+    if paths is None:
+        paths = sorted(glob.glob(os.path.join(REPO_DIR, "*.csv"))
+                       + glob.glob(os.path.join(REPO_DIR, "converted_xlsx", "*.xlsx")))
+    return {os.path.relpath(os.path.abspath(path), REPO_DIR): manifest_entry(path) for path in paths}
+
+
+if __name__ == "__main__":
+    for name, entry in data_manifest().items():
+        columns = len(entry["schema"]) if entry["schema"] is not None else "?"
+        print(f"{entry['token']}  {str(entry['rows']):>6} rows  {columns:>3} cols/sheets  {name}")
+    print(f"\n📄 Manifest written to {MANIFEST_PATH}")
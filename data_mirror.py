@@ -0,0 +1,105 @@
+"""Columnar Parquet mirror of the CSV datasets.
+
+Parsing CSV text is the slowest part of a cold start. ``read_mirrored`` keeps a
+typed Parquet copy of each CSV under ``.data_mirror/`` and reads that instead.
+A mirror is rebuilt only when the SHA-256 of its source file changes, so edits
+to a CSV are picked up without any manual step.
+
+Run ``python data_mirror.py`` to (re)build the mirror for every CSV in the repo.
+Without ``pyarrow`` installed everything falls back to ``pd.read_csv``.
+"""
+import glob
+import hashlib
+import importlib.util
+import os
+import sys
+
+import pandas as pd
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+MIRROR_DIR = os.path.join(REPO_DIR, ".data_mirror")
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# file name -> ``pd.read_csv`` options every reader of that file needs
+READ_OPTIONS = {
+    "liverpoolfc_managers.csv": {"sep": ";"},
+}
+
+
+def read_options(path):
+    """Return the ``pd.read_csv`` options of the dataset at ``path`` (a copy)."""
+    return dict(READ_OPTIONS.get(os.path.basename(path), {}))
+
+
+def file_digest(path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def mirror_path(path, read_kwargs=None):
+    """Return the Parquet file that mirrors ``path`` read with ``read_kwargs``."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    if read_kwargs:
+        options = hashlib.sha256(repr(sorted(read_kwargs.items())).encode()).hexdigest()[:8]
+        stem = f"{stem}-{options}"
+    return os.path.join(MIRROR_DIR, stem + ".parquet")
+
+
+def _stored_digest(target):
+    try:
+        with open(target + ".sha256") as fh:
+            return fh.read().strip()
+    except OSError:
+        return None
+
+
+def _write_mirror(df, target, digest):
+    os.makedirs(MIRROR_DIR, exist_ok=True)
+    tmp = target + ".tmp"
+    df.to_parquet(tmp, index=False)
+    os.replace(tmp, target)
+    with open(target + ".sha256", "w") as fh:
+        fh.write(digest)
+
+
+def read_mirrored(path, **read_kwargs):
+    """Read ``path`` like ``pd.read_csv`` but through its Parquet mirror.
+
+    Returns ``(frame, rebuilt)`` where ``rebuilt`` tells whether the CSV had to
+    be parsed because the mirror was missing or stale.
+    """
+    if not HAS_PYARROW:
+        return pd.read_csv(path, **read_kwargs), True
+
+    target = mirror_path(path, read_kwargs)
+    digest = file_digest(path)
+    if os.path.exists(target) and _stored_digest(target) == digest:
+        return pd.read_parquet(target), False
+
+    df = pd.read_csv(path, **read_kwargs)
+    try:
+        _write_mirror(df, target, digest)
+    except (OSError, ValueError, TypeError) as e:
+        # Mixed-type columns pyarrow cannot store: keep serving the CSV
+        print(f"⚠️ Could not mirror {os.path.basename(path)}: {e}", file=sys.stderr)
+    return df, True
+
+
+def build_mirrors(folder=REPO_DIR):
+    """Mirror every CSV in ``folder``, rebuilding only those whose contents changed."""
+    results = {}
+    for path in sorted(glob.glob(os.path.join(folder, "*.csv"))):
+        _, rebuilt = read_mirrored(path, **read_options(path))
+        results[os.path.basename(path)] = rebuilt
+    return results
+
+
+if __name__ == "__main__":
+    if not HAS_PYARROW:
+        sys.exit("❌ pyarrow is not installed; the Parquet mirror is disabled.")
+    for name, rebuilt in build_mirrors().items():
+        print(f"{'🔄 Rebuilt' if rebuilt else '✅ Up to date'}: {name}")
@@ -0,0 +1,90 @@
+"""Process-wide registry of the CSV datasets used by the dashboards.
+
+The tab bodies used to call ``pd.read_csv`` on every Streamlit rerun of every
+session. ``load_dataset`` parses each file once per process, keyed by path and
+content token (see ``data_manifest``), and hands every caller the same
+underlying frame. Files are read through the Parquet mirror in
+``data_mirror``, their team-name columns are canonicalised once, at ingest
+(see ``teams``), and the large datasets are stored with compact dtypes (see
+``data_schema``).
+"""
+import os
+import threading
+
+import pandas as pd
+
+from data_manifest import dataset_token
+from data_mirror import read_mirrored
+from data_schema import apply_schema
+from teams import canonicalize_teams
+
+# (absolute path, read kwargs) -> (dataset token, DataFrame)
+_FRAMES = {}
+# table name -> (source tokens, table)
+_DERIVED = {}
+_LOCK = threading.Lock()
+
+
+def _cache_key(path, read_kwargs):
+    return os.path.abspath(path), repr(sorted(read_kwargs.items()))
+
+
+def _copy_on_write():
+    """Whether a shallow copy is safe to modify (always with pandas 3, opt-in with pandas 2)."""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.options.mode.copy_on_write is True
+
+
+def load_dataset(path, **read_kwargs):
+    """Return the shared frame for ``path``, re-reading it only when the file changes.
+
+    ``read_kwargs`` are passed to ``pd.read_csv`` and are part of the cache key.
+    Under copy-on-write the result is a shallow copy that callers may modify
+    freely; otherwise it is a deep copy, so in-place edits never reach the
+    shared frame.
+    """
+    key = _cache_key(path, read_kwargs)
+    token = dataset_token(path)
+    with _LOCK:
+        entry = _FRAMES.get(key)
+        if entry is None or entry[0] != token:
+            frame = canonicalize_teams(read_mirrored(path, **read_kwargs)[0])
+            entry = (token, apply_schema(frame, path))
+            _FRAMES[key] = entry
+    return entry[1].copy(deep=not _copy_on_write())
+
+
+def dataset_version(*paths):
+    """Return a token that changes whenever the contents of one of the ``paths`` change."""
+    return "-".join(dataset_token(path) for path in paths)
+
+
+def derived_table(name, sources, builder):
+    """Return ``builder()``, rebuilt only when one of the ``sources`` files changes.
+
+    Used for tables computed from several datasets (e.g. the team-match long
+    table) so they are materialised once per process like the raw frames.
+    """
+    version = tuple(dataset_token(path) for path in sources)
+    with _LOCK:
+        entry = _DERIVED.get(name)
+    if entry is None or entry[0] != version:
+        # Built outside the lock: builders call load_dataset themselves
+        entry = (version, builder())
+        with _LOCK:
+            _DERIVED[name] = entry
+    return entry[1]
+
+
+def clear_datasets():
+    """Drop every cached frame, forcing the next ``load_dataset`` call to re-read."""
+    with _LOCK:
+        _FRAMES.clear()
+        _DERIVED.clear()
+
+
+def loaded_datasets():
+    """Return ``{path: rows}`` for the frames currently held by the registry."""
+    with _LOCK:
+        return {key[0]: len(frame) for key, (_, frame) in _FRAMES.items()}
@@ -0,0 +1,112 @@
+"""Compact column dtypes for the large match and shot datasets.
+
+``pd.read_csv`` stores every text column as Python strings and every number
+as 64 bits. Team, player and result columns repeat a handful of values
+thousands of times, and goals, cards and gameweeks fit in a byte, so
+``apply_schema`` stores them as categoricals, small ints and ``float32``.
+``data_registry.load_dataset`` applies it at ingest, which shrinks every frame
+the dashboards hold. The Parquet mirror keeps the raw dtypes.
+
+Run ``python data_schema.py`` for a before/after memory report.
+
+Groupbys keyed on a categorical column should pass ``observed=True``:
+pandas 2 otherwise returns a row for every category, including teams and
+players that were filtered out.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_mirror import REPO_DIR, read_mirrored
+
+CATEGORY = "category"
+
+# file name -> {column: dtype}
+SCHEMAS = {
+    "shots_EPL_1920.csv": {
+        **dict.fromkeys(
+            ["h_team", "a_team", "h_a", "player", "player_assisted",
+             "shotType", "situation", "result", "lastAction"], CATEGORY),
+        **dict.fromkeys(["h_goals", "a_goals", "minute"], "int8"),
+        "season": "int16",
+        **dict.fromkeys(["X", "Y", "xG"], "float32"),
+    },
+    "rosters_EPL_1920.csv": {
+        **dict.fromkeys(["h_a", "player", "position"], CATEGORY),
+        **dict.fromkeys(
+            ["goals", "own_goals", "assists", "red_card", "yellow_card",
+             "shots", "key_passes", "positionOrder"], "int8"),
+        "time": "int16",
+        **dict.fromkeys(["xA", "xG", "xGBuildup", "xGChain"], "float32"),
+    },
+    "epl_final.csv": {
+        **dict.fromkeys(
+            ["Season", "HomeTeam", "AwayTeam", "FullTimeResult", "HalfTimeResult"], CATEGORY),
+        **dict.fromkeys(
+            ["FullTimeHomeGoals", "FullTimeAwayGoals", "HalfTimeHomeGoals", "HalfTimeAwayGoals",
+             "HomeShotsOnTarget", "AwayShotsOnTarget", "HomeCorners", "AwayCorners",
+             "HomeFouls", "AwayFouls", "HomeYellowCards", "AwayYellowCards",
+             "HomeRedCards", "AwayRedCards", "HomeShots", "AwayShots"], "int8"),
+    },
+    "EPL_Set.csv": {
+        **dict.fromkeys(["Div", "HomeTeam", "AwayTeam", "FTR", "HTR", "Season"], CATEGORY),
+        **dict.fromkeys(["FTHG", "FTAG", "HTHG", "HTAG"], "int8"),
+    },
+    "premier-league-matches.csv": {
+        **dict.fromkeys(["Home", "Away", "FTR"], CATEGORY),
+        **dict.fromkeys(["HomeGoals", "AwayGoals", "Wk"], "int8"),
+        "Season_End_Year": "int16",
+    },
+}
+
+
+def _compact(series, dtype):
+    if dtype == CATEGORY:
+        return series.astype(CATEGORY)
+    if np.issubdtype(np.dtype(dtype), np.integer):
+        info = np.iinfo(dtype)
+        if series.isna().any():
+            # Keep missing values as NaN rather than a nullable integer type
+            return series.astype("float32")
+        if series.min() < info.min or series.max() > info.max:
+            return series
+    return series.astype(dtype)
+
+
+def apply_schema(df, name):
+    """Convert the columns of ``df`` listed in ``SCHEMAS[name]``, in place.
+
+    Columns that are absent are skipped, and integers that would overflow the
+    target type keep their original dtype, so a file with extra rows or columns
+    still loads.
+    """
+    for column, dtype in SCHEMAS.get(os.path.basename(name), {}).items():
+        if column in df.columns:
+            df[column] = _compact(df[column], dtype)
+    return df
+
+
+def memory_report(names=None):
+    """Return deep memory use of each schema'd dataset before and after ``apply_schema``."""
+    rows = []
+    for name in names or SCHEMAS:
+        raw, _ = read_mirrored(os.path.join(REPO_DIR, name))
+        before = raw.memory_usage(deep=True).sum()
+        after = apply_schema(raw.copy(), name).memory_usage(deep=True).sum()
+        rows.append({
+            "Dataset": name,
+            "Rows": len(raw),
+            "BeforeMB": before / 2 ** 20,
+            "AfterMB": after / 2 ** 20,
+            "Saved%": 100 * (1 - after / before),
+        })
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    report = memory_report()
+    print(report.to_string(index=False, float_format="{:.2f}".format))
+    total_before, total_after = report["BeforeMB"].sum(), report["AfterMB"].sum()
+    print(f"\nTotal: {total_before:.2f} MB -> {total_after:.2f} MB "
+          f"({100 * (1 - total_after / total_before):.0f}% saved)")
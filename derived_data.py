@@ -0,0 +1,348 @@
+"""Build graph of the derived CSVs read by the Tableau workbooks (Book1/Book2).
+
+    python derived_data.py                # rebuild outputs whose inputs changed
+    python derived_data.py --force        # rebuild everything
+    python derived_data.py --list         # show the graph
+
+Each derived file is declared with ``@derived_csv(output, sources)``; a source
+is a raw dataset or another derived file, which makes the declarations a
+dependency graph. An output is rebuilt when it is missing or when the content
+hash of one of its sources or the code of its builder changed since the last
+build (recorded in ``.derived_builds.json``). Targets whose sources are
+ready build in parallel in a process pool, and every build is timed.
+
+The workbooks colour and filter by the team spellings of the files they were
+made from, so builders write the raw spellings of their source (not the
+canonical names ``load_dataset`` returns), and a build that would respell a
+team already named in an existing output fails instead of overwriting it.
+"""
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+import pandas as pd
+
+from data_manifest import manifest_entry
+from data_mirror import REPO_DIR, read_mirrored
+from data_registry import load_dataset
+from halftime_cube import halftime_cube
+from match_enrichment import enrich_matches
+from teams import canonical_team, team_abbreviation
+from xg_table import gameweek_xg_table
+
+BUILD_MANIFEST = os.path.join(REPO_DIR, ".derived_builds.json")
+
+# The xG tables are taken after this gameweek, as in the thesis figures
+XG_GAMEWEEK = 7
+
+# output file name -> DerivedCSV
+DERIVED_CSVS = {}
+
+
+class DerivedCSV:
+    """A node of the build graph: ``build()`` returns the frame written to ``output``."""
+
+    def __init__(self, output, build, sources, team_columns=()):
+        self.output = output
+        self.build = build
+        self.sources = list(sources)
+        self.team_columns = list(team_columns)
+        self.path = os.path.join(REPO_DIR, output)
+        self.recipe = hashlib.sha256(inspect.getsource(build).encode()).hexdigest()
+
+    def dependencies(self):
+        """The sources that are themselves derived files."""
+        return [source for source in self.sources if source in DERIVED_CSVS]
+
+
+def derived_csv(output, sources, team_columns=()):
+    """Register the decorated builder as the recipe for ``output`` (a repo file name).
+
+    ``team_columns`` name the output columns holding team names, whose
+    spellings a rebuild must keep.
+    """
+    def register(build):
+        if output in DERIVED_CSVS:
+            raise ValueError(f"Duplicate derived CSV: {output}")
+        DERIVED_CSVS[output] = DerivedCSV(output, build, sources, team_columns)
+        return build
+    return register
+
+
+def _path(name):
+    return os.path.join(REPO_DIR, name)
+
+
+def _source_spellings(name, columns=("HomeTeam", "AwayTeam")):
+    """``{canonical name: spelling in the raw file}`` for the team columns of a source CSV."""
+    raw, _ = read_mirrored(_path(name))
+    return {canonical_team(team): team for team in pd.unique(raw[list(columns)].to_numpy().ravel())}
+
+
+def _liverpool_matches(df):
+    return df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
+
+
+def _conversion(summary, label):
+    """Rows of a ``HalftimeCube.summary`` with at least one lead, in the CSV layout."""
+    summary = summary[summary["Leads"] > 0]
+    return summary.rename(columns={summary.columns[0]: label, "LeadsHeld": "sum", "Leads": "count"})[
+        [label, "sum", "count", "ConversionRate"]
+    ]
+
+
+@derived_csv("halftime_conversion.csv", ["epl_final.csv"], team_columns=["LeadingTeam"])
+def halftime_conversion():
+    conversion = _conversion(halftime_cube(_path("epl_final.csv")).summary("team"), "LeadingTeam")
+    conversion["LeadingTeam"] = conversion["LeadingTeam"].map(_source_spellings("epl_final.csv"))
+    return conversion.sort_values("LeadingTeam", kind="stable")
+
+
+@derived_csv("liverpool_season_conversion.csv", ["epl_final.csv"])
+def liverpool_season_conversion():
+    cube = halftime_cube(_path("epl_final.csv"))
+    return _conversion(cube.summary("season", team="Liverpool"), "Season")
+
+
+@derived_csv("league_attack_trend.csv", ["epl_final.csv"])
+def league_attack_trend():
+    # Despite the name this has always been Liverpool's matches (plot 28)
+    df = _liverpool_matches(load_dataset(_path("epl_final.csv")))
+    df["TotalGoals"] = df["FullTimeHomeGoals"].astype(int) + df["FullTimeAwayGoals"]
+    df["TotalShots"] = df["HomeShots"].astype(int) + df["AwayShots"]
+    trend = df.groupby("Season", observed=True)[["TotalGoals", "TotalShots"]].mean()
+    trend["ShotConversion"] = (trend["TotalGoals"] / trend["TotalShots"]) * 100
+    return trend.reset_index()
+
+
+@derived_csv("liverpool_physicality_by_result.csv", ["epl_final.csv"])
+def liverpool_physicality_by_result():
+    df = enrich_matches(load_dataset(_path("epl_final.csv")))
+    for metric, (home, away) in {
+        "Fouls": ("HomeFouls", "AwayFouls"),
+        "YellowCards": ("HomeYellowCards", "AwayYellowCards"),
+        "RedCards": ("HomeRedCards", "AwayRedCards"),
+    }.items():
+        df[metric] = df[home].astype(int) + df[away]
+    return df.melt(id_vars=["Season", "Venue", "Result"], value_vars=["Fouls", "YellowCards", "RedCards"],
+                   var_name="Metric", value_name="Value")
+
+
+@derived_csv("liverpool_red_card_outcomes.csv", ["epl_final.csv"])
+def liverpool_red_card_outcomes():
+    df = enrich_matches(load_dataset(_path("epl_final.csv")))
+    home = (df["Venue"] == "Home").to_numpy()
+    df["LFC_RedCardVenue"] = np.select(
+        [home & (df["HomeRedCards"] > 0), ~home & (df["AwayRedCards"] > 0)], ["Home", "Away"], None
+    )
+    reds = df[df["LFC_RedCardVenue"].notna()]
+    return reds[["Season", "LFC_RedCardVenue", "Result"]].rename(columns={"Result": "LiverpoolResult"})
+
+
+def _venue_counts(flags):
+    """Sum home/away boolean result flags per team (``{column: (team column, mask)}``)."""
+    df = load_dataset(_path("epl_final.csv"))
+    counts = [
+        df.assign(**{column: mask(df)}).groupby(team, observed=True)[[column]].sum()
+        for column, (team, mask) in flags.items()
+    ]
+    counts = pd.concat(counts, axis=1).fillna(0)
+    counts.index = counts.index.map(_source_spellings("epl_final.csv"))
+    return counts.sort_index(kind="stable")
+
+
+@derived_csv("team_performance.csv", ["epl_final.csv"], team_columns=["index"])
+def team_performance():
+    performance = _venue_counts({
+        "HomeWins": ("HomeTeam", lambda df: df["FullTimeResult"] == "H"),
+        "HomeDraws": ("HomeTeam", lambda df: df["FullTimeResult"] == "D"),
+        "AwayWins": ("AwayTeam", lambda df: df["FullTimeResult"] == "A"),
+        "AwayDraws": ("AwayTeam", lambda df: df["FullTimeResult"] == "D"),
+    })
+    # The workbooks read the doubly reset index as "level_0" and "index"
+    return performance.reset_index(names="index").reset_index(names="level_0")
+
+
+@derived_csv("team_losses.csv", ["epl_final.csv"], team_columns=["index"])
+def team_losses():
+    losses = _venue_counts({
+        "HomeLoss": ("HomeTeam", lambda df: df["FullTimeResult"] == "A"),
+        "AwayLoss": ("AwayTeam", lambda df: df["FullTimeResult"] == "H"),
+    })
+    return losses.reset_index(names="index")
+
+
+@derived_csv("team_xG_stats.csv", ["EPL_result.csv"], team_columns=["Team"])
+def team_xg_stats():
+    df = gameweek_xg_table(_path("EPL_result.csv")).table(XG_GAMEWEEK)
+    df["Team"] = df["Team"].map(team_abbreviation)
+    df = df.sort_values("xG_h", ascending=False, kind="stable")
+    return df[["Team", "xGpm", "xGApm"]]
+
+
+@derived_csv("grouped_xg_xga.csv", ["team_xG_stats.csv"], team_columns=["Team"])
+def grouped_xg_xga():
+    # Read raw (load_dataset would expand the abbreviations to team names) and
+    # without rounding, so the values match team_xG_stats exactly
+    df, _ = read_mirrored(_path("team_xG_stats.csv"), float_precision="round_trip")
+    return df.melt(id_vars="Team", var_name="Metric", value_name="PerMatch")
+
+
+@derived_csv("top_liverpool_assists.csv", ["shots_EPL_1920.csv"])
+def top_liverpool_assists():
+    # Shots set up by each Liverpool player in 2019-20 (key passes, not only goals)
+    shots = load_dataset(_path("shots_EPL_1920.csv"))
+    home = shots["h_a"] == "h"
+    liverpool = (home & (shots["h_team"] == "Liverpool")) | (~home & (shots["a_team"] == "Liverpool"))
+    assists = shots.loc[liverpool, "player_assisted"].astype(str)
+    top = assists[shots.loc[liverpool, "player_assisted"].notna()].value_counts().head(10)
+    return top.rename_axis("Player").reset_index(name="Assists")
+
+
+def build_order(names=None):
+    """Topological order of ``names`` (default: every target) and their derived sources."""
+    order, visiting = [], set()
+
+    def visit(name):
+        if name in order:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle through {name}")
+        visiting.add(name)
+        for dependency in DERIVED_CSVS[name].dependencies():
+            visit(dependency)
+        visiting.discard(name)
+        order.append(name)
+
+    for name in names or DERIVED_CSVS:
+        visit(name)
+    return order
+
+
+def _fingerprint(target):
+    digest = hashlib.sha256(target.recipe.encode())
+    for source in target.sources:
+        digest.update(manifest_entry(_path(source))["sha256"].encode())
+    return digest.hexdigest()
+
+
+def _load_builds():
+    try:
+        with open(BUILD_MANIFEST) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_builds(builds):
+    with open(BUILD_MANIFEST + ".tmp", "w") as f:
+        json.dump(builds, f, indent=1, sort_keys=True)
+    os.replace(BUILD_MANIFEST + ".tmp", BUILD_MANIFEST)
+
+
+def _check_team_spellings(target, df):
+    """Refuse to overwrite ``target`` with a new spelling of a team it already names."""
+    if not target.team_columns or not os.path.exists(target.path):
+        return
+    existing = pd.read_csv(target.path, usecols=target.team_columns, dtype=str)
+    for column in target.team_columns:
+        known = {canonical_team(team): team for team in existing[column].dropna()}
+        respelled = sorted({
+            f"{known[canonical_team(team)]!r} -> {team!r}" for team in df[column].dropna().astype(str)
+            if known.get(canonical_team(team), team) != team
+        })
+        if respelled:
+            raise ValueError(f"rebuild would respell {column}: {', '.join(respelled)}")
+
+
+def _build(name):
+    """Worker: build one target, check it, write it atomically and return the build time."""
+    target = DERIVED_CSVS[name]
+    start = time.perf_counter()
+    df = target.build()
+    _check_team_spellings(target, df)
+    df.to_csv(target.path + ".tmp", index=False)
+    os.replace(target.path + ".tmp", target.path)
+    return time.perf_counter() - start
+
+
+def build_derived(names=None, force=False, jobs=None):
+    """Rebuild the stale targets of ``names`` (and of the derived files they read).
+
+    A target is built once all of its derived sources are up to date, so its
+    fingerprint is taken from their new contents. Returns ``{"built": {name:
+    seconds}, "skipped": [...], "failed": {name: error}}``; targets downstream
+    of a failure are reported as failed too.
+    """
+    order = build_order(names)
+    builds = _load_builds()
+    report = {"built": {}, "skipped": [], "failed": {}}
+    pending = list(order)
+    running = {}
+    jobs = max(1, jobs or os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for name in list(pending):
+                dependencies = DERIVED_CSVS[name].dependencies()
+                if any(dep in report["failed"] for dep in dependencies):
+                    pending.remove(name)
+                    report["failed"][name] = "a source failed to build"
+                elif any(dep in pending or dep in running.values() for dep in dependencies):
+                    continue
+                else:
+                    pending.remove(name)
+                    target = DERIVED_CSVS[name]
+                    fingerprint = _fingerprint(target)
+                    if not force and builds.get(name) == fingerprint and os.path.exists(target.path):
+                        report["skipped"].append(name)
+                    else:
+                        running[pool.submit(_build, name)] = name
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    report["built"][name] = future.result()
+                except Exception as e:
+                    report["failed"][name] = str(e)
+                    continue
+                builds[name] = _fingerprint(DERIVED_CSVS[name])
+    _save_builds(builds)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if nothing changed")
+    parser.add_argument("--only", default=None, help="only targets whose file name contains this text")
+    parser.add_argument("--list", action="store_true", help="list the targets and their sources and exit")
+    args = parser.parse_args(argv)
+
+    names = [name for name in DERIVED_CSVS if args.only is None or args.only.lower() in name.lower()]
+    if args.list:
+        for name in build_order(names):
+            print(f"{name}  <- {', '.join(DERIVED_CSVS[name].sources)}")
+        return 0
+
+    start = time.perf_counter()
+    report = build_derived(names, force=args.force, jobs=args.jobs)
+    for name, seconds in sorted(report["built"].items(), key=lambda item: -item[1]):
+        print(f"🔨 {name}  {seconds:.2f}s")
+    for name, error in sorted(report["failed"].items()):
+        print(f"❌ {name}: {error}")
+    print(f"✅ {len(report['built'])} built, {len(report['skipped'])} up to date, "
+          f"{len(report['failed'])} failed in {time.perf_counter() - start:.1f}s")
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""Era labels for dates from named, sorted boundary sets.
+
+The dashboards labelled COVID periods with a row-wise ``apply`` that parsed
+the boundary strings again for every row, and not all of them used the same
+boundaries. An ``EraScheme`` is a sorted list of boundary dates and the label
+of each era between them, registered by name in ``ERA_SCHEMES``.
+``era_labels`` labels a whole date column with one ``searchsorted`` and
+returns an ordered categorical in era order. ``label_eras`` labels several
+schemes in the same pass, over the merged boundaries.
+
+A date equal to a boundary belongs to the era that starts there.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_mirror import REPO_DIR
+from data_registry import derived_table, load_dataset
+
+# scheme name -> EraScheme
+ERA_SCHEMES = {}
+
+_NAT = np.iinfo(np.int64).min
+
+
+class EraScheme:
+    """``len(boundaries) + 1`` labelled eras split at sorted ``boundaries``.
+
+    A label of ``None`` leaves that era unlabelled (e.g. before the first
+    manager). Labels may repeat; each distinct label is one category, in the
+    order of first appearance.
+    """
+
+    def __init__(self, name, boundaries, labels):
+        self.name = name
+        self.boundaries = pd.DatetimeIndex(pd.to_datetime(list(boundaries))).as_unit("ns")
+        self.labels = list(labels)
+        if len(self.labels) != len(self.boundaries) + 1:
+            raise ValueError(f"{name}: {len(self.boundaries)} boundaries need {len(self.boundaries) + 1} labels")
+        if not self.boundaries.is_monotonic_increasing or not self.boundaries.is_unique:
+            raise ValueError(f"{name}: boundaries must be strictly increasing")
+        self.categories = list(dict.fromkeys(label for label in self.labels if label is not None))
+        self._codes = np.array([-1 if label is None else self.categories.index(label) for label in self.labels])
+
+    def __repr__(self):
+        return f"EraScheme({self.name!r}, {len(self.labels)} eras)"
+
+
+def register_era_scheme(name, boundaries, labels):
+    """Create an ``EraScheme`` and make it available by ``name``."""
+    ERA_SCHEMES[name] = EraScheme(name, boundaries, labels)
+    return ERA_SCHEMES[name]
+
+
+# Final dashboard: WHO pandemic declaration, end of major restrictions in England
+register_era_scheme("covid", ["2020-03-11", "2021-08-01"], ["Pre-COVID", "During COVID", "Post-COVID"])
+# Streamlit apps and thesis figures: the suspended 2019-20 run-in to the end of 2020-21
+register_era_scheme("covid_seasons", ["2020-03-01", "2021-07-01"], ["Pre-COVID", "During COVID", "Post-COVID"])
+
+
+def _scheme(scheme):
+    return ERA_SCHEMES[scheme] if isinstance(scheme, str) else scheme
+
+
+def _as_ns(dates):
+    return pd.DatetimeIndex(pd.to_datetime(dates)).as_unit("ns").asi8
+
+
+def era_codes(dates, schemes):
+    """Category codes (``-1`` for none) of ``dates`` in each scheme, shape ``(len(dates), len(schemes))``.
+
+    All schemes share one ``searchsorted`` over the union of their boundaries.
+    """
+    schemes = [_scheme(scheme) for scheme in schemes]
+    values = _as_ns(dates)
+    edges = np.unique(np.concatenate([scheme.boundaries.asi8 for scheme in schemes]))
+    bins = np.searchsorted(edges, values, side="right")
+    missing = values == _NAT
+    codes = np.empty((len(values), len(schemes)), dtype=np.int64)
+    for i, scheme in enumerate(schemes):
+        # Era of each merged bin: how many of this scheme's boundaries lie at or before its start
+        eras = np.concatenate([[0], np.searchsorted(scheme.boundaries.asi8, edges, side="right")])
+        codes[:, i] = scheme._codes[eras[bins]]
+        codes[missing, i] = -1
+    return codes
+
+
+def _categorical(codes, scheme, unknown, missing):
+    categories = scheme.categories
+    if unknown is not None:
+        codes = np.where(missing, len(categories), codes)
+        categories = categories + [unknown]
+    return pd.Categorical.from_codes(codes, categories=categories, ordered=True)
+
+
+def era_labels(dates, scheme="covid", unknown=None):
+    """Label each date with its era in ``scheme`` (a name or an ``EraScheme``).
+
+    Returns an ordered ``pd.Categorical``. Missing dates are NaN, or
+    ``unknown`` when given (added as the last category).
+    """
+    scheme = _scheme(scheme)
+    missing = pd.isna(pd.to_datetime(dates)) if unknown is not None else None
+    return _categorical(era_codes(dates, [scheme])[:, 0], scheme, unknown, np.asarray(missing))
+
+
+def label_eras(dates, schemes=("covid", "covid_seasons"), unknown=None):
+    """One categorical column per scheme, labelled in a single pass.
+
+    Keeps the index of ``dates`` when it is a Series.
+    """
+    schemes = [_scheme(scheme) for scheme in schemes]
+    codes = era_codes(dates, schemes)
+    missing = np.asarray(pd.isna(pd.to_datetime(dates)))
+    return pd.DataFrame(
+        {scheme.name: _categorical(codes[:, i], scheme, unknown, missing) for i, scheme in enumerate(schemes)},
+        index=dates.index if isinstance(dates, pd.Series) else None,
+    )
+
+
+MANAGERS_PATH = os.path.join(REPO_DIR, "liverpoolfc_managers.csv")
+
+
+def manager_display_name(name):
+    """'Klopp, Jürgen' -> 'Jürgen Klopp'."""
+    if "," in name:
+        last, first = name.split(",", 1)
+        return f"{first.strip()} {last.strip()}"
+    return name
+
+
+def manager_eras():
+    """``EraScheme`` of Liverpool manager tenures, ``From`` to ``To`` inclusive.
+
+    Days between two tenures (caretaker spells not in the file) are
+    unlabelled. Where a tenure ends on the day the next begins, the
+    new manager takes that day.
+    """
+    def build():
+        managers = load_dataset(MANAGERS_PATH, sep=";")
+        managers = managers.assign(From=pd.to_datetime(managers["From"]),
+                                   To=pd.to_datetime(managers["To"])).sort_values("From")
+        starts = list(managers["From"])
+        ends = [min(end + pd.Timedelta(days=1), next_start)
+                for end, next_start in zip(managers["To"], starts[1:] + [pd.Timestamp.max])]
+        boundaries, labels = [], [None]
+        for name, start, end in zip(managers["Name"], starts, ends):
+            if boundaries and boundaries[-1] == start:
+                labels[-1] = manager_display_name(name)  # no gap after the previous tenure
+            else:
+                boundaries += [start]
+                labels += [manager_display_name(name)]
+            boundaries += [end]
+            labels += [None]
+        return EraScheme("manager", boundaries, labels)
+
+    return derived_table("era_scheme:manager", [MANAGERS_PATH], build)
@@ -0,0 +1,158 @@
+"""Export every registered thesis figure to PNG, in parallel and incrementally.
+
+    python export_figures.py                # render new or changed figures
+    python export_figures.py --force        # render everything
+    python export_figures.py --jobs 4 --only xg
+
+Figures are discovered from ``thesis_figures.THESIS_FIGURES``. Each one is
+built in this process and fingerprinted from the content hashes of its source
+CSVs (see ``data_manifest``), its Plotly JSON and its image options; a PNG
+whose fingerprint matches the manifest from the previous run is skipped. The
+rest are rendered by a process pool in which every worker keeps one Kaleido
+renderer alive for all of its figures, instead of starting a browser per
+image. Requires ``kaleido``.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import plotly.io as pio
+
+from data_manifest import manifest_entry
+from data_mirror import REPO_DIR
+from thesis_figures import THESIS_FIGURES
+
+MANIFEST_NAME = ".figure_exports.json"
+
+
+def figure_fingerprint(figure, spec_json, data_digests):
+    """Hash of everything that determines the PNG: data, figure spec and image options."""
+    digest = hashlib.sha256()
+    for source in figure.sources:
+        digest.update(data_digests[source].encode())
+    digest.update(spec_json.encode())
+    digest.update(json.dumps(figure.image_options, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(out_dir, manifest):
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+
+def _start_renderer():
+    """Pool initializer: keep one Kaleido browser per worker (Kaleido >= 1.1)."""
+    try:
+        import kaleido
+    except ImportError:
+        return
+    if hasattr(kaleido, "start_sync_server"):
+        kaleido.start_sync_server(silence_warnings=True)
+    # Older Kaleido releases keep their renderer subprocess alive on their own
+
+
+def _render(spec_json, path, image_options):
+    fig = pio.from_json(spec_json, skip_invalid=True)
+    fig.write_image(path, **image_options)
+    return path
+
+
+def plan_exports(out_dir, names=None, force=False):
+    """Build the selected figures and return ``(stale, fresh)``.
+
+    ``stale`` is a list of ``(filename, spec_json, fingerprint)`` to render;
+    ``fresh`` lists the file names whose PNG is already up to date.
+    """
+    manifest = {} if force else load_manifest(out_dir)
+    figures = [THESIS_FIGURES[name] for name in (names or THESIS_FIGURES)]
+    data_digests = {
+        source: manifest_entry(source)["sha256"]
+        for source in {source for figure in figures for source in figure.sources}
+    }
+    stale, fresh = [], []
+    for figure in figures:
+        spec_json = figure.build().to_json()
+        fingerprint = figure_fingerprint(figure, spec_json, data_digests)
+        output = os.path.join(out_dir, figure.filename)
+        if manifest.get(figure.filename) == fingerprint and os.path.exists(output):
+            fresh.append(figure.filename)
+        else:
+            stale.append((figure.filename, spec_json, fingerprint))
+    return stale, fresh
+
+
+def export_figures(out_dir=REPO_DIR, names=None, force=False, jobs=None):
+    """Render the stale figures across ``jobs`` worker processes.
+
+    Returns ``{"rendered": [...], "skipped": [...], "failed": {name: error}}``.
+    The manifest is updated for every figure that rendered successfully.
+    """
+    stale, fresh = plan_exports(out_dir, names, force)
+    report = {"rendered": [], "skipped": fresh, "failed": {}}
+    if not stale:
+        return report
+
+    manifest = load_manifest(out_dir)
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(stale)))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_start_renderer) as pool:
+        futures = {
+            pool.submit(_render, spec_json, os.path.join(out_dir, filename),
+                        THESIS_FIGURES[filename].image_options): (filename, fingerprint)
+            for filename, spec_json, fingerprint in stale
+        }
+        for future in as_completed(futures):
+            filename, fingerprint = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                report["failed"][filename] = str(e)
+                continue
+            manifest[filename] = fingerprint
+            report["rendered"].append(filename)
+    save_manifest(out_dir, manifest)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=REPO_DIR, help="output folder (default: repo root)")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="render even if nothing changed")
+    parser.add_argument("--only", default=None, help="only figures whose file name contains this text")
+    parser.add_argument("--list", action="store_true", help="list the registered figures and exit")
+    args = parser.parse_args(argv)
+
+    names = [name for name in THESIS_FIGURES if args.only is None or args.only.lower() in name.lower()]
+    if args.list:
+        for name in names:
+            print(f"{name}  <- {', '.join(os.path.basename(s) for s in THESIS_FIGURES[name].sources)}")
+        return 0
+
+    start = time.perf_counter()
+    os.makedirs(args.out, exist_ok=True)
+    report = export_figures(args.out, names, force=args.force, jobs=args.jobs)
+    for name in sorted(report["rendered"]):
+        print(f"🖼️ {name}")
+    for name, error in sorted(report["failed"].items()):
+        print(f"❌ {name}: {error}")
+    print(f"✅ {len(report['rendered'])} rendered, {len(report['skipped'])} unchanged, "
+          f"{len(report['failed'])} failed in {time.perf_counter() - start:.1f}s")
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Size-bounded LRU cache of serialized Plotly figures.
+
+Most dashboard reruns rebuild exactly the same figures from exactly the same
+data. ``cached_figure`` keys each figure by chart id, data version and the
+selection parameters that shaped it, stores its JSON, and rebuilds only on a
+miss. Rehydrating from JSON is roughly an order of magnitude cheaper than
+going through ``plotly.express`` again.
+
+The cap defaults to 64 MB of JSON and can be set with ``FIGURE_CACHE_MB``.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+import plotly.io as pio
+
+
+class FigureCache:
+    """LRU map of figure key -> figure JSON, evicting once ``max_bytes`` is exceeded."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the figure stored under ``key``, or ``None``."""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return pio.from_json(payload, skip_invalid=True)
+
+    def put(self, key, fig):
+        """Store ``fig`` under ``key``; figures larger than the whole cap are not kept."""
+        payload = fig.to_json()
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= len(self._entries.pop(key))
+            self._entries[key] = payload
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """Return entry count, bytes held and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+FIGURES = FigureCache(int(float(os.environ.get("FIGURE_CACHE_MB", 64)) * 1024 * 1024))
+
+
+def figure_key(chart_id, version=None, **params):
+    """Return the cache key for ``chart_id`` built from data ``version`` with ``params``."""
+    return chart_id, version, repr(sorted(params.items()))
+
+
+def cached_figure(chart_id, builder, version=None, **params):
+    """Return the figure for ``chart_id``, calling ``builder()`` only on a cache miss.
+
+    ``version`` identifies the data the figure was built from (see
+    ``data_registry.dataset_version``) and ``params`` any selection that changes
+    it. Callers get a fresh figure object and may modify it freely.
+    """
+    key = figure_key(chart_id, version, **params)
+    fig = FIGURES.get(key)
+    if fig is None:
+        fig = builder()
+        FIGURES.put(key, fig)
+    return fig
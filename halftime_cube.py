@@ -0,0 +1,144 @@
+"""Half-time to full-time state transition counts for every team and season.
+
+The Momentum tab used to derive ``LeadingTeam`` with a row-wise ``apply`` and
+then group the same matches three more times (by team, by Liverpool venue and
+by Liverpool season). ``HalftimeCube`` counts every match once from both
+teams' perspectives into a ``(team, season, venue, HT state, FT state)`` array
+that also holds the totals over each of the first three axes. The transition
+matrix of any slice, and the conversion, collapse and comeback rates derived
+from it, are then a single index lookup.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_mirror import REPO_DIR
+from data_registry import derived_table, load_dataset
+
+EPL_FINAL_PATH = os.path.join(REPO_DIR, "epl_final.csv")
+
+HT_STATES = ("Lead", "Level", "Trail")
+FT_STATES = ("Win", "Draw", "Loss")
+VENUES = ("Home", "Away")
+
+# The result codes from the home side's point of view; the away side's state is 2 - state
+_HOME_STATE = {"H": 0, "D": 1, "A": 2}
+
+
+def _home_states(results):
+    codes = pd.Series(results).astype(str).to_numpy()
+    return np.select([codes == code for code in _HOME_STATE], list(_HOME_STATE.values()), -1)
+
+
+def _rate(numerator, denominator):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator / np.maximum(denominator, 1) * 100, np.nan)
+
+
+class HalftimeCube:
+    """Counts of ``(team, season, venue, HT state, FT state)`` over a frame of matches.
+
+    ``counts`` has one extra slot at the end of the team, season and venue
+    axes holding the total over that axis, so ``counts[-1, -1, -1]`` is the
+    league-wide transition matrix. Matches without both results are skipped.
+    """
+
+    def __init__(self, matches):
+        home = matches["HomeTeam"].astype(str).to_numpy()
+        away = matches["AwayTeam"].astype(str).to_numpy()
+        seasons = matches["Season"].astype(str).to_numpy()
+        ht = _home_states(matches["HalfTimeResult"])
+        ft = _home_states(matches["FullTimeResult"])
+        valid = (ht >= 0) & (ft >= 0)
+        home, away, seasons, ht, ft = home[valid], away[valid], seasons[valid], ht[valid], ft[valid]
+
+        self.teams = np.unique(np.concatenate([home, away]))
+        self.seasons = np.unique(seasons)
+        self._team_index = {team: i for i, team in enumerate(self.teams)}
+        self._season_index = {season: i for i, season in enumerate(self.seasons)}
+
+        team_ids = np.concatenate([np.searchsorted(self.teams, home), np.searchsorted(self.teams, away)])
+        season_ids = np.tile(np.searchsorted(self.seasons, seasons), 2)
+        venue_ids = np.repeat([0, 1], len(home))
+        shape = (len(self.teams) + 1, len(self.seasons) + 1, len(VENUES) + 1, 3, 3)
+        flat = np.ravel_multi_index(
+            (team_ids, season_ids, venue_ids, np.concatenate([ht, 2 - ht]), np.concatenate([ft, 2 - ft])),
+            shape,
+        )
+        counts = np.bincount(flat, minlength=np.prod(shape)).reshape(shape)
+        counts[-1] = counts[:-1].sum(axis=0)
+        counts[:, -1] = counts[:, :-1].sum(axis=1)
+        counts[:, :, -1] = counts[:, :, :-1].sum(axis=2)
+        self.counts = counts
+
+    def _index(self, team=None, season=None, venue=None):
+        return (
+            -1 if team is None else self._team_index[team],
+            -1 if season is None else self._season_index[str(season)],
+            -1 if venue is None else VENUES.index(venue),
+        )
+
+    def transitions(self, team=None, season=None, venue=None):
+        """3x3 matrix of HT state (rows) by FT state (columns); ``None`` means all."""
+        return self.counts[self._index(team, season, venue)]
+
+    def transition_table(self, team=None, season=None, venue=None):
+        """``transitions`` as a labelled DataFrame."""
+        return pd.DataFrame(self.transitions(team, season, venue),
+                            index=pd.Index(HT_STATES, name="HT"), columns=pd.Index(FT_STATES, name="FT"))
+
+    def conversion_rate(self, team=None, season=None, venue=None):
+        """Percentage of half-time leads turned into wins."""
+        lead = self.transitions(team, season, venue)[0]
+        return float(_rate(lead[0], lead.sum()))
+
+    def collapse_rate(self, team=None, season=None, venue=None):
+        """Percentage of half-time leads that ended in defeat."""
+        lead = self.transitions(team, season, venue)[0]
+        return float(_rate(lead[2], lead.sum()))
+
+    def comeback_rate(self, team=None, season=None, venue=None):
+        """Percentage of half-time deficits turned into wins."""
+        trail = self.transitions(team, season, venue)[2]
+        return float(_rate(trail[0], trail.sum()))
+
+    def summary(self, by, team=None, season=None, venue=None):
+        """One row per team, season or venue (``by``) of the selected slice.
+
+        Columns: ``Leads``, ``LeadsHeld`` (lead -> win), ``LeadsLost`` (lead ->
+        loss), ``Trails``, ``Comebacks`` (trail -> win) and the matching
+        ``ConversionRate``, ``CollapseRate`` and ``ComebackRate`` percentages.
+        """
+        labels = {"team": self.teams, "season": self.seasons, "venue": np.array(VENUES)}[by]
+        index = list(self._index(team, season, venue))
+        index[("team", "season", "venue").index(by)] = slice(0, len(labels))
+        cube = self.counts[tuple(index)]  # (labels, HT, FT)
+        leads, trails = cube[:, 0].sum(axis=1), cube[:, 2].sum(axis=1)
+        return pd.DataFrame({
+            by.capitalize(): labels,
+            "Leads": leads,
+            "LeadsHeld": cube[:, 0, 0],
+            "LeadsLost": cube[:, 0, 2],
+            "Trails": trails,
+            "Comebacks": cube[:, 2, 0],
+            "ConversionRate": _rate(cube[:, 0, 0], leads),
+            "CollapseRate": _rate(cube[:, 0, 2], leads),
+            "ComebackRate": _rate(cube[:, 2, 0], trails),
+        })
+
+
+def halftime_cube(path=EPL_FINAL_PATH, teams=None):
+    """Return the shared ``HalftimeCube`` for ``path``, rebuilt when the file changes.
+
+    With ``teams`` only matches between two of those teams are counted.
+    """
+    key = f"halftime_cube:{os.path.abspath(path)}:{sorted(teams) if teams is not None else None}"
+
+    def build():
+        df = load_dataset(path)
+        if teams is not None:
+            df = df[df["HomeTeam"].isin(teams) & df["AwayTeam"].isin(teams)]
+        return HalftimeCube(df)
+
+    return derived_table(key, [path], build)
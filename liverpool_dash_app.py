@@ -7,6 +7,8 @@ import plotly.express as px
 import pandas as pd
 import pickle
 
+from callback_cache import memoize_callback
+
 # Load pre-processed visualizations or datasets
 # Replace these with real processing or visualization logic from the notebook
 # For example, load your dataframes like: df = pd.read_csv("your_dataset.csv")
@@ -32,6 +34,7 @@ app.layout = dbc.Container(fluid=True, children=[
     Output("tab-content", "children"),
     Input("tabs", "active_tab")
 )
+@memoize_callback()
 def render_tab_content(active_tab):
     if active_tab == "shot-map":
         return html.Div([
@@ -5,6 +5,8 @@ import plotly.express as px
 import plotly.graph_objects as go
 import matplotlib.pyplot as plt
 import seaborn as sns
+from data_registry import load_dataset
+from eras import era_labels
 
 st.set_page_config(page_title="Liverpool FC Analysis", layout="wide")
 
@@ -72,7 +74,7 @@ import plotly.express as px
 import plotly.io as pio
 
 # 1️⃣ Load your CSV
-df = pd.read_csv('Liverpool_2015_2023_Matches.csv')
+df = load_dataset('Liverpool_2015_2023_Matches.csv')
 
 # 2️⃣ Add Venue column
 df['Venue'] = df.apply(lambda row: 'Home' if row['Home'] == 'Liverpool' else 'Away', axis=1)
@@ -162,7 +164,7 @@ import plotly.express as px
 import plotly.io as pio
 
 # 1️⃣ Load the CSV
-df = pd.read_csv("Liverpool_2015_2023_Matches.csv")
+df = load_dataset("Liverpool_2015_2023_Matches.csv")
 
 # 2️⃣ Add Venue column
 df['Venue'] = df.apply(lambda row: 'Home' if row['Home'] == 'Liverpool' else 'Away', axis=1)
@@ -177,14 +179,7 @@ df['Result'] = df.apply(get_result, axis=1)
 
 # 4️⃣ Add CovidPeriod column
 df['Date'] = pd.to_datetime(df['Date'])
-def covid_period(date):
-    if date < pd.to_datetime('2020-03-01'):
-        return 'Pre-COVID'
-    elif date < pd.to_datetime('2021-07-01'):
-        return 'During COVID'
-    else:
-        return 'Post-COVID'
-df['CovidPeriod'] = df['Date'].apply(covid_period)
+df['CovidPeriod'] = era_labels(df['Date'], 'covid_seasons')
 
 # 5️⃣ Group and summarize data
 summary = df.groupby(['CovidPeriod', 'Venue', 'Result']).size().reset_index(name='Count')
@@ -235,7 +230,7 @@ import plotly.express as px
 import plotly.io as pio
 
 # 📂 Load dataset
-df = pd.read_csv('Liverpool_Filtered_2015_onwards.csv')
+df = load_dataset('Liverpool_Filtered_2015_onwards.csv')
 
 # 📌 Rename columns (if needed)
 rename_columns = {
@@ -255,12 +250,7 @@ df['Venue'] = df.apply(lambda row: 'Home' if row['HomeTeam'] == 'Liverpool' else
 
 # 📅 Date parsing + COVID period
 df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-def covid_period(date):
-    if pd.isnull(date): return 'Unknown'
-    elif date < pd.to_datetime('2020-03-01'): return 'Pre-COVID'
-    elif date < pd.to_datetime('2021-07-01'): return 'During COVID'
-    else: return 'Post-COVID'
-df['CovidPeriod'] = df['Date'].apply(covid_period)
+df['CovidPeriod'] = era_labels(df['Date'], 'covid_seasons', unknown='Unknown')
 
 # 🏁 Result column from FTR
 df['Result'] = df['FullTimeResult'].map({'H': 'Win', 'D': 'Draw', 'A': 'Loss'})
@@ -377,7 +367,7 @@ st.plotly_chart(fig9, use_container_width=True)
 import plotly.express as px
 
 
-stats_df = pd.read_csv("stats.csv")
+stats_df = load_dataset("stats.csv")
 
 # Filter only Liverpool data
 liverpool_stats = stats_df[stats_df['team'] == 'Liverpool']
@@ -436,7 +426,7 @@ import pandas as pd
 import plotly.express as px
 
 # Load manager data
-managers_df = pd.read_csv("liverpoolfc_managers.csv", sep=';')
+managers_df = load_dataset("liverpoolfc_managers.csv", sep=';')
 
 # Convert date strings
 managers_df['From'] = pd.to_datetime(managers_df['From'])
@@ -501,7 +491,7 @@ import pandas as pd
 import plotly.express as px
 
 # Load your data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter only Liverpool matches
 liverpool_df = df[(df['HomeTeam'] == 'Liverpool') | (df['AwayTeam'] == 'Liverpool')].copy()
@@ -512,15 +502,7 @@ liverpool_df['Venue'] = liverpool_df['HomeTeam'].apply(lambda x: 'Home' if x ==
 # Parse match dates and assign COVID periods
 liverpool_df['MatchDate'] = pd.to_datetime(liverpool_df['MatchDate'])
 
-def covid_period(date):
-    if date < pd.to_datetime('2020-03-01'):
-        return 'Pre-COVID'
-    elif date <= pd.to_datetime('2021-07-01'):
-        return 'During-COVID'
-    else:
-        return 'Post-COVID'
-
-liverpool_df['CovidPeriod'] = liverpool_df['MatchDate'].apply(covid_period)
+liverpool_df['CovidPeriod'] = era_labels(liverpool_df['MatchDate'], 'covid_seasons').rename_categories({'During COVID': 'During-COVID'})
 
 # Add match stats from Liverpool's perspective
 liverpool_df['Goals'] = liverpool_df.apply(
@@ -848,7 +830,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load your dataset (update filename if needed)
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Step 1: Filter only Liverpool games (home or away)
 liverpool_only = df[
@@ -902,7 +884,7 @@ import matplotlib.pyplot as plt
 import pandas as pd
 
 # Load data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter Liverpool games
 liverpool_df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -952,7 +934,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load data (replace with your actual DataFrame if already loaded)
-df_copy = pd.read_csv("epl_final.csv")
+df_copy = load_dataset("epl_final.csv")
 
 # Home discipline
 home_cards = df_copy.groupby("HomeTeam").agg(
@@ -1080,7 +1062,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter Liverpool matches
 df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1154,7 +1136,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter only Liverpool matches
 df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1201,7 +1183,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load dataset
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter Liverpool matches
 df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1351,7 +1333,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 print(df_copy.columns.tolist())
 print(df.head())              # See sample data
    # See actual column names
@@ -1510,7 +1492,7 @@ import seaborn as sns
 import streamlit as st
 
 # Load data and filter by year
-liverpool_shots = pd.read_csv("shots_EPL_1920.csv")
+liverpool_shots = load_dataset("shots_EPL_1920.csv")
 liverpool_shots["date"] = pd.to_datetime(liverpool_shots["date"], errors="coerce")
 liverpool_shots = liverpool_shots[liverpool_shots["date"].dt.year.isin([2019, 2020])]
 
@@ -1567,7 +1549,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load shot data
-shots = pd.read_csv("shots_EPL_1920.csv")
+shots = load_dataset("shots_EPL_1920.csv")
 
 # Filter Liverpool shots
 liverpool_shots = shots[(shots["h_team"] == "Liverpool") | (shots["a_team"] == "Liverpool")].copy()
@@ -1621,7 +1603,7 @@ import plotly.io as pio
 pio.renderers.default = 'notebook'  # or 'iframe', 'svg' if needed
 
 # 📂 Load dataset
-df = pd.read_csv('EPL_result.csv')
+df = load_dataset('EPL_result.csv')
 
 # 🧮 Group by home team: average xG and actual goals
 home_stats = df.groupby('Home').agg(
@@ -1687,16 +1669,16 @@ import plotly.io as pio
 
 # Optional: set default renderer if needed
 pio.renderers.default = 'notebook'
-df = pd.read_csv("EPL_result.csv")  # make sure this file is in the directory
+df = load_dataset("EPL_result.csv")  # make sure this file is in the directory
 
 team_abb = {
     'Everton': 'EVE', 'Aston Villa': 'AVL', 'Leicester City': 'LEI',
     'Arsenal': 'ARS', 'Liverpool': 'LIV', 'Tottenham': 'TOT',
-    'Chelsea': 'CHE', 'Leeds United': 'LEE', 'Newcastle Utd': 'NEW',
+    'Chelsea': 'CHE', 'Leeds United': 'LEE', 'Newcastle United': 'NEW',
     'West Ham': 'WHU', 'Southampton': 'SOU', 'Crystal Palace': 'CRY',
     'Wolves': 'WOL', 'Manchester City': 'MCI', 'Brighton': 'BHA',
-    'Manchester Utd': 'MUN', 'West Brom': 'WBA', 'Burnley': 'BUR',
-    'Sheffield Utd': 'SHU', 'Fulham': 'FUL'
+    'Manchester United': 'MUN', 'West Brom': 'WBA', 'Burnley': 'BUR',
+    'Sheffield United': 'SHU', 'Fulham': 'FUL'
 }
 
 df['Home'] = df['Home'].map(team_abb)
@@ -1977,7 +1959,7 @@ lfc_reds[["Season", "LFC_RedCardVenue", "LiverpoolResult"]].to_csv("liverpool_re
 # defensive_ranking = team_def.sort_values("ConcededPerShot",ascending=False)
 # Defensive stats calculation using correct column names
 # Load the dataset
-df_copy = pd.read_csv("EPL_result.csv")
+df_copy = load_dataset("EPL_result.csv")
 
 # Optional: View the columns to verify
 print(df_copy.columns.tolist())
@@ -2103,7 +2085,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load your data (update file name if needed)
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Step 1: Filter only Liverpool matches
 liverpool_df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -2202,7 +2184,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load your dataset
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Step 1: Filter Liverpool matches
 liverpool_df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -2292,7 +2274,7 @@ st.pyplot(plt)
 
 
 # Filter Liverpool shots
-liverpool_shots = pd.read_csv("shots_EPL_1920.csv")
+liverpool_shots = load_dataset("shots_EPL_1920.csv")
 
 # Filter only Liverpool shots (home team = Liverpool)
 liverpool_shots = liverpool_shots[liverpool_shots["h_team"] == "Liverpool"]
@@ -2325,7 +2307,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load the dataset
-shots = pd.read_csv("shots_EPL_1920.csv")
+shots = load_dataset("shots_EPL_1920.csv")
 
 # Filter Liverpool shots
 liverpool_shots = shots[(shots["h_team"] == "Liverpool") | (shots["a_team"] == "Liverpool")].copy()
@@ -2372,7 +2354,7 @@ import pandas as pd
 import plotly.express as px
 
 # Load manager data
-managers_df = pd.read_csv("liverpoolfc_managers.csv", sep=';')
+managers_df = load_dataset("liverpoolfc_managers.csv", sep=';')
 
 # Convert date strings
 managers_df['From'] = pd.to_datetime(managers_df['From'])
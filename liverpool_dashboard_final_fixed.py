@@ -8,6 +8,9 @@ import plotly.express as px
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.io as pio
+from data_registry import load_dataset
+from eras import era_labels
+from shot_density import density_panels
 
 
 # ========== Real Figures ==========
@@ -15,7 +18,7 @@ import plotly.io as pio
 import pandas as pd
 
 # 📂 2. Load your CSV — adjust the file name if needed
-df = pd.read_csv('premier-league-matches.csv')
+df = load_dataset('premier-league-matches.csv')
 
 # 📂 3. Filter Season_End_Year between 2015 and 2023
 df_filtered = df[(df['Season_End_Year'] >= 2015) & (df['Season_End_Year'] <= 2023)]
@@ -40,7 +43,7 @@ import plotly.express as px
 import plotly.io as pio
 
 # 1️⃣ Load your CSV
-df = pd.read_csv('Liverpool_2015_2023_Matches.csv')
+df = load_dataset('Liverpool_2015_2023_Matches.csv')
 
 # 2️⃣ Add Venue column
 df['Venue'] = df.apply(lambda row: 'Home' if row['Home'] == 'Liverpool' else 'Away', axis=1)
@@ -64,7 +67,7 @@ def get_result(row):
 df['Result'] = df.apply(get_result, axis=1)
 
 # 4️⃣ Create Summary Table
-summary = df.groupby('Venue').agg(
+summary = df.groupby('Venue', observed=True).agg(
     Total_Matches=('Result', 'count'),
     Wins=('Result', lambda x: (x == 'Win').sum())
 ).reset_index()
@@ -130,7 +133,7 @@ import plotly.express as px
 import plotly.io as pio
 
 # 1️⃣ Load the CSV
-df = pd.read_csv("Liverpool_2015_2023_Matches.csv")
+df = load_dataset("Liverpool_2015_2023_Matches.csv")
 
 # 2️⃣ Add Venue column
 df['Venue'] = df.apply(lambda row: 'Home' if row['Home'] == 'Liverpool' else 'Away', axis=1)
@@ -145,19 +148,12 @@ df['Result'] = df.apply(get_result, axis=1)
 
 # 4️⃣ Add CovidPeriod column
 df['Date'] = pd.to_datetime(df['Date'])
-def covid_period(date):
-    if date < pd.to_datetime('2020-03-01'):
-        return 'Pre-COVID'
-    elif date < pd.to_datetime('2021-07-01'):
-        return 'During COVID'
-    else:
-        return 'Post-COVID'
-df['CovidPeriod'] = df['Date'].apply(covid_period)
+df['CovidPeriod'] = era_labels(df['Date'], 'covid_seasons')
 
 # 5️⃣ Group and summarize data
-summary = df.groupby(['CovidPeriod', 'Venue', 'Result']).size().reset_index(name='Count')
+summary = df.groupby(['CovidPeriod', 'Venue', 'Result'], observed=True).size().reset_index(name='Count')
 summary['Result_Grouped'] = summary['Result'].apply(lambda x: 'Wins' if x == 'Win' else 'Other')
-stacked = summary.groupby(['CovidPeriod', 'Venue', 'Result_Grouped'])['Count'].sum().reset_index()
+stacked = summary.groupby(['CovidPeriod', 'Venue', 'Result_Grouped'], observed=True)['Count'].sum().reset_index()
 
 # 6️⃣ Modern stacked bar chart
 fig3 = fig = px.bar(
@@ -200,7 +196,7 @@ fig3.update_traces(
 import pandas as pd
 
 # 1️⃣ Load your CSV
-df = pd.read_csv('EPL_Set.csv')  # or your latest file name
+df = load_dataset('EPL_Set.csv')  # or your latest file name
 
 # 2️⃣ Drop rows with missing Home/Away teams or final scores
 df = df.dropna(subset=['HomeTeam', 'AwayTeam', 'FTHG', 'FTAG'])
@@ -243,17 +239,7 @@ def get_result(row):
 df['Result'] = df.apply(get_result, axis=1)
 
 # 9️⃣ Add CovidPeriod column
-def covid_period(date):
-    if pd.isnull(date):
-        return 'Unknown'
-    elif date < pd.to_datetime('2020-03-01'):
-        return 'Pre-COVID'
-    elif date < pd.to_datetime('2021-07-01'):
-        return 'During COVID'
-    else:
-        return 'Post-COVID'
-
-df['CovidPeriod'] = df['Date'].apply(covid_period)
+df['CovidPeriod'] = era_labels(df['Date'], 'covid_seasons', unknown='Unknown')
 
 # ✅ Done: check result
 df.head()
@@ -266,7 +252,7 @@ import plotly.express as px
 import plotly.io as pio
 
 # 📂 Load dataset
-df = pd.read_csv('Liverpool_Filtered_2015_onwards.csv')
+df = load_dataset('Liverpool_Filtered_2015_onwards.csv')
 
 # 📌 Rename columns (if needed)
 rename_columns = {
@@ -286,19 +272,14 @@ df['Venue'] = df.apply(lambda row: 'Home' if row['HomeTeam'] == 'Liverpool' else
 
 # 📅 Date parsing + COVID period
 df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-def covid_period(date):
-    if pd.isnull(date): return 'Unknown'
-    elif date < pd.to_datetime('2020-03-01'): return 'Pre-COVID'
-    elif date < pd.to_datetime('2021-07-01'): return 'During COVID'
-    else: return 'Post-COVID'
-df['CovidPeriod'] = df['Date'].apply(covid_period)
+df['CovidPeriod'] = era_labels(df['Date'], 'covid_seasons', unknown='Unknown')
 
 # 🏁 Result column from FTR
 df['Result'] = df['FullTimeResult'].map({'H': 'Win', 'D': 'Draw', 'A': 'Loss'})
 df.loc[df['Venue'] == 'Away', 'Result'] = df['FullTimeResult'].map({'A': 'Win', 'D': 'Draw', 'H': 'Loss'})
 
 # 📊 Plot 1: Wins Home vs Away
-wins = df[df['Result'] == 'Win'].groupby('Venue').size().reset_index(name='Wins')
+wins = df[df['Result'] == 'Win'].groupby('Venue', observed=True).size().reset_index(name='Wins')
 fig5 = fig1 = px.bar(
     wins, x='Venue', y='Wins', text='Wins', color='Venue',
     title='🏠 Liverpool Wins (Home vs Away)',
@@ -311,8 +292,8 @@ fig5.update_layout(font=dict(size=14), title_font=dict(size=24))
 
 
 # 📊 Plot 2: 100% Stacked Result %
-outcome = df.groupby(['Venue', 'Result']).size().reset_index(name='Count')
-outcome['Percent'] = outcome['Count'] / outcome.groupby('Venue')['Count'].transform('sum') * 100
+outcome = df.groupby(['Venue', 'Result'], observed=True).size().reset_index(name='Count')
+outcome['Percent'] = outcome['Count'] / outcome.groupby('Venue', observed=True)['Count'].transform('sum') * 100
 fig2 = px.bar(
     outcome, x='Venue', y='Percent', color='Result', text=outcome['Percent'].round(1),
     barmode='stack', title='⚖️ Result % Breakdown (Home vs Away)',
@@ -321,7 +302,7 @@ fig2 = px.bar(
 fig5.update_layout(font=dict(size=14), title_font=dict(size=24))
 
 # 📊 Plot 3: COVID Result Breakdown
-covid_outcome = df.groupby(['CovidPeriod', 'Venue', 'Result']).size().reset_index(name='Count')
+covid_outcome = df.groupby(['CovidPeriod', 'Venue', 'Result'], observed=True).size().reset_index(name='Count')
 fig3 = px.bar(
     covid_outcome, x='Venue', y='Count', color='Result', barmode='stack',
     facet_col='CovidPeriod', title='🦠 Result Breakdown by Venue & COVID Period',
@@ -331,7 +312,7 @@ fig5.update_layout(font=dict(size=14), title_font=dict(size=24))
 
 # 📊 Plot 4: Wins Over Time
 df['Year'] = df['Date'].dt.year
-wins_time = df[df['Result'] == 'Win'].groupby(['Year', 'Venue']).size().reset_index(name='Wins')
+wins_time = df[df['Result'] == 'Win'].groupby(['Year', 'Venue'], observed=True).size().reset_index(name='Wins')
 fig4 = px.line(
     wins_time, x='Year', y='Wins', color='Venue', markers=True,
     title='📈 Liverpool Wins Over Time (Home vs Away)',
@@ -351,19 +332,19 @@ fig5 = px.box(
 )
 fig5.update_layout(font=dict(size=14), title_font=dict(size=24))
 
-df=pd.read_csv('EPL_result.csv')
+df=load_dataset('EPL_result.csv')
 
 #Name to abbreviation
 team_abb={'Everton':'EVE', 'Aston Villa':'AVL',
           'Leicester City':'LEI', 'Arsenal':'ARS',
           'Liverpool':'LIV','Tottenham':'TOT', 
           'Chelsea':'CHE', 'Leeds United':'LEE', 
-          'Newcastle Utd':'NEW','West Ham':'WHU', 
+          'Newcastle United':'NEW','West Ham':'WHU', 
           'Southampton':'SOU', 'Crystal Palace':'CRY', 
           'Wolves':'WOL','Manchester City':'MCI', 
-          'Brighton':'BHA', 'Manchester Utd':'MUN', 
+          'Brighton':'BHA', 'Manchester United':'MUN', 
           'West Brom':'WBA','Burnley':'BUR', 
-          'Sheffield Utd':'SHU', 'Fulham':'FUL'}
+          'Sheffield United':'SHU', 'Fulham':'FUL'}
 df.Home=df.Home.apply(lambda x: team_abb[x])
 df.Away=df.Away.apply(lambda x: team_abb[x])
 
@@ -522,7 +503,7 @@ fig9.update_layout(
 # Save to PNG
 
 df['xG_diff'] = df['xG_Home'] - df['xG_Away']
-team_xg_diff = df.groupby('Home')['xG_diff'].mean().sort_values(ascending=False).reset_index()
+team_xg_diff = df.groupby('Home', observed=True)['xG_diff'].mean().sort_values(ascending=False).reset_index()
 
 fig10 = fig = px.bar(team_xg_diff, x='Home', y='xG_diff',
              title='📊 Average xG Difference (Home Teams)',
@@ -532,7 +513,7 @@ import pandas as pd
 import plotly.express as px
 
 # Load your data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter only Liverpool matches
 liverpool_df = df[(df['HomeTeam'] == 'Liverpool') | (df['AwayTeam'] == 'Liverpool')].copy()
@@ -543,15 +524,7 @@ liverpool_df['Venue'] = liverpool_df['HomeTeam'].apply(lambda x: 'Home' if x ==
 # Parse match dates and assign COVID periods
 liverpool_df['MatchDate'] = pd.to_datetime(liverpool_df['MatchDate'])
 
-def covid_period(date):
-    if date < pd.to_datetime('2020-03-01'):
-        return 'Pre-COVID'
-    elif date <= pd.to_datetime('2021-07-01'):
-        return 'During-COVID'
-    else:
-        return 'Post-COVID'
-
-liverpool_df['CovidPeriod'] = liverpool_df['MatchDate'].apply(covid_period)
+liverpool_df['CovidPeriod'] = era_labels(liverpool_df['MatchDate'], 'covid_seasons').rename_categories({'During COVID': 'During-COVID'})
 
 # Add match stats from Liverpool's perspective
 liverpool_df['Goals'] = liverpool_df.apply(
@@ -570,7 +543,7 @@ liverpool_df['Win'] = liverpool_df.apply(
     lambda row: 1 if row['Goals'] > row['GoalsConceded'] else 0, axis=1)
 
 # Group and summarize
-summary = liverpool_df.groupby(['CovidPeriod', 'Venue']).agg({
+summary = liverpool_df.groupby(['CovidPeriod', 'Venue'], observed=True).agg({
     'Goals': 'mean',
     'GoalsConceded': 'mean',
     'Shots': 'mean',
@@ -676,7 +649,7 @@ fig122.update_layout(
 )
 
 # ----- 3️⃣ Radar Chart: Overall Avg Comparison (Home vs Away) -----
-avg_metrics = summary.groupby('Venue')[['Goals', 'GoalsConceded', 'Shots', 'ShotsOnTarget', 'WinRate']].mean().reset_index()
+avg_metrics = summary.groupby('Venue', observed=True)[['Goals', 'GoalsConceded', 'Shots', 'ShotsOnTarget', 'WinRate']].mean().reset_index()
 
 fig3 = go.Figure()
 
@@ -708,8 +681,8 @@ df_copy["AwayWin"] = df_copy["FullTimeResult"] == "A"
 df_copy["Draw"] = df_copy["FullTimeResult"] == "D"
 
 # Group by team
-home_stats = df_copy.groupby("HomeTeam")[["HomeWin", "Draw"]].sum()
-away_stats = df_copy.groupby("AwayTeam")[["AwayWin", "Draw"]].sum()
+home_stats = df_copy.groupby("HomeTeam", observed=True)[["HomeWin", "Draw"]].sum()
+away_stats = df_copy.groupby("AwayTeam", observed=True)[["AwayWin", "Draw"]].sum()
 
 # Rename columns
 home_stats.columns = ["HomeWins", "HomeDraws"]
@@ -739,8 +712,8 @@ df_copy["AwayLoss"] = df_copy["FullTimeResult"] == "H"
 df_copy["HomeLoss"] = df_copy["FullTimeResult"] == "A"
 
 # Group by team
-away_stats = df_copy.groupby("AwayTeam")[["AwayLoss"]].sum()
-home_stats = df_copy.groupby("HomeTeam")[["HomeLoss"]].sum()
+away_stats = df_copy.groupby("AwayTeam", observed=True)[["AwayLoss"]].sum()
+home_stats = df_copy.groupby("HomeTeam", observed=True)[["HomeLoss"]].sum()
 
 # Rename columns
 away_stats.columns = ["AwayLoss"]
@@ -775,7 +748,7 @@ df_copy["TeamLoss"] = (
 
 # Group by season and count losses
 team_losses_by_season = (
-    df_copy.groupby("Season")["TeamLoss"].sum().sort_values(ascending=False)
+    df_copy.groupby("Season", observed=True)["TeamLoss"].sum().sort_values(ascending=False)
 )
 
 team_losses_by_season.head(10).plot(kind="bar", figsize=(12, 6), colormap="seismic")
@@ -788,10 +761,10 @@ plt.tight_layout()
 
 # Average goals scored at home and away by each team
 home_goals = (
-    df_copy.groupby("HomeTeam")["FullTimeHomeGoals"].mean().rename("AvgHomeGoals")
+    df_copy.groupby("HomeTeam", observed=True)["FullTimeHomeGoals"].mean().rename("AvgHomeGoals")
 )
 away_goals = (
-    df_copy.groupby("AwayTeam")["FullTimeAwayGoals"].mean().rename("AvgAwayGoals")
+    df_copy.groupby("AwayTeam", observed=True)["FullTimeAwayGoals"].mean().rename("AvgAwayGoals")
 )
 
 # Combine
@@ -869,7 +842,7 @@ liverpool_leads["Venue"] = liverpool_leads.apply(
 )
 
 # Step 5: Summary by venue
-conversion_summary = liverpool_leads.groupby("Venue")["LeadHeld"].agg(["sum", "count"])
+conversion_summary = liverpool_leads.groupby("Venue", observed=True)["LeadHeld"].agg(["sum", "count"])
 conversion_summary["ConversionRate"] = (conversion_summary["sum"] / conversion_summary["count"]) * 100
 
 # Step 6: Print
@@ -897,7 +870,7 @@ team_analysis["LeadingTeam"] = team_analysis.apply(
 )
 
 # Group by leading team and calculate conversion rate
-team_conversion = team_analysis.groupby("LeadingTeam")["LeadHeld"].agg(["sum", "count"])
+team_conversion = team_analysis.groupby("LeadingTeam", observed=True)["LeadHeld"].agg(["sum", "count"])
 team_conversion["ConversionRate"] = (team_conversion["sum"] / team_conversion["count"]) * 100
 # Top 10 teams by conversion rate
 top_10 = team_conversion.sort_values("ConversionRate", ascending=False).head(10)
@@ -945,7 +918,7 @@ liverpool_leads = team_analysis[
 ]
 
 # Group by Season to compute sum and total
-liverpool_season_conversion = liverpool_leads.groupby("Season")["LeadHeld"].agg(["sum", "count"])
+liverpool_season_conversion = liverpool_leads.groupby("Season", observed=True)["LeadHeld"].agg(["sum", "count"])
 liverpool_season_conversion["ConversionRate"] = (
     liverpool_season_conversion["sum"] / liverpool_season_conversion["count"]
 ) * 100
@@ -978,7 +951,7 @@ df_copy["TotalShots"] = df_copy["HomeShots"] + df_copy["AwayShots"]
 df_copy["WinMargin"] = abs(df_copy["FullTimeHomeGoals"] - df_copy["FullTimeAwayGoals"])
 
 # Step 2: Group by Season and calculate average
-attack_trend = df_copy.groupby("Season")[
+attack_trend = df_copy.groupby("Season", observed=True)[
     ["TotalGoals", "TotalShots", "WinMargin"]
 ].mean()
 attack_trend = attack_trend.sort_index()
@@ -1019,7 +992,7 @@ liverpool_only["TotalShots"] = liverpool_only["HomeShots"] + liverpool_only["Awa
 liverpool_only["WinMargin"] = abs(liverpool_only["FullTimeHomeGoals"] - liverpool_only["FullTimeAwayGoals"])
 
 # Step 3: Group by season and calculate mean trends
-liverpool_trend = liverpool_only.groupby("Season")[["TotalGoals", "TotalShots", "WinMargin"]].mean()
+liverpool_trend = liverpool_only.groupby("Season", observed=True)[["TotalGoals", "TotalShots", "WinMargin"]].mean()
 liverpool_trend = liverpool_trend.sort_index()
 
 # Step 4: Plot
@@ -1040,7 +1013,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load your dataset (update filename if needed)
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Step 1: Filter only Liverpool games (home or away)
 liverpool_only = df[
@@ -1056,7 +1029,7 @@ liverpool_only["TotalShots"] = liverpool_only["HomeShots"] + liverpool_only["Awa
 liverpool_only["WinMargin"] = abs(liverpool_only["FullTimeHomeGoals"] - liverpool_only["FullTimeAwayGoals"])
 
 # Step 4: Group by Season and Venue
-grouped = liverpool_only.groupby(["Season", "Venue"])[["TotalGoals", "TotalShots", "WinMargin"]].mean().reset_index()
+grouped = liverpool_only.groupby(["Season", "Venue"], observed=True)[["TotalGoals", "TotalShots", "WinMargin"]].mean().reset_index()
 
 # Step 5: Pivot to prepare for plotting
 pivot_goals = grouped.pivot(index="Season", columns="Venue", values="TotalGoals")
@@ -1092,7 +1065,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load your data (update file name if needed)
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Step 1: Filter only Liverpool matches
 liverpool_df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1102,7 +1075,7 @@ liverpool_df["TotalGoals"] = liverpool_df["FullTimeHomeGoals"] + liverpool_df["F
 liverpool_df["TotalShots"] = liverpool_df["HomeShots"] + liverpool_df["AwayShots"]
 
 # Step 3: Group by Season and calculate averages
-attack_trend = liverpool_df.groupby("Season")[["TotalGoals", "TotalShots"]].mean()
+attack_trend = liverpool_df.groupby("Season", observed=True)[["TotalGoals", "TotalShots"]].mean()
 
 # Step 4: Calculate shot conversion rate (%)
 attack_trend["ShotConversion"] = (attack_trend["TotalGoals"] / attack_trend["TotalShots"]) * 100
@@ -1162,7 +1135,7 @@ df_copy["TotalFouls"] = df_copy["HomeFouls"] + df_copy["AwayFouls"]
 df_copy["TotalYellowCards"] = df_copy["HomeYellowCards"] + df_copy["AwayYellowCards"]
 df_copy["TotalRedCards"] = df_copy["HomeRedCards"] + df_copy["AwayRedCards"]
 
-physical_trends = df_copy.groupby("Season")[
+physical_trends = df_copy.groupby("Season", observed=True)[
     ["TotalFouls", "TotalYellowCards", "TotalRedCards"]
 ].mean()
 
@@ -1189,7 +1162,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load your dataset
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Step 1: Filter Liverpool matches
 liverpool_df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1200,7 +1173,7 @@ liverpool_df["TotalYellowCards"] = liverpool_df["HomeYellowCards"] + liverpool_d
 liverpool_df["TotalRedCards"] = liverpool_df["HomeRedCards"] + liverpool_df["AwayRedCards"]
 
 # Step 3: Group by season and calculate average per match
-physical_trends = liverpool_df.groupby("Season")[["TotalFouls", "TotalYellowCards", "TotalRedCards"]].mean()
+physical_trends = liverpool_df.groupby("Season", observed=True)[["TotalFouls", "TotalYellowCards", "TotalRedCards"]].mean()
 
 # Step 4: Plot
 fig, axes = plt.subplots(1, 3, figsize=(18, 6), sharex=True)
@@ -1227,7 +1200,7 @@ import matplotlib.pyplot as plt
 import pandas as pd
 
 # Load data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter Liverpool games
 liverpool_df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1276,10 +1249,10 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load data (replace with your actual DataFrame if already loaded)
-df_copy = pd.read_csv("epl_final.csv")
+df_copy = load_dataset("epl_final.csv")
 
 # Home discipline
-home_cards = df_copy.groupby("HomeTeam").agg(
+home_cards = df_copy.groupby("HomeTeam", observed=True).agg(
     HomeYellows=("HomeYellowCards", "sum"),
     HomeReds=("HomeRedCards", "sum"),
     HomeFouls=("HomeFouls", "sum"),
@@ -1287,7 +1260,7 @@ home_cards = df_copy.groupby("HomeTeam").agg(
 )
 
 # Away discipline
-away_cards = df_copy.groupby("AwayTeam").agg(
+away_cards = df_copy.groupby("AwayTeam", observed=True).agg(
     AwayYellows=("AwayYellowCards", "sum"),
     AwayReds=("AwayRedCards", "sum"),
     AwayFouls=("AwayFouls", "sum"),
@@ -1370,14 +1343,14 @@ df_reds["RedCardOutcome"] = df_reds.apply(red_card_outcome, axis=1)
 df_with_red = df_reds[df_reds["RedCardTeam"] != "No Red"]
  #Add percent for each red card team category
 summary = (
-    df_with_red.groupby(["RedCardTeam", "RedCardOutcome"])
+    df_with_red.groupby(["RedCardTeam", "RedCardOutcome"], observed=True)
     .size()
     .reset_index(name="MatchCount")
 )
 
 summary["Percentage"] = (
     summary["MatchCount"]
-    / summary.groupby("RedCardTeam")["MatchCount"].transform("sum")
+    / summary.groupby("RedCardTeam", observed=True)["MatchCount"].transform("sum")
     * 100
 )
 
@@ -1414,7 +1387,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter Liverpool matches
 df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1446,12 +1419,12 @@ df["LiverpoolResult"] = df.apply(lfc_result, axis=1)
 df_red_only = df[df["RedCardTo"] != "No Red"]
 
 # Aggregate
-summary = df_red_only.groupby(["RedCardTo", "LiverpoolResult"]).size().reset_index(name="MatchCount")
+summary = df_red_only.groupby(["RedCardTo", "LiverpoolResult"], observed=True).size().reset_index(name="MatchCount")
 
 # Percentage
 summary["Percentage"] = (
     summary["MatchCount"] /
-    summary.groupby("RedCardTo")["MatchCount"].transform("sum")
+    summary.groupby("RedCardTo", observed=True)["MatchCount"].transform("sum")
 ) * 100
 
 # Plot
@@ -1476,7 +1449,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter only Liverpool matches
 df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1522,7 +1495,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load dataset
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter Liverpool matches
 df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1584,8 +1557,8 @@ df_copy["GoalsConceded_Home"] = df_copy["FullTimeAwayGoals"]
 df_copy["GoalsConceded_Away"] = df_copy["FullTimeHomeGoals"]
 
 # Combine for each team
-home_def = df_copy.groupby("HomeTeam")[["ShotsFaced_Home", "GoalsConceded_Home"]].sum()
-away_def = df_copy.groupby("AwayTeam")[["ShotsFaced_Away", "GoalsConceded_Away"]].sum()
+home_def = df_copy.groupby("HomeTeam", observed=True)[["ShotsFaced_Home", "GoalsConceded_Home"]].sum()
+away_def = df_copy.groupby("AwayTeam", observed=True)[["ShotsFaced_Away", "GoalsConceded_Away"]].sum()
 
 # Total shots faced and goals conceded
 team_def = home_def.join(away_def, how="outer").fillna(0)
@@ -1602,8 +1575,8 @@ team_def["ConcededPerShot"] = (
 # Count draws at home and away
 df_copy["IsDraw"] = df_copy["FullTimeResult"] == "D"
 draws = (
-    df_copy.groupby("HomeTeam")["IsDraw"].sum()
-    + df_copy.groupby("AwayTeam")["IsDraw"].sum()
+    df_copy.groupby("HomeTeam", observed=True)["IsDraw"].sum()
+    + df_copy.groupby("AwayTeam", observed=True)["IsDraw"].sum()
 )
 draws = draws.sort_values(ascending=False)
 
@@ -1622,7 +1595,7 @@ df_copy["HomeWin"] = (df_copy["FullTimeResult"] == "H").astype(int)
 df_copy["AwayWin"] = (df_copy["FullTimeResult"] == "A").astype(int)
 
 # 2. Group home stats
-home_stats = df_copy.groupby("HomeTeam").agg(
+home_stats = df_copy.groupby("HomeTeam", observed=True).agg(
     Goals_Home=("FullTimeHomeGoals", "sum"),
     Shots_Home=("HomeShots", "sum"),
     ShotsOnTarget_Home=("HomeShotsOnTarget", "sum"),
@@ -1634,7 +1607,7 @@ home_stats = df_copy.groupby("HomeTeam").agg(
 )
 
 # 3. Group away stats
-away_stats = df_copy.groupby("AwayTeam").agg(
+away_stats = df_copy.groupby("AwayTeam", observed=True).agg(
     Goals_Away=("FullTimeAwayGoals", "sum"),
     Shots_Away=("AwayShots", "sum"),
     ShotsOnTarget_Away=("AwayShotsOnTarget", "sum"),
@@ -1697,7 +1670,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter Liverpool matches
 lfc_df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1715,7 +1688,7 @@ def get_result(row):
 lfc_df["Result"] = lfc_df.apply(get_result, axis=1)
 
 # Calculate win ratios for each venue
-venue_stats = lfc_df.groupby("Venue")["Result"].value_counts().unstack().fillna(0)
+venue_stats = lfc_df.groupby("Venue", observed=True)["Result"].value_counts().unstack().fillna(0)
 venue_stats["Total"] = venue_stats.sum(axis=1)
 venue_stats["Win Ratio"] = venue_stats["Win"] / venue_stats["Total"]
 
@@ -1738,9 +1711,9 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load your data
-match_infos = pd.read_csv("match_infos_EPL_1920.csv")
-rosters = pd.read_csv("rosters_EPL_1920.csv")
-shots = pd.read_csv("shots_EPL_1920.csv")
+match_infos = load_dataset("match_infos_EPL_1920.csv")
+rosters = load_dataset("rosters_EPL_1920.csv")
+shots = load_dataset("shots_EPL_1920.csv")
 
 # Filter Liverpool-related data
 liverpool_matches = match_infos[(match_infos['team_h'] == 'Liverpool') | (match_infos['team_a'] == 'Liverpool')].copy()
@@ -1763,20 +1736,20 @@ for ax, df, title in zip(axes, [liverpool_shots[liverpool_shots["Venue"]=="Home"
     ax.invert_yaxis()
 plt.tight_layout()
 
-shot_types = liverpool_shots.groupby(["Venue", "shotType"])["id"].count().unstack().fillna(0)
+shot_types = liverpool_shots.groupby(["Venue", "shotType"], observed=True)["id"].count().unstack().fillna(0)
 shot_types.T.plot(kind='bar', figsize=(12, 6))
 plt.title("Liverpool Shot Types: Home vs Away")
 plt.ylabel("Number of Shots")
 plt.tight_layout()
 
-situations = liverpool_shots.groupby(["Venue", "situation"])["id"].count().unstack().fillna(0)
+situations = liverpool_shots.groupby(["Venue", "situation"], observed=True)["id"].count().unstack().fillna(0)
 situations.T.plot(kind='bar', figsize=(12, 6))
 plt.title("Shot Situations: Home vs Away")
 plt.ylabel("Number of Shots")
 plt.tight_layout()
 
-home_xg = liverpool_shots[liverpool_shots["Venue"] == "Home"].groupby("player")["xG"].sum().sort_values(ascending=False).head(5)
-away_xg = liverpool_shots[liverpool_shots["Venue"] == "Away"].groupby("player")["xG"].sum().sort_values(ascending=False).head(5)
+home_xg = liverpool_shots[liverpool_shots["Venue"] == "Home"].groupby("player", observed=True)["xG"].sum().sort_values(ascending=False).head(5)
+away_xg = liverpool_shots[liverpool_shots["Venue"] == "Away"].groupby("player", observed=True)["xG"].sum().sort_values(ascending=False).head(5)
 
 fig, axs = plt.subplots(1, 2, figsize=(16, 5))
 sns.barplot(x=home_xg.values, y=home_xg.index, ax=axs[0])
@@ -1794,7 +1767,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load the dataset
-shots = pd.read_csv("shots_EPL_1920.csv")
+shots = load_dataset("shots_EPL_1920.csv")
 
 # Filter Liverpool shots
 liverpool_shots = shots[(shots["h_team"] == "Liverpool") | (shots["a_team"] == "Liverpool")].copy()
@@ -1804,37 +1777,19 @@ liverpool_shots["Venue"] = liverpool_shots.apply(
     lambda row: "Home" if row["h_team"] == "Liverpool" else "Away", axis=1
 )
 
-# Plotting heatmaps
-fig, axes = plt.subplots(1, 2, figsize=(18, 7))
-
-for ax, venue in zip(axes, ["Home", "Away"]):
-    subset = liverpool_shots[liverpool_shots["Venue"] == venue]
-    sns.kdeplot(
-        data=subset,
-        x="X",
-        y="Y",
-        fill=True,
-        thresh=0,
-        levels=100,
-        cmap="Reds",
-        ax=ax
-    )
-    ax.set_title(f"Liverpool Shot Density – {venue} Matches")
-    ax.set_xlim(0.7, 1.05)
-    ax.set_ylim(0.2, 0.9)
-    ax.set_aspect('equal')
-    ax.invert_yaxis()
-    ax.set_xlabel("Normalized X (Goal on the Right)")
-    ax.set_ylabel("Normalized Y (Pitch Height)")
-
-plt.tight_layout()
+# Plotting heatmaps (shared pitch grid and colour scale)
+fig = density_panels(
+    [(f"Liverpool Shot Density – {venue} Matches", liverpool_shots[liverpool_shots["Venue"] == venue])
+     for venue in ["Home", "Away"]],
+    shared_scale=True
+)
 
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load shot data
-shots = pd.read_csv("shots_EPL_1920.csv")
+shots = load_dataset("shots_EPL_1920.csv")
 
 # Filter Liverpool shots
 liverpool_shots = shots[(shots["h_team"] == "Liverpool") | (shots["a_team"] == "Liverpool")].copy()
@@ -1849,32 +1804,13 @@ key_players = ["Mohamed Salah", "Roberto Firmino"]
 player_shots = liverpool_shots[liverpool_shots["player"].isin(key_players)]
 
 # Plot: 2x2 grid (Home vs Away for each player)
-fig, axes = plt.subplots(2, 2, figsize=(16, 12), sharex=True, sharey=True)
-
-for i, player in enumerate(key_players):
-    for j, venue in enumerate(["Home", "Away"]):
-        subset = player_shots[(player_shots["player"] == player) & (player_shots["Venue"] == venue)]
-        ax = axes[i][j]
-        sns.kdeplot(
-            data=subset,
-            x="X",
-            y="Y",
-            fill=True,
-            thresh=0,
-            levels=100,
-            cmap="Reds",
-            ax=ax
-        )
-        ax.set_title(f"{player} – {venue} Matches", fontsize=12)
-        ax.set_xlim(0.7, 1.05)
-        ax.set_ylim(0.2, 0.9)
-        ax.set_aspect('equal')
-        ax.invert_yaxis()
-        ax.set_xlabel("Normalized X")
-        ax.set_ylabel("Normalized Y")
-
-plt.suptitle("Shot Density Heatmap: Mohamed Salah vs Roberto Firmino (Home & Away)", fontsize=16)
-plt.tight_layout(rect=[0, 0, 1, 0.96])
+fig = density_panels(
+    [(f"{player} – {venue} Matches",
+      player_shots[(player_shots["player"] == player) & (player_shots["Venue"] == venue)])
+     for player in key_players for venue in ["Home", "Away"]],
+    title="Shot Density Heatmap: Mohamed Salah vs Roberto Firmino (Home & Away)",
+    shared_scale=True
+)
 
 gw_last=7        #Last Gameweek number to be updated
 gw_next=gw_last+1
@@ -2024,7 +1960,7 @@ fig50.update_layout(
 import plotly.express as px
 
 
-stats_df = pd.read_csv("stats.csv")
+stats_df = load_dataset("stats.csv")
 
 # Filter only Liverpool data
 liverpool_stats = stats_df[stats_df['team'] == 'Liverpool']
@@ -2062,7 +1998,7 @@ import pandas as pd
 import plotly.express as px
 
 # Load manager data
-managers_df = pd.read_csv("liverpoolfc_managers.csv", sep=';')
+managers_df = load_dataset("liverpoolfc_managers.csv", sep=';')
 
 # Convert date strings
 managers_df['From'] = pd.to_datetime(managers_df['From'])
@@ -2101,7 +2037,7 @@ import pandas as pd
 import plotly.express as px
 
 # Load manager data
-managers_df = pd.read_csv("liverpoolfc_managers.csv", sep=';')
+managers_df = load_dataset("liverpoolfc_managers.csv", sep=';')
 
 # Convert date strings
 managers_df['From'] = pd.to_datetime(managers_df['From'])
@@ -2199,10 +2135,10 @@ import plotly.io as pio
 pio.renderers.default = 'notebook'  # or 'iframe', 'svg' if needed
 
 # 📂 Load dataset
-df = pd.read_csv('EPL_result.csv')
+df = load_dataset('EPL_result.csv')
 
 # 🧮 Group by home team: average xG and actual goals
-home_stats = df.groupby('Home').agg(
+home_stats = df.groupby('Home', observed=True).agg(
     Avg_xG_Home=('xG_Home', 'mean'),
     Avg_G_Home=('G_Home', 'mean')
 ).reset_index()
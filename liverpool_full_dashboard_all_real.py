@@ -7,6 +7,10 @@ import plotly.express as px
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.io as pio
+from data_registry import load_dataset
+from eras import era_labels
+from shot_density import density_panels
+from match_enrichment import enrich_matches
 
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 app.title = "Liverpool Full Dashboard"
@@ -109,7 +113,7 @@ if __name__ == "__main__":
 import pandas as pd
 
 # 📂 2. Load your CSV — adjust the file name if needed
-df = pd.read_csv('premier-league-matches.csv')
+df = load_dataset('premier-league-matches.csv')
 
 # 📂 3. Filter Season_End_Year between 2015 and 2023
 df_filtered = df[(df['Season_End_Year'] >= 2015) & (df['Season_End_Year'] <= 2023)]
@@ -135,32 +139,11 @@ import pandas as pd
 import plotly.express as px
 import plotly.io as pio
 
-# 1️⃣ Load your CSV
-df = pd.read_csv('Liverpool_2015_2023_Matches.csv')
-
-# 2️⃣ Add Venue column
-df['Venue'] = df.apply(lambda row: 'Home' if row['Home'] == 'Liverpool' else 'Away', axis=1)
-
-# 3️⃣ Add Result column
-def get_result(row):
-    if row['Venue'] == 'Home':
-        if row['HomeGoals'] > row['AwayGoals']:
-            return 'Win'
-        elif row['HomeGoals'] == row['AwayGoals']:
-            return 'Draw'
-        else:
-            return 'Loss'
-    else:
-        if row['AwayGoals'] > row['HomeGoals']:
-            return 'Win'
-        elif row['AwayGoals'] == row['HomeGoals']:
-            return 'Draw'
-        else:
-            return 'Loss'
-df['Result'] = df.apply(get_result, axis=1)
+# 1️⃣ Load your CSV with Venue and Result columns
+df = enrich_matches(load_dataset('Liverpool_2015_2023_Matches.csv'))
 
 # 4️⃣ Create Summary Table
-summary = df.groupby('Venue').agg(
+summary = df.groupby('Venue', observed=True).agg(
     Total_Matches=('Result', 'count'),
     Wins=('Result', lambda x: (x == 'Win').sum())
 ).reset_index()
@@ -222,8 +205,8 @@ fig2.update_layout(
     legend_title_text='Metric'
 )
 fig2.show()
-pio.write_image(fig1, "liverpool_wins_home_away.png", width=1000, height=600)
-pio.write_image(fig2, "liverpool_matches_vs_wins_grouped.png", width=1000, height=600)
+# 💾 "liverpool_wins_home_away.png" is exported by export_figures.py
+# 💾 "liverpool_matches_vs_wins_grouped.png" is exported by export_figures.py
 
 # ---- Plot 3 ----
 
@@ -232,35 +215,16 @@ import pandas as pd
 import plotly.express as px
 import plotly.io as pio
 
-# 1️⃣ Load the CSV
-df = pd.read_csv("Liverpool_2015_2023_Matches.csv")
-
-# 2️⃣ Add Venue column
-df['Venue'] = df.apply(lambda row: 'Home' if row['Home'] == 'Liverpool' else 'Away', axis=1)
-
-# 3️⃣ Add Result column
-def get_result(row):
-    if row['Venue'] == 'Home':
-        return 'Win' if row['HomeGoals'] > row['AwayGoals'] else 'Draw' if row['HomeGoals'] == row['AwayGoals'] else 'Loss'
-    else:
-        return 'Win' if row['AwayGoals'] > row['HomeGoals'] else 'Draw' if row['AwayGoals'] == row['HomeGoals'] else 'Loss'
-df['Result'] = df.apply(get_result, axis=1)
+# 1️⃣ Load the CSV with Venue and Result columns
+df = enrich_matches(load_dataset("Liverpool_2015_2023_Matches.csv"))
 
 # 4️⃣ Add CovidPeriod column
-df['Date'] = pd.to_datetime(df['Date'])
-def covid_period(date):
-    if date < pd.to_datetime('2020-03-01'):
-        return 'Pre-COVID'
-    elif date < pd.to_datetime('2021-07-01'):
-        return 'During COVID'
-    else:
-        return 'Post-COVID'
-df['CovidPeriod'] = df['Date'].apply(covid_period)
+df['CovidPeriod'] = era_labels(df['Date'], 'covid_seasons')
 
 # 5️⃣ Group and summarize data
-summary = df.groupby(['CovidPeriod', 'Venue', 'Result']).size().reset_index(name='Count')
+summary = df.groupby(['CovidPeriod', 'Venue', 'Result'], observed=True).size().reset_index(name='Count')
 summary['Result_Grouped'] = summary['Result'].apply(lambda x: 'Wins' if x == 'Win' else 'Other')
-stacked = summary.groupby(['CovidPeriod', 'Venue', 'Result_Grouped'])['Count'].sum().reset_index()
+stacked = summary.groupby(['CovidPeriod', 'Venue', 'Result_Grouped'], observed=True)['Count'].sum().reset_index()
 
 # 6️⃣ Modern stacked bar chart
 fig = px.bar(
@@ -299,25 +263,20 @@ fig.update_traces(
 # 9️⃣ Show and Save
 fig.show()
 
-# Save as PNG
-pio.write_image(fig, "liverpool_covid_stacked_modern.png", width=1200, height=600)
+# 💾 "liverpool_covid_stacked_modern.png" is exported by export_figures.py
 
 
 # ---- Plot 4 ----
 import pandas as pd
 
 # 1️⃣ Load your CSV
-df = pd.read_csv('EPL_Set.csv')  # or your latest file name
+df = load_dataset('EPL_Set.csv')  # or your latest file name
 
 # 2️⃣ Drop rows with missing Home/Away teams or final scores
 df = df.dropna(subset=['HomeTeam', 'AwayTeam', 'FTHG', 'FTAG'])
 
-# 3️⃣ Filter: Keep only rows where Liverpool is Home OR Away
-df = df[(df['HomeTeam'] == 'Liverpool') | (df['AwayTeam'] == 'Liverpool')]
-
-# 4️⃣ Convert Date column to real dates (DD/MM/YY format in your file)
-df['Date'] = pd.to_datetime(df['Date'], dayfirst=True, format='%d/%m/%y', errors='coerce')
-
+# 3️⃣ Keep Liverpool's matches and add Venue/Result columns (dates are DD/MM/YY or DD/MM/YYYY)
+df = enrich_matches(df, layout='epl_set')
 
 # 5️⃣ Filter by Date: Only keep matches from 2015 onwards
 df = df[df['Date'].dt.year >= 2015]
@@ -327,40 +286,8 @@ for col in ['HTHG', 'HTAG', 'HTR']:
     if col in df.columns:
         df = df.drop(columns=[col])
 
-# 7️⃣ Add Venue column (Home/Away for Liverpool)
-df['Venue'] = df.apply(lambda row: 'Home' if row['HomeTeam'] == 'Liverpool' else 'Away', axis=1)
-
-# 8️⃣ Add Result column (Win/Draw/Loss from Liverpool's view)
-def get_result(row):
-    if row['Venue'] == 'Home':
-        if row['FTHG'] > row['FTAG']:
-            return 'Win'
-        elif row['FTHG'] == row['FTAG']:
-            return 'Draw'
-        else:
-            return 'Loss'
-    else:
-        if row['FTAG'] > row['FTHG']:
-            return 'Win'
-        elif row['FTAG'] == row['FTHG']:
-            return 'Draw'
-        else:
-            return 'Loss'
-
-df['Result'] = df.apply(get_result, axis=1)
-
 # 9️⃣ Add CovidPeriod column
-def covid_period(date):
-    if pd.isnull(date):
-        return 'Unknown'
-    elif date < pd.to_datetime('2020-03-01'):
-        return 'Pre-COVID'
-    elif date < pd.to_datetime('2021-07-01'):
-        return 'During COVID'
-    else:
-        return 'Post-COVID'
-
-df['CovidPeriod'] = df['Date'].apply(covid_period)
+df['CovidPeriod'] = era_labels(df['Date'], 'covid_seasons', unknown='Unknown')
 
 # ✅ Done: check result
 df.head()
@@ -375,7 +302,7 @@ import plotly.express as px
 import plotly.io as pio
 
 # 📂 Load dataset
-df = pd.read_csv('Liverpool_Filtered_2015_onwards.csv')
+df = load_dataset('Liverpool_Filtered_2015_onwards.csv')
 
 # 📌 Rename columns (if needed)
 rename_columns = {
@@ -395,19 +322,14 @@ df['Venue'] = df.apply(lambda row: 'Home' if row['HomeTeam'] == 'Liverpool' else
 
 # 📅 Date parsing + COVID period
 df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-def covid_period(date):
-    if pd.isnull(date): return 'Unknown'
-    elif date < pd.to_datetime('2020-03-01'): return 'Pre-COVID'
-    elif date < pd.to_datetime('2021-07-01'): return 'During COVID'
-    else: return 'Post-COVID'
-df['CovidPeriod'] = df['Date'].apply(covid_period)
+df['CovidPeriod'] = era_labels(df['Date'], 'covid_seasons', unknown='Unknown')
 
 # 🏁 Result column from FTR
 df['Result'] = df['FullTimeResult'].map({'H': 'Win', 'D': 'Draw', 'A': 'Loss'})
 df.loc[df['Venue'] == 'Away', 'Result'] = df['FullTimeResult'].map({'A': 'Win', 'D': 'Draw', 'H': 'Loss'})
 
 # 📊 Plot 1: Wins Home vs Away
-wins = df[df['Result'] == 'Win'].groupby('Venue').size().reset_index(name='Wins')
+wins = df[df['Result'] == 'Win'].groupby('Venue', observed=True).size().reset_index(name='Wins')
 fig1 = px.bar(
     wins, x='Venue', y='Wins', text='Wins', color='Venue',
     title='🏠 Liverpool Wins (Home vs Away)',
@@ -416,37 +338,37 @@ fig1 = px.bar(
 )
 fig1.update_traces(marker_line_color='white', marker_line_width=1.5, textposition='outside')
 fig1.update_layout(font=dict(size=14), title_font=dict(size=24))
-pio.write_image(fig1, "wins_home_away.png", width=1000, height=600)
+# 💾 "wins_home_away.png" is exported by export_figures.py
 fig1.show()
 
 
 
 # 📊 Plot 2: 100% Stacked Result %
-outcome = df.groupby(['Venue', 'Result']).size().reset_index(name='Count')
-outcome['Percent'] = outcome['Count'] / outcome.groupby('Venue')['Count'].transform('sum') * 100
+outcome = df.groupby(['Venue', 'Result'], observed=True).size().reset_index(name='Count')
+outcome['Percent'] = outcome['Count'] / outcome.groupby('Venue', observed=True)['Count'].transform('sum') * 100
 fig2 = px.bar(
     outcome, x='Venue', y='Percent', color='Result', text=outcome['Percent'].round(1),
     barmode='stack', title='⚖️ Result % Breakdown (Home vs Away)',
     color_discrete_sequence=px.colors.qualitative.Safe, template='plotly_white'
 )
 fig2.update_layout(font=dict(size=14), title_font=dict(size=24))
-pio.write_image(fig2, "result_percent_stacked.png", width=1000, height=600)
+# 💾 "result_percent_stacked.png" is exported by export_figures.py
 fig2.show()
 
 # 📊 Plot 3: COVID Result Breakdown
-covid_outcome = df.groupby(['CovidPeriod', 'Venue', 'Result']).size().reset_index(name='Count')
+covid_outcome = df.groupby(['CovidPeriod', 'Venue', 'Result'], observed=True).size().reset_index(name='Count')
 fig3 = px.bar(
     covid_outcome, x='Venue', y='Count', color='Result', barmode='stack',
     facet_col='CovidPeriod', title='🦠 Result Breakdown by Venue & COVID Period',
     color_discrete_sequence=px.colors.qualitative.Bold, template='plotly_white'
 )
 fig3.update_layout(font=dict(size=14), title_font=dict(size=24))
-pio.write_image(fig3, "result_covid_venue.png", width=1200, height=600)
+# 💾 "result_covid_venue.png" is exported by export_figures.py
 fig3.show()
 
 # 📊 Plot 4: Wins Over Time
 df['Year'] = df['Date'].dt.year
-wins_time = df[df['Result'] == 'Win'].groupby(['Year', 'Venue']).size().reset_index(name='Wins')
+wins_time = df[df['Result'] == 'Win'].groupby(['Year', 'Venue'], observed=True).size().reset_index(name='Wins')
 fig4 = px.line(
     wins_time, x='Year', y='Wins', color='Venue', markers=True,
     title='📈 Liverpool Wins Over Time (Home vs Away)',
@@ -454,7 +376,7 @@ fig4 = px.line(
     template='plotly_white'
 )
 fig4.update_layout(font=dict(size=14), title_font=dict(size=24))
-pio.write_image(fig4, "wins_over_time.png", width=1000, height=600)
+# 💾 "wins_over_time.png" is exported by export_figures.py
 fig4.show()
 
 # 📊 Plot 5: Goals Box Plot
@@ -467,7 +389,7 @@ fig5 = px.box(
     template='plotly_white'
 )
 fig5.update_layout(font=dict(size=14), title_font=dict(size=24))
-pio.write_image(fig5, "boxplot_goals.png", width=1000, height=600)
+# 💾 "boxplot_goals.png" is exported by export_figures.py
 fig5.show()
 
 
@@ -477,19 +399,19 @@ fig5.show()
 
 
 # ---- Plot 6 ----
-df=pd.read_csv('EPL_result.csv')
+df=load_dataset('EPL_result.csv')
 
 #Name to abbreviation
 team_abb={'Everton':'EVE', 'Aston Villa':'AVL',
           'Leicester City':'LEI', 'Arsenal':'ARS',
           'Liverpool':'LIV','Tottenham':'TOT', 
           'Chelsea':'CHE', 'Leeds United':'LEE', 
-          'Newcastle Utd':'NEW','West Ham':'WHU', 
+          'Newcastle United':'NEW','West Ham':'WHU', 
           'Southampton':'SOU', 'Crystal Palace':'CRY', 
           'Wolves':'WOL','Manchester City':'MCI', 
-          'Brighton':'BHA', 'Manchester Utd':'MUN', 
+          'Brighton':'BHA', 'Manchester United':'MUN', 
           'West Brom':'WBA','Burnley':'BUR', 
-          'Sheffield Utd':'SHU', 'Fulham':'FUL'}
+          'Sheffield United':'SHU', 'Fulham':'FUL'}
 df.Home=df.Home.apply(lambda x: team_abb[x])
 df.Away=df.Away.apply(lambda x: team_abb[x])
 
@@ -614,8 +536,7 @@ fig.update_layout(
 # ✅ Show interactive chart
 fig.show()
 
-# ✅ Save as PNG (optional — requires kaleido)
-fig.write_image("xg_home_vs_away.png", scale=3)
+# 💾 "xg_home_vs_away.png" is exported by export_figures.py
 
 
 # ---- Plot 9 ----
@@ -655,19 +576,18 @@ fig.update_layout(
 # Show plot
 fig.show()
 
-# Save to PNG
-fig.write_image("delta_xG_home_away_bar.png", scale=3)
+# 💾 "delta_xG_home_away_bar.png" is exported by export_figures.py
 
 
 # ---- Plot 10 ----
 df['xG_diff'] = df['xG_Home'] - df['xG_Away']
-team_xg_diff = df.groupby('Home')['xG_diff'].mean().sort_values(ascending=False).reset_index()
+team_xg_diff = df.groupby('Home', observed=True)['xG_diff'].mean().sort_values(ascending=False).reset_index()
 
 fig = px.bar(team_xg_diff, x='Home', y='xG_diff',
              title='📊 Average xG Difference (Home Teams)',
              template='plotly_white')
 fig.show()
-fig.write_image("average_xg_difference_home_teams.png")
+# 💾 "average_xg_difference_home_teams.png" is exported by export_figures.py
 
 # ---- Plot 11 ----
 
@@ -675,45 +595,25 @@ import pandas as pd
 import plotly.express as px
 
 # Load your data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
-# Filter only Liverpool matches
-liverpool_df = df[(df['HomeTeam'] == 'Liverpool') | (df['AwayTeam'] == 'Liverpool')].copy()
+# Filter only Liverpool matches; Venue is from Liverpool's perspective and MatchDate is parsed
+liverpool_df = enrich_matches(df)
 
-# Determine venue from Liverpool's perspective
-liverpool_df['Venue'] = liverpool_df['HomeTeam'].apply(lambda x: 'Home' if x == 'Liverpool' else 'Away')
-
-# Parse match dates and assign COVID periods
-liverpool_df['MatchDate'] = pd.to_datetime(liverpool_df['MatchDate'])
-
-def covid_period(date):
-    if date < pd.to_datetime('2020-03-01'):
-        return 'Pre-COVID'
-    elif date <= pd.to_datetime('2021-07-01'):
-        return 'During-COVID'
-    else:
-        return 'Post-COVID'
+# Assign COVID periods
 
-liverpool_df['CovidPeriod'] = liverpool_df['MatchDate'].apply(covid_period)
+liverpool_df['CovidPeriod'] = era_labels(liverpool_df['MatchDate'], 'covid_seasons').rename_categories({'During COVID': 'During-COVID'})
 
 # Add match stats from Liverpool's perspective
-liverpool_df['Goals'] = liverpool_df.apply(
-    lambda row: row['FullTimeHomeGoals'] if row['Venue'] == 'Home' else row['FullTimeAwayGoals'], axis=1)
-
-liverpool_df['GoalsConceded'] = liverpool_df.apply(
-    lambda row: row['FullTimeAwayGoals'] if row['Venue'] == 'Home' else row['FullTimeHomeGoals'], axis=1)
-
-liverpool_df['Shots'] = liverpool_df.apply(
-    lambda row: row['HomeShots'] if row['Venue'] == 'Home' else row['AwayShots'], axis=1)
-
-liverpool_df['ShotsOnTarget'] = liverpool_df.apply(
-    lambda row: row['HomeShotsOnTarget'] if row['Venue'] == 'Home' else row['AwayShotsOnTarget'], axis=1)
-
-liverpool_df['Win'] = liverpool_df.apply(
-    lambda row: 1 if row['Goals'] > row['GoalsConceded'] else 0, axis=1)
+liverpool_df['Goals'] = liverpool_df['GoalsFor']
+liverpool_df['GoalsConceded'] = liverpool_df['GoalsAgainst']
+is_home = liverpool_df['Venue'] == 'Home'
+liverpool_df['Shots'] = liverpool_df['HomeShots'].where(is_home, liverpool_df['AwayShots'])
+liverpool_df['ShotsOnTarget'] = liverpool_df['HomeShotsOnTarget'].where(is_home, liverpool_df['AwayShotsOnTarget'])
+liverpool_df['Win'] = (liverpool_df['Result'] == 'Win').astype(int)
 
 # Group and summarize
-summary = liverpool_df.groupby(['CovidPeriod', 'Venue']).agg({
+summary = liverpool_df.groupby(['CovidPeriod', 'Venue'], observed=True).agg({
     'Goals': 'mean',
     'GoalsConceded': 'mean',
     'Shots': 'mean',
@@ -760,8 +660,7 @@ fig.update_layout(
 # Improve annotation readability (clean up facet titles)
 fig.for_each_annotation(lambda a: a.update(text=a.text.split("=")[-1].replace("WinRate", "Win Rate")))
 
-# Save to file with clear resolution
-fig.write_image("Liverpool_COVID_Performance_FacetBar.png", width=1200, height=600)
+# 💾 "Liverpool_COVID_Performance_FacetBar.png" is exported by export_figures.py
 
 # Show plot
 fig.show()
@@ -801,7 +700,7 @@ fig1.update_layout(
     margin=dict(l=60, r=60, t=80, b=60)
 )
 fig1.for_each_annotation(lambda a: a.update(text=a.text.split("=")[-1].replace("WinRate", "Win Rate")))
-fig1.write_image("Liverpool_Bar_Goals_WinRate.png", width=1100, height=500)
+# 💾 "Liverpool_Bar_Goals_WinRate.png" is exported by export_figures.py
 fig1.show()
 
 # ----- 2️⃣ Line Chart: Win Rate Trend -----
@@ -824,11 +723,11 @@ fig2.update_layout(
     legend_title_text='Venue',
     margin=dict(l=60, r=60, t=80, b=60)
 )
-fig2.write_image("Liverpool_WinRate_Trend.png", width=800, height=500)
+# 💾 "Liverpool_WinRate_Trend.png" is exported by export_figures.py
 fig2.show()
 
 # ----- 3️⃣ Radar Chart: Overall Avg Comparison (Home vs Away) -----
-avg_metrics = summary.groupby('Venue')[['Goals', 'GoalsConceded', 'Shots', 'ShotsOnTarget', 'WinRate']].mean().reset_index()
+avg_metrics = summary.groupby('Venue', observed=True)[['Goals', 'GoalsConceded', 'Shots', 'ShotsOnTarget', 'WinRate']].mean().reset_index()
 
 fig3 = go.Figure()
 
@@ -851,7 +750,7 @@ fig3.update_layout(
     font=dict(size=12),
     margin=dict(l=60, r=60, t=80, b=60)
 )
-fig3.write_image("Liverpool_Radar_Performance_Home_Away.png", width=700, height=600)
+# 💾 "Liverpool_Radar_Performance_Home_Away.png" is exported by export_figures.py
 fig3.show()
 
 
@@ -864,8 +763,8 @@ df_copy["AwayWin"] = df_copy["FullTimeResult"] == "A"
 df_copy["Draw"] = df_copy["FullTimeResult"] == "D"
 
 # Group by team
-home_stats = df_copy.groupby("HomeTeam")[["HomeWin", "Draw"]].sum()
-away_stats = df_copy.groupby("AwayTeam")[["AwayWin", "Draw"]].sum()
+home_stats = df_copy.groupby("HomeTeam", observed=True)[["HomeWin", "Draw"]].sum()
+away_stats = df_copy.groupby("AwayTeam", observed=True)[["AwayWin", "Draw"]].sum()
 
 # Rename columns
 home_stats.columns = ["HomeWins", "HomeDraws"]
@@ -898,8 +797,8 @@ df_copy["AwayLoss"] = df_copy["FullTimeResult"] == "H"
 df_copy["HomeLoss"] = df_copy["FullTimeResult"] == "A"
 
 # Group by team
-away_stats = df_copy.groupby("AwayTeam")[["AwayLoss"]].sum()
-home_stats = df_copy.groupby("HomeTeam")[["HomeLoss"]].sum()
+away_stats = df_copy.groupby("AwayTeam", observed=True)[["AwayLoss"]].sum()
+home_stats = df_copy.groupby("HomeTeam", observed=True)[["HomeLoss"]].sum()
 
 # Rename columns
 away_stats.columns = ["AwayLoss"]
@@ -937,7 +836,7 @@ df_copy["TeamLoss"] = (
 
 # Group by season and count losses
 team_losses_by_season = (
-    df_copy.groupby("Season")["TeamLoss"].sum().sort_values(ascending=False)
+    df_copy.groupby("Season", observed=True)["TeamLoss"].sum().sort_values(ascending=False)
 )
 
 team_losses_by_season.head(10).plot(kind="bar", figsize=(12, 6), colormap="seismic")
@@ -952,10 +851,10 @@ plt.show()
 # ---- Plot 18 ----
 # Average goals scored at home and away by each team
 home_goals = (
-    df_copy.groupby("HomeTeam")["FullTimeHomeGoals"].mean().rename("AvgHomeGoals")
+    df_copy.groupby("HomeTeam", observed=True)["FullTimeHomeGoals"].mean().rename("AvgHomeGoals")
 )
 away_goals = (
-    df_copy.groupby("AwayTeam")["FullTimeAwayGoals"].mean().rename("AvgAwayGoals")
+    df_copy.groupby("AwayTeam", observed=True)["FullTimeAwayGoals"].mean().rename("AvgAwayGoals")
 )
 
 # Combine
@@ -1038,7 +937,7 @@ liverpool_leads["Venue"] = liverpool_leads.apply(
 )
 
 # Step 5: Summary by venue
-conversion_summary = liverpool_leads.groupby("Venue")["LeadHeld"].agg(["sum", "count"])
+conversion_summary = liverpool_leads.groupby("Venue", observed=True)["LeadHeld"].agg(["sum", "count"])
 conversion_summary["ConversionRate"] = (conversion_summary["sum"] / conversion_summary["count"]) * 100
 
 # Step 6: Print
@@ -1068,7 +967,7 @@ team_analysis["LeadingTeam"] = team_analysis.apply(
 )
 
 # Group by leading team and calculate conversion rate
-team_conversion = team_analysis.groupby("LeadingTeam")["LeadHeld"].agg(["sum", "count"])
+team_conversion = team_analysis.groupby("LeadingTeam", observed=True)["LeadHeld"].agg(["sum", "count"])
 team_conversion["ConversionRate"] = (team_conversion["sum"] / team_conversion["count"]) * 100
 # Top 10 teams by conversion rate
 top_10 = team_conversion.sort_values("ConversionRate", ascending=False).head(10)
@@ -1122,7 +1021,7 @@ liverpool_leads = team_analysis[
 ]
 
 # Group by Season to compute sum and total
-liverpool_season_conversion = liverpool_leads.groupby("Season")["LeadHeld"].agg(["sum", "count"])
+liverpool_season_conversion = liverpool_leads.groupby("Season", observed=True)["LeadHeld"].agg(["sum", "count"])
 liverpool_season_conversion["ConversionRate"] = (
     liverpool_season_conversion["sum"] / liverpool_season_conversion["count"]
 ) * 100
@@ -1158,7 +1057,7 @@ df_copy["TotalShots"] = df_copy["HomeShots"] + df_copy["AwayShots"]
 df_copy["WinMargin"] = abs(df_copy["FullTimeHomeGoals"] - df_copy["FullTimeAwayGoals"])
 
 # Step 2: Group by Season and calculate average
-attack_trend = df_copy.groupby("Season")[
+attack_trend = df_copy.groupby("Season", observed=True)[
     ["TotalGoals", "TotalShots", "WinMargin"]
 ].mean()
 attack_trend = attack_trend.sort_index()
@@ -1201,7 +1100,7 @@ liverpool_only["TotalShots"] = liverpool_only["HomeShots"] + liverpool_only["Awa
 liverpool_only["WinMargin"] = abs(liverpool_only["FullTimeHomeGoals"] - liverpool_only["FullTimeAwayGoals"])
 
 # Step 3: Group by season and calculate mean trends
-liverpool_trend = liverpool_only.groupby("Season")[["TotalGoals", "TotalShots", "WinMargin"]].mean()
+liverpool_trend = liverpool_only.groupby("Season", observed=True)[["TotalGoals", "TotalShots", "WinMargin"]].mean()
 liverpool_trend = liverpool_trend.sort_index()
 
 # Step 4: Plot
@@ -1225,7 +1124,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load your dataset (update filename if needed)
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Step 1: Filter only Liverpool games (home or away)
 liverpool_only = df[
@@ -1241,7 +1140,7 @@ liverpool_only["TotalShots"] = liverpool_only["HomeShots"] + liverpool_only["Awa
 liverpool_only["WinMargin"] = abs(liverpool_only["FullTimeHomeGoals"] - liverpool_only["FullTimeAwayGoals"])
 
 # Step 4: Group by Season and Venue
-grouped = liverpool_only.groupby(["Season", "Venue"])[["TotalGoals", "TotalShots", "WinMargin"]].mean().reset_index()
+grouped = liverpool_only.groupby(["Season", "Venue"], observed=True)[["TotalGoals", "TotalShots", "WinMargin"]].mean().reset_index()
 
 # Step 5: Pivot to prepare for plotting
 pivot_goals = grouped.pivot(index="Season", columns="Venue", values="TotalGoals")
@@ -1281,7 +1180,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load your data (update file name if needed)
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Step 1: Filter only Liverpool matches
 liverpool_df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1291,7 +1190,7 @@ liverpool_df["TotalGoals"] = liverpool_df["FullTimeHomeGoals"] + liverpool_df["F
 liverpool_df["TotalShots"] = liverpool_df["HomeShots"] + liverpool_df["AwayShots"]
 
 # Step 3: Group by Season and calculate averages
-attack_trend = liverpool_df.groupby("Season")[["TotalGoals", "TotalShots"]].mean()
+attack_trend = liverpool_df.groupby("Season", observed=True)[["TotalGoals", "TotalShots"]].mean()
 
 # Step 4: Calculate shot conversion rate (%)
 attack_trend["ShotConversion"] = (attack_trend["TotalGoals"] / attack_trend["TotalShots"]) * 100
@@ -1354,7 +1253,7 @@ df_copy["TotalFouls"] = df_copy["HomeFouls"] + df_copy["AwayFouls"]
 df_copy["TotalYellowCards"] = df_copy["HomeYellowCards"] + df_copy["AwayYellowCards"]
 df_copy["TotalRedCards"] = df_copy["HomeRedCards"] + df_copy["AwayRedCards"]
 
-physical_trends = df_copy.groupby("Season")[
+physical_trends = df_copy.groupby("Season", observed=True)[
     ["TotalFouls", "TotalYellowCards", "TotalRedCards"]
 ].mean()
 
@@ -1383,7 +1282,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load your dataset
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Step 1: Filter Liverpool matches
 liverpool_df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1394,7 +1293,7 @@ liverpool_df["TotalYellowCards"] = liverpool_df["HomeYellowCards"] + liverpool_d
 liverpool_df["TotalRedCards"] = liverpool_df["HomeRedCards"] + liverpool_df["AwayRedCards"]
 
 # Step 3: Group by season and calculate average per match
-physical_trends = liverpool_df.groupby("Season")[["TotalFouls", "TotalYellowCards", "TotalRedCards"]].mean()
+physical_trends = liverpool_df.groupby("Season", observed=True)[["TotalFouls", "TotalYellowCards", "TotalRedCards"]].mean()
 
 # Step 4: Plot
 fig, axes = plt.subplots(1, 3, figsize=(18, 6), sharex=True)
@@ -1424,23 +1323,10 @@ import matplotlib.pyplot as plt
 import pandas as pd
 
 # Load data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
-# Filter Liverpool games
-liverpool_df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
-
-# Define Venue
-liverpool_df["Venue"] = liverpool_df["HomeTeam"].apply(lambda x: "Home" if x == "Liverpool" else "Away")
-
-# Goals For/Against and Match Result
-liverpool_df["GoalsFor"] = liverpool_df.apply(
-    lambda row: row["FullTimeHomeGoals"] if row["Venue"] == "Home" else row["FullTimeAwayGoals"], axis=1)
-liverpool_df["GoalsAgainst"] = liverpool_df.apply(
-    lambda row: row["FullTimeAwayGoals"] if row["Venue"] == "Home" else row["FullTimeHomeGoals"], axis=1)
-liverpool_df["Result"] = liverpool_df.apply(
-    lambda row: "Win" if row["GoalsFor"] > row["GoalsAgainst"] else
-    ("Loss" if row["GoalsFor"] < row["GoalsAgainst"] else "Draw"), axis=1
-)
+# Filter Liverpool games with Venue, Goals For/Against and Match Result
+liverpool_df = enrich_matches(df)
 
 # Physical stats
 liverpool_df["Fouls"] = liverpool_df["HomeFouls"] + liverpool_df["AwayFouls"]
@@ -1477,10 +1363,10 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load data (replace with your actual DataFrame if already loaded)
-df_copy = pd.read_csv("epl_final.csv")
+df_copy = load_dataset("epl_final.csv")
 
 # Home discipline
-home_cards = df_copy.groupby("HomeTeam").agg(
+home_cards = df_copy.groupby("HomeTeam", observed=True).agg(
     HomeYellows=("HomeYellowCards", "sum"),
     HomeReds=("HomeRedCards", "sum"),
     HomeFouls=("HomeFouls", "sum"),
@@ -1488,7 +1374,7 @@ home_cards = df_copy.groupby("HomeTeam").agg(
 )
 
 # Away discipline
-away_cards = df_copy.groupby("AwayTeam").agg(
+away_cards = df_copy.groupby("AwayTeam", observed=True).agg(
     AwayYellows=("AwayYellowCards", "sum"),
     AwayReds=("AwayRedCards", "sum"),
     AwayFouls=("AwayFouls", "sum"),
@@ -1574,14 +1460,14 @@ df_reds["RedCardOutcome"] = df_reds.apply(red_card_outcome, axis=1)
 df_with_red = df_reds[df_reds["RedCardTeam"] != "No Red"]
  #Add percent for each red card team category
 summary = (
-    df_with_red.groupby(["RedCardTeam", "RedCardOutcome"])
+    df_with_red.groupby(["RedCardTeam", "RedCardOutcome"], observed=True)
     .size()
     .reset_index(name="MatchCount")
 )
 
 summary["Percentage"] = (
     summary["MatchCount"]
-    / summary.groupby("RedCardTeam")["MatchCount"].transform("sum")
+    / summary.groupby("RedCardTeam", observed=True)["MatchCount"].transform("sum")
     * 100
 )
 
@@ -1620,7 +1506,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter Liverpool matches
 df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1652,12 +1538,12 @@ df["LiverpoolResult"] = df.apply(lfc_result, axis=1)
 df_red_only = df[df["RedCardTo"] != "No Red"]
 
 # Aggregate
-summary = df_red_only.groupby(["RedCardTo", "LiverpoolResult"]).size().reset_index(name="MatchCount")
+summary = df_red_only.groupby(["RedCardTo", "LiverpoolResult"], observed=True).size().reset_index(name="MatchCount")
 
 # Percentage
 summary["Percentage"] = (
     summary["MatchCount"] /
-    summary.groupby("RedCardTo")["MatchCount"].transform("sum")
+    summary.groupby("RedCardTo", observed=True)["MatchCount"].transform("sum")
 ) * 100
 
 # Plot
@@ -1685,7 +1571,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter only Liverpool matches
 df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1734,7 +1620,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load dataset
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter Liverpool matches
 df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1799,8 +1685,8 @@ df_copy["GoalsConceded_Home"] = df_copy["FullTimeAwayGoals"]
 df_copy["GoalsConceded_Away"] = df_copy["FullTimeHomeGoals"]
 
 # Combine for each team
-home_def = df_copy.groupby("HomeTeam")[["ShotsFaced_Home", "GoalsConceded_Home"]].sum()
-away_def = df_copy.groupby("AwayTeam")[["ShotsFaced_Away", "GoalsConceded_Away"]].sum()
+home_def = df_copy.groupby("HomeTeam", observed=True)[["ShotsFaced_Home", "GoalsConceded_Home"]].sum()
+away_def = df_copy.groupby("AwayTeam", observed=True)[["ShotsFaced_Away", "GoalsConceded_Away"]].sum()
 
 # Total shots faced and goals conceded
 team_def = home_def.join(away_def, how="outer").fillna(0)
@@ -1819,8 +1705,8 @@ team_def["ConcededPerShot"] = (
 # Count draws at home and away
 df_copy["IsDraw"] = df_copy["FullTimeResult"] == "D"
 draws = (
-    df_copy.groupby("HomeTeam")["IsDraw"].sum()
-    + df_copy.groupby("AwayTeam")["IsDraw"].sum()
+    df_copy.groupby("HomeTeam", observed=True)["IsDraw"].sum()
+    + df_copy.groupby("AwayTeam", observed=True)["IsDraw"].sum()
 )
 draws = draws.sort_values(ascending=False)
 
@@ -1841,7 +1727,7 @@ df_copy["HomeWin"] = (df_copy["FullTimeResult"] == "H").astype(int)
 df_copy["AwayWin"] = (df_copy["FullTimeResult"] == "A").astype(int)
 
 # 2. Group home stats
-home_stats = df_copy.groupby("HomeTeam").agg(
+home_stats = df_copy.groupby("HomeTeam", observed=True).agg(
     Goals_Home=("FullTimeHomeGoals", "sum"),
     Shots_Home=("HomeShots", "sum"),
     ShotsOnTarget_Home=("HomeShotsOnTarget", "sum"),
@@ -1853,7 +1739,7 @@ home_stats = df_copy.groupby("HomeTeam").agg(
 )
 
 # 3. Group away stats
-away_stats = df_copy.groupby("AwayTeam").agg(
+away_stats = df_copy.groupby("AwayTeam", observed=True).agg(
     Goals_Away=("FullTimeAwayGoals", "sum"),
     Shots_Away=("AwayShots", "sum"),
     ShotsOnTarget_Away=("AwayShotsOnTarget", "sum"),
@@ -1918,25 +1804,13 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
-# Filter Liverpool matches
-lfc_df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
-
-# Add Venue column
-lfc_df["Venue"] = lfc_df["HomeTeam"].apply(lambda x: "Home" if x == "Liverpool" else "Away")
-
-# Determine match result from Liverpool's perspective
-def get_result(row):
-    if row["HomeTeam"] == "Liverpool":
-        return "Win" if row["FullTimeResult"] == "H" else "Draw" if row["FullTimeResult"] == "D" else "Loss"
-    else:
-        return "Win" if row["FullTimeResult"] == "A" else "Draw" if row["FullTimeResult"] == "D" else "Loss"
-
-lfc_df["Result"] = lfc_df.apply(get_result, axis=1)
+# Filter Liverpool matches with Venue and Result from Liverpool's perspective
+lfc_df = enrich_matches(df)
 
 # Calculate win ratios for each venue
-venue_stats = lfc_df.groupby("Venue")["Result"].value_counts().unstack().fillna(0)
+venue_stats = lfc_df.groupby("Venue", observed=True)["Result"].value_counts().unstack().fillna(0)
 venue_stats["Total"] = venue_stats.sum(axis=1)
 venue_stats["Win Ratio"] = venue_stats["Win"] / venue_stats["Total"]
 
@@ -1962,19 +1836,18 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load your data
-match_infos = pd.read_csv("match_infos_EPL_1920.csv")
-rosters = pd.read_csv("rosters_EPL_1920.csv")
-shots = pd.read_csv("shots_EPL_1920.csv")
+match_infos = load_dataset("match_infos_EPL_1920.csv")
+rosters = load_dataset("rosters_EPL_1920.csv")
+shots = load_dataset("shots_EPL_1920.csv")
 
-# Filter Liverpool-related data
-liverpool_matches = match_infos[(match_infos['team_h'] == 'Liverpool') | (match_infos['team_a'] == 'Liverpool')].copy()
+# Filter Liverpool-related data (matches get Venue, GoalsFor/Against and Result)
+liverpool_matches = enrich_matches(match_infos)
 liverpool_rosters = rosters[rosters['team_id'] == 87].copy()
 liverpool_shots = shots[(shots['h_team'] == 'Liverpool') | (shots['a_team'] == 'Liverpool')].copy()
 
 # Date processing
-liverpool_matches["date"] = pd.to_datetime(liverpool_matches["date"])
 liverpool_shots["date"] = pd.to_datetime(liverpool_shots["date"])
-liverpool_shots["Venue"] = liverpool_shots.apply(lambda row: "Home" if row["h_team"] == "Liverpool" else "Away", axis=1)
+liverpool_shots["Venue"] = liverpool_shots["h_team"].eq("Liverpool").map({True: "Home", False: "Away"})
 liverpool_shots["isGoal"] = liverpool_shots["result"] == "Goal"
 
 
@@ -1990,7 +1863,7 @@ for ax, df, title in zip(axes, [liverpool_shots[liverpool_shots["Venue"]=="Home"
 plt.tight_layout()
 
 # ---- Plot 43 ----
-shot_types = liverpool_shots.groupby(["Venue", "shotType"])["id"].count().unstack().fillna(0)
+shot_types = liverpool_shots.groupby(["Venue", "shotType"], observed=True)["id"].count().unstack().fillna(0)
 shot_types.T.plot(kind='bar', figsize=(12, 6))
 plt.title("Liverpool Shot Types: Home vs Away")
 plt.ylabel("Number of Shots")
@@ -1999,7 +1872,7 @@ plt.show()
 
 
 # ---- Plot 44 ----
-situations = liverpool_shots.groupby(["Venue", "situation"])["id"].count().unstack().fillna(0)
+situations = liverpool_shots.groupby(["Venue", "situation"], observed=True)["id"].count().unstack().fillna(0)
 situations.T.plot(kind='bar', figsize=(12, 6))
 plt.title("Shot Situations: Home vs Away")
 plt.ylabel("Number of Shots")
@@ -2008,8 +1881,8 @@ plt.show()
 
 
 # ---- Plot 45 ----
-home_xg = liverpool_shots[liverpool_shots["Venue"] == "Home"].groupby("player")["xG"].sum().sort_values(ascending=False).head(5)
-away_xg = liverpool_shots[liverpool_shots["Venue"] == "Away"].groupby("player")["xG"].sum().sort_values(ascending=False).head(5)
+home_xg = liverpool_shots[liverpool_shots["Venue"] == "Home"].groupby("player", observed=True)["xG"].sum().sort_values(ascending=False).head(5)
+away_xg = liverpool_shots[liverpool_shots["Venue"] == "Away"].groupby("player", observed=True)["xG"].sum().sort_values(ascending=False).head(5)
 
 fig, axs = plt.subplots(1, 2, figsize=(16, 5))
 sns.barplot(x=home_xg.values, y=home_xg.index, ax=axs[0])
@@ -2030,7 +1903,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load the dataset
-shots = pd.read_csv("shots_EPL_1920.csv")
+shots = load_dataset("shots_EPL_1920.csv")
 
 # Filter Liverpool shots
 liverpool_shots = shots[(shots["h_team"] == "Liverpool") | (shots["a_team"] == "Liverpool")].copy()
@@ -2040,31 +1913,13 @@ liverpool_shots["Venue"] = liverpool_shots.apply(
     lambda row: "Home" if row["h_team"] == "Liverpool" else "Away", axis=1
 )
 
-# Plotting heatmaps
-fig, axes = plt.subplots(1, 2, figsize=(18, 7))
-
-for ax, venue in zip(axes, ["Home", "Away"]):
-    subset = liverpool_shots[liverpool_shots["Venue"] == venue]
-    sns.kdeplot(
-        data=subset,
-        x="X",
-        y="Y",
-        fill=True,
-        thresh=0,
-        levels=100,
-        cmap="Reds",
-        ax=ax
-    )
-    ax.set_title(f"Liverpool Shot Density – {venue} Matches")
-    ax.set_xlim(0.7, 1.05)
-    ax.set_ylim(0.2, 0.9)
-    ax.set_aspect('equal')
-    ax.invert_yaxis()
-    ax.set_xlabel("Normalized X (Goal on the Right)")
-    ax.set_ylabel("Normalized Y (Pitch Height)")
-
-plt.tight_layout()
-plt.show()
+# Plotting heatmaps (shared pitch grid and colour scale)
+fig = density_panels(
+    [(f"Liverpool Shot Density – {venue} Matches", liverpool_shots[liverpool_shots["Venue"] == venue])
+     for venue in ["Home", "Away"]],
+    shared_scale=True
+)
+fig.show()
 
 
 # ---- Plot 47 ----
@@ -2073,7 +1928,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load shot data
-shots = pd.read_csv("shots_EPL_1920.csv")
+shots = load_dataset("shots_EPL_1920.csv")
 
 # Filter Liverpool shots
 liverpool_shots = shots[(shots["h_team"] == "Liverpool") | (shots["a_team"] == "Liverpool")].copy()
@@ -2088,33 +1943,14 @@ key_players = ["Mohamed Salah", "Roberto Firmino"]
 player_shots = liverpool_shots[liverpool_shots["player"].isin(key_players)]
 
 # Plot: 2x2 grid (Home vs Away for each player)
-fig, axes = plt.subplots(2, 2, figsize=(16, 12), sharex=True, sharey=True)
-
-for i, player in enumerate(key_players):
-    for j, venue in enumerate(["Home", "Away"]):
-        subset = player_shots[(player_shots["player"] == player) & (player_shots["Venue"] == venue)]
-        ax = axes[i][j]
-        sns.kdeplot(
-            data=subset,
-            x="X",
-            y="Y",
-            fill=True,
-            thresh=0,
-            levels=100,
-            cmap="Reds",
-            ax=ax
-        )
-        ax.set_title(f"{player} – {venue} Matches", fontsize=12)
-        ax.set_xlim(0.7, 1.05)
-        ax.set_ylim(0.2, 0.9)
-        ax.set_aspect('equal')
-        ax.invert_yaxis()
-        ax.set_xlabel("Normalized X")
-        ax.set_ylabel("Normalized Y")
-
-plt.suptitle("Shot Density Heatmap: Mohamed Salah vs Roberto Firmino (Home & Away)", fontsize=16)
-plt.tight_layout(rect=[0, 0, 1, 0.96])
-plt.show()
+fig = density_panels(
+    [(f"{player} – {venue} Matches",
+      player_shots[(player_shots["player"] == player) & (player_shots["Venue"] == venue)])
+     for player in key_players for venue in ["Home", "Away"]],
+    title="Shot Density Heatmap: Mohamed Salah vs Roberto Firmino (Home & Away)",
+    shared_scale=True
+)
+fig.show()
 
 
 # ---- Timeline Plot 1 ----
@@ -2166,7 +2002,7 @@ fig1.update_layout(
     height=700
 )
 
-fig1.write_image("plot_xg_vs_xga_horizontal.png", scale=3)
+# 💾 "plot_xg_vs_xga_horizontal.png" is exported by export_figures.py
 fig1.show()
 
 # ===============================
@@ -2191,7 +2027,7 @@ fig2.update_layout(
     height=600
 )
 
-fig2.write_image("plot_xg_vs_xga_grouped.png", scale=3)
+# 💾 "plot_xg_vs_xga_grouped.png" is exported by export_figures.py
 fig2.show()
 
 # ===============================
@@ -2232,7 +2068,7 @@ fig3.update_layout(
     height=800
 )
 
-fig3.write_image("plot_xg_vs_xga_dotplot.png", scale=3)
+# 💾 "plot_xg_vs_xga_dotplot.png" is exported by export_figures.py
 fig3.show()
 
 
@@ -2274,8 +2110,7 @@ fig.update_layout(
 # ✅ Show interactive chart
 fig.show()
 
-# ✅ Save as PNG (requires kaleido)
-fig.write_image("delta_xg_bar.png", scale=3)
+# 💾 "delta_xg_bar.png" is exported by export_figures.py
 
 
 # ---- Timeline Plot 4 ----
@@ -2283,7 +2118,7 @@ fig.write_image("delta_xg_bar.png", scale=3)
 import plotly.express as px
 
 
-stats_df = pd.read_csv("stats.csv")
+stats_df = load_dataset("stats.csv")
 
 # Filter only Liverpool data
 liverpool_stats = stats_df[stats_df['team'] == 'Liverpool']
@@ -2313,8 +2148,7 @@ fig.update_layout(
     margin=dict(l=60, r=60, t=80, b=60)  # Prevent cropping
 )
 
-# 📏 Save with larger dimensions
-fig.write_image("Liverpool Performance by Season.png", width=1000, height=600)
+# 💾 "Liverpool Performance by Season.png" is exported by export_figures.py
 
 # Show the chart
 fig.show()
@@ -2326,7 +2160,7 @@ import pandas as pd
 import plotly.express as px
 
 # Load manager data
-managers_df = pd.read_csv("liverpoolfc_managers.csv", sep=';')
+managers_df = load_dataset("liverpoolfc_managers.csv", sep=';')
 
 # Convert date strings
 managers_df['From'] = pd.to_datetime(managers_df['From'])
@@ -2361,7 +2195,7 @@ fig.update_layout(
 )
 
 fig.show()
-fig.write_image("manager.png")
+# 💾 "manager.png" is exported by export_figures.py
 
 # ---- Timeline Plot 6 ----
 
@@ -2369,7 +2203,7 @@ import pandas as pd
 import plotly.express as px
 
 # Load manager data
-managers_df = pd.read_csv("liverpoolfc_managers.csv", sep=';')
+managers_df = load_dataset("liverpoolfc_managers.csv", sep=';')
 
 # Convert date strings
 managers_df['From'] = pd.to_datetime(managers_df['From'])
@@ -2402,7 +2236,7 @@ fig1.update_layout(
     yaxis_title='Win Percentage (%)',
     hovermode='x unified'
 )
-fig1.write_image("liverpool_managers_win_trend.png", width=1000, height=600)
+# 💾 "liverpool_managers_win_trend.png" is exported by export_figures.py
 fig1.show()
 
 # 🔵 Plot 2: Win % vs Games Managed (Bubble = Tenure)
@@ -2426,7 +2260,7 @@ fig2.update_layout(
     yaxis_title='Win Percentage (%)',
     hovermode='closest'
 )
-fig2.write_image("liverpool_managers_bubble.png", width=1000, height=600)
+# 💾 "liverpool_managers_bubble.png" is exported by export_figures.py
 fig2.show()
 
 # 🥧 Plot 3: Share of Total Matches Managed
@@ -2447,15 +2281,13 @@ fig3.update_layout(
     title_font=dict(size=22),
     margin=dict(l=60, r=60, t=80, b=60)
 )
-fig3.write_image("liverpool_managers_pie.png", width=800, height=600)
+# 💾 "liverpool_managers_pie.png" is exported by export_figures.py
 fig3.show()
 
 
 # ---- Timeline Plot 7 ----
-liverpool_matches["Liverpool Goals"] = liverpool_matches.apply(
-    lambda row: row["h_goals"] if row["team_h"] == "Liverpool" else row["a_goals"], axis=1)
-liverpool_matches["Opponent Goals"] = liverpool_matches.apply(
-    lambda row: row["a_goals"] if row["team_h"] == "Liverpool" else row["h_goals"], axis=1)
+liverpool_matches["Liverpool Goals"] = liverpool_matches["GoalsFor"]
+liverpool_matches["Opponent Goals"] = liverpool_matches["GoalsAgainst"]
 
 plt.figure(figsize=(14, 5))
 plt.plot(liverpool_matches["date"], liverpool_matches["Liverpool Goals"], label="Liverpool Goals", marker="o")
@@ -2480,10 +2312,10 @@ import plotly.io as pio
 pio.renderers.default = 'notebook'  # or 'iframe', 'svg' if needed
 
 # 📂 Load dataset
-df = pd.read_csv('EPL_result.csv')
+df = load_dataset('EPL_result.csv')
 
 # 🧮 Group by home team: average xG and actual goals
-home_stats = df.groupby('Home').agg(
+home_stats = df.groupby('Home', observed=True).agg(
     Avg_xG_Home=('xG_Home', 'mean'),
     Avg_G_Home=('G_Home', 'mean')
 ).reset_index()
@@ -2537,6 +2369,5 @@ home_stats_melted.sort_values(by='Goals', ascending=False, inplace=True)
 # ✅ Show plot
 fig.show()
 
-# 💾 Save as PNG (requires kaleido)
-pio.write_image(fig, "home_xg_vs_goals_liverpool_highlight.png", width=1200, height=700)
+# 💾 "home_xg_vs_goals_liverpool_highlight.png" is exported by export_figures.py
 
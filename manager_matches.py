@@ -0,0 +1,113 @@
+"""Liverpool's Premier League matches joined onto manager tenures.
+
+The Manager Era tab only had the career totals in ``liverpoolfc_managers.csv``
+(all competitions since 1892), so anything split by venue, form or xG was
+approximated from those totals. ``manager_matches`` attaches the manager in
+charge to every Liverpool row of ``team_match_table`` with one sorted-interval
+lookup over the tenures (``eras.manager_eras``), adds the understat xG where
+it exists (2019-20) and a rolling points form that restarts with each spell.
+``manager_summary`` aggregates those rows per manager, so the tab can slice by
+manager the same way it slices by season.
+
+Matches in a gap between two tenures (caretakers not in the file) or after
+the last one have no manager and are left out of the summary.
+"""
+import numpy as np
+import pandas as pd
+
+from data_registry import derived_table
+from eras import MANAGERS_PATH, era_labels, manager_eras
+from team_match_table import (SOURCES as TEAM_MATCH_SOURCES, XG_PATH, team_match_table, team_match_xg,
+                              team_matches)
+
+TEAM = "Liverpool"
+FORM_WINDOW = 5
+
+
+def build_manager_matches(team=TEAM):
+    """Build the manager-tagged match rows (uncached; see ``manager_matches``)."""
+    rows = team_matches(team).sort_values("Date", kind="stable").reset_index(drop=True)
+    rows["Manager"] = era_labels(rows["Date"], manager_eras())
+
+    xg = team_match_xg()
+    rows = rows.merge(xg[xg["Team"] == team].drop(columns="Team"), on="Date", how="left")
+
+    # A spell is a run of consecutive matches under one manager; form restarts with each
+    codes = rows["Manager"].cat.codes.to_numpy()
+    spell = np.concatenate([[0], np.cumsum(codes[1:] != codes[:-1])])
+    rows["Spell"] = spell
+    rows["SpellMatch"] = rows.groupby(spell).cumcount() + 1
+    rows["Form"] = (rows.groupby(spell)["Points"]
+                    .rolling(FORM_WINDOW, min_periods=1).mean()
+                    .reset_index(level=0, drop=True))
+    return rows
+
+
+def manager_matches(team=TEAM):
+    """Return the shared manager-tagged rows of ``team``, rebuilt when a source changes.
+
+    One row per match from ``team``'s side, as in ``team_match_table``, plus
+    Manager (categorical, NaN outside a tenure), xGFor/xGAgainst (NaN outside
+    the understat season), Spell, SpellMatch and Form (points per game over
+    the last ``FORM_WINDOW`` matches of the spell). Treat as read-only.
+    """
+    sources = [*TEAM_MATCH_SOURCES.values(), MANAGERS_PATH, XG_PATH]
+    return derived_table(f"manager_matches:{team}", sources, lambda: build_manager_matches(team))
+
+
+def _league_home_wins():
+    """Home-win indicator of every league match, indexed by date (sorted)."""
+    home = team_match_table()
+    home = home[home["Venue"] == "Home"]
+    return pd.Series((home["Result"] == "Win").to_numpy(dtype=int),
+                     index=pd.DatetimeIndex(home["Date"])).sort_index(kind="stable")
+
+
+def manager_summary(min_matches=1, team=TEAM):
+    """Per-manager league record of ``team`` from the match rows, in order of appointment.
+
+    Columns: Manager, First/Last (match dates), Matches, Wins, Draws, Losses,
+    Win_Rate, PPG, Home_Win_Rate, Away_Win_Rate, Home_PPG, Away_PPG,
+    GoalsFor/GoalsAgainst (per match), ShotsFor/ShotsAgainst (per match, where
+    the source has shots), xGFor/xGAgainst (per match, understat season only),
+    Best_Form, Worst_Form and Final_Form (``FORM_WINDOW``-match PPG), and
+    League_Home_Win_Rate, the whole league's home win rate over the same dates.
+    """
+    rows = manager_matches(team)
+    rows = rows[rows["Manager"].notna()]
+    rows = rows.assign(Wins=rows["Result"] == "Win", Draws=rows["Result"] == "Draw",
+                       Losses=rows["Result"] == "Loss")
+
+    summary = rows.groupby("Manager", observed=True).agg(
+        First=("Date", "min"), Last=("Date", "max"), Matches=("Result", "size"),
+        Wins=("Wins", "sum"), Draws=("Draws", "sum"), Losses=("Losses", "sum"),
+        PPG=("Points", "mean"),
+        GoalsFor=("GoalsFor", "mean"), GoalsAgainst=("GoalsAgainst", "mean"),
+        ShotsFor=("ShotsFor", "mean"), ShotsAgainst=("ShotsAgainst", "mean"),
+        xGFor=("xGFor", "mean"), xGAgainst=("xGAgainst", "mean"),
+        Best_Form=("Form", "max"), Worst_Form=("Form", "min"), Final_Form=("Form", "last"),
+    )
+    summary["Win_Rate"] = summary["Wins"] / summary["Matches"] * 100
+    venues = rows.groupby(["Manager", "Venue"], observed=True).agg(
+        Win_Rate=("Wins", "mean"), PPG=("Points", "mean")).unstack("Venue")
+    for venue in ("Home", "Away"):
+        summary[f"{venue}_Win_Rate"] = venues[("Win_Rate", venue)] * 100
+        summary[f"{venue}_PPG"] = venues[("PPG", venue)]
+
+    # League-wide home win rate over each manager's first to last match, from prefix sums
+    league = _league_home_wins()
+    dates = league.index.to_numpy()
+    cumulative = np.concatenate([[0], np.cumsum(league.to_numpy())])
+    lo = np.searchsorted(dates, summary["First"].to_numpy(), side="left")
+    hi = np.searchsorted(dates, summary["Last"].to_numpy(), side="right")
+    summary["League_Home_Win_Rate"] = (cumulative[hi] - cumulative[lo]) / np.maximum(hi - lo, 1) * 100
+
+    summary = summary[summary["Matches"] >= min_matches].sort_values("First")
+    summary.index = summary.index.astype(str)
+    return summary.reset_index()
+
+
+if __name__ == "__main__":
+    rows = manager_matches()
+    print(f"✅ {len(rows):,} {TEAM} matches, {rows['Manager'].notna().sum():,} under a listed manager")
+    print(manager_summary().to_string(index=False, float_format="{:.2f}".format))
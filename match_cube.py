@@ -0,0 +1,187 @@
+"""Pre-aggregated cube of match results over team, season, venue, result and era.
+
+Most charts in the venue, COVID, momentum, attacking and discipline tabs are a
+groupby of the match rows over some of Season, Venue, Result, CovidPeriod and
+team, summing goals, shots, fouls, cards or corners. ``MatchCube`` stores every
+match from both teams' perspectives once, aggregated to one cell per
+``(Team, Season, Venue, Result, CovidPeriod)`` with additive measures only, so
+any such chart is a roll-up of the cells instead of a pass over the raw rows.
+Averages are derived from the sums and ``Matches``.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_mirror import REPO_DIR
+from data_registry import derived_table, load_dataset
+from eras import era_labels
+from match_enrichment import MATCH_LAYOUTS, RESULT_LABELS, RESULT_POINTS, season_label
+
+# dataset name -> (file, match layout in match_enrichment)
+DATASETS = {
+    "epl_final": (os.path.join(REPO_DIR, "epl_final.csv"), "epl_final"),
+    "liverpool_matches": (os.path.join(REPO_DIR, "Liverpool_2015_2023_Matches.csv"), "matches"),
+    "premier_league": (os.path.join(REPO_DIR, "premier-league-matches.csv"), "matches"),
+}
+
+DIMENSIONS = ("Team", "Season", "Venue", "Result", "CovidPeriod")
+
+# Per-team statistics as (home column, away column); only epl_final has them
+STAT_COLUMNS = {
+    "Shots": ("HomeShots", "AwayShots"),
+    "ShotsOnTarget": ("HomeShotsOnTarget", "AwayShotsOnTarget"),
+    "Corners": ("HomeCorners", "AwayCorners"),
+    "Fouls": ("HomeFouls", "AwayFouls"),
+    "YellowCards": ("HomeYellowCards", "AwayYellowCards"),
+    "RedCards": ("HomeRedCards", "AwayRedCards"),
+}
+
+
+def _team_rows(matches, layout):
+    """Both perspectives of every match, with the dimensions and additive measures."""
+    spec = MATCH_LAYOUTS[layout]
+    dates = pd.to_datetime(matches[spec["date"]], format=spec.get("date_format"),
+                           dayfirst=spec.get("dayfirst", False))
+    if "season" in spec:
+        seasons = matches[spec["season"]].astype(str).to_numpy()
+    else:
+        seasons = season_label(matches[spec["season_end_year"]].to_numpy() - 1)
+    home_goals = matches[spec["home_goals"]].to_numpy(dtype=int)
+    away_goals = matches[spec["away_goals"]].to_numpy(dtype=int)
+
+    rows = []
+    for venue, side, other in (("Home", 0, 1), ("Away", 1, 0)):
+        teams = (matches[spec["home"]], matches[spec["away"]])
+        goals = (home_goals, away_goals)
+        goal_difference = goals[side] - goals[other]
+        outcome = np.sign(goal_difference) + 1
+        frame = pd.DataFrame({
+            "Team": teams[side].astype(str).to_numpy(),
+            "Season": seasons,
+            "Venue": venue,
+            "Result": RESULT_LABELS[outcome],
+            "CovidPeriod": era_labels(dates, "covid"),
+            "Matches": 1,
+            "Wins": (outcome == 2).astype(int),
+            "Draws": (outcome == 1).astype(int),
+            "Losses": (outcome == 0).astype(int),
+            "Points": RESULT_POINTS[outcome],
+            "GoalsFor": goals[side],
+            "GoalsAgainst": goals[other],
+            "CleanSheets": (goals[other] == 0).astype(int),
+            "WinMargin": np.abs(goal_difference),
+        })
+        for stat, columns in STAT_COLUMNS.items():
+            if all(column in matches.columns for column in columns):
+                frame[f"{stat}For"] = matches[columns[side]].to_numpy(dtype=float)
+                frame[f"{stat}Against"] = matches[columns[other]].to_numpy(dtype=float)
+        rows.append(frame)
+    return pd.concat(rows, ignore_index=True)
+
+
+class MatchCube:
+    """Additive measures summed per ``(Team, Season, Venue, Result, CovidPeriod)`` cell.
+
+    Each dimension is stored as integer codes into ``labels[dimension]``
+    (sorted; ``CovidPeriod`` in era order), so a roll-up is a ``bincount`` over the cells.
+    """
+
+    def __init__(self, matches, layout):
+        rows = _team_rows(matches, layout)
+        self.measures = [column for column in rows.columns if column not in DIMENSIONS]
+        cells = rows.groupby(list(DIMENSIONS), observed=True, sort=True)[self.measures].sum().reset_index()
+        self.labels = {}
+        self.codes = {}
+        for dimension in DIMENSIONS:
+            self.codes[dimension], self.labels[dimension] = pd.factorize(cells[dimension], sort=True)
+        self.values = cells[self.measures].to_numpy(dtype=float)
+        self.rows = len(rows)
+
+    def _mask(self, filters):
+        mask = np.ones(len(self.values), dtype=bool)
+        for dimension, wanted in filters.items():
+            wanted = [wanted] if isinstance(wanted, str) or not np.iterable(wanted) else list(wanted)
+            mask &= np.isin(self.codes[dimension], self.labels[dimension].get_indexer(wanted))
+        return mask
+
+    def rollup(self, by=(), measures=None, per_match=False, **filters):
+        """Sum ``measures`` (default: all) grouped by the ``by`` dimensions.
+
+        Keyword ``filters`` slice the cube first, e.g. ``Team="Liverpool"`` or
+        ``Venue=["Home"]``. With ``per_match`` every measure but ``Matches`` is
+        divided by ``Matches``. Rows are sorted by the ``by`` labels and only
+        non-empty groups are returned.
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        measures = self.measures if measures is None else list(measures)
+        columns = [self.measures.index(measure) for measure in measures]
+        mask = self._mask(filters)
+        values = self.values[mask]
+        matches = values[:, self.measures.index("Matches")]
+
+        if by:
+            shape = tuple(len(self.labels[dimension]) for dimension in by)
+            flat = np.ravel_multi_index(tuple(self.codes[dimension][mask] for dimension in by), shape)
+            groups, inverse = np.unique(flat, return_inverse=True)
+            index = np.unravel_index(groups, shape)
+            result = pd.DataFrame({
+                dimension: self.labels[dimension][codes] for dimension, codes in zip(by, index)
+            })
+        else:
+            inverse = np.zeros(len(values), dtype=int)
+            result = pd.DataFrame(index=range(1 if len(values) else 0))
+
+        counts = np.bincount(inverse, weights=matches, minlength=len(result))
+        for measure, column in zip(measures, columns):
+            sums = np.bincount(inverse, weights=values[:, column], minlength=len(result))
+            if per_match and measure != "Matches":
+                sums = sums / counts
+            elif measure in ("Matches", "Wins", "Draws", "Losses", "Points", "GoalsFor",
+                             "GoalsAgainst", "CleanSheets", "WinMargin"):
+                sums = sums.astype(int)
+            result[measure] = sums
+        return result
+
+    def match_averages(self, by=(), **filters):
+        """Per-match averages of both teams' combined goals, shots, fouls and cards.
+
+        Each match appears once per team in the cube with the same totals, so
+        these equal the averages over the match rows themselves.
+        """
+        rolled = self.rollup(by, **filters)
+        result = rolled[[dimension for dimension in ([by] if isinstance(by, str) else by)]].copy()
+        matches = rolled["Matches"]
+        result["TotalGoals"] = (rolled["GoalsFor"] + rolled["GoalsAgainst"]) / matches
+        result["WinMargin"] = rolled["WinMargin"] / matches
+        for stat in STAT_COLUMNS:
+            if f"{stat}For" in rolled:
+                result[f"Total{stat}"] = (rolled[f"{stat}For"] + rolled[f"{stat}Against"]) / matches
+        if "TotalYellowCards" in result and "TotalRedCards" in result:
+            result["TotalCards"] = result["TotalYellowCards"] + result["TotalRedCards"]
+        return result
+
+
+def match_cube(dataset="epl_final", teams=None):
+    """Return the shared ``MatchCube`` of a ``DATASETS`` entry, rebuilt when its file changes.
+
+    With ``teams`` only matches between two of those teams are included.
+    """
+    path, layout = DATASETS[dataset]
+    key = f"match_cube:{dataset}:{sorted(teams) if teams is not None else None}"
+
+    def build():
+        df = load_dataset(path)
+        if teams is not None:
+            spec = MATCH_LAYOUTS[layout]
+            df = df[df[spec["home"]].isin(teams) & df[spec["away"]].isin(teams)]
+        return MatchCube(df, layout)
+
+    return derived_table(key, [path], build)
+
+
+if __name__ == "__main__":
+    for name in DATASETS:
+        cube = match_cube(name)
+        print(f"✅ {name}: {cube.rows:,} team-match rows -> {len(cube.values):,} cells, "
+              f"{len(cube.measures)} measures")
@@ -0,0 +1,95 @@
+"""Vectorized team-perspective enrichment of match results.
+
+The dashboards used to derive Venue, Result, GoalsFor, GoalsAgainst, Points and
+Season with ``df.apply(..., axis=1)``. ``enrich_matches`` computes the same
+columns with array operations for any team, on any of the match layouts below.
+"""
+import numpy as np
+import pandas as pd
+
+# Column names of each match file, keyed by a short layout name
+MATCH_LAYOUTS = {
+    # Liverpool_2015_2023_Matches.csv and premier-league-matches.csv
+    "matches": {
+        "home": "Home", "away": "Away",
+        "home_goals": "HomeGoals", "away_goals": "AwayGoals",
+        "date": "Date", "season_end_year": "Season_End_Year",
+    },
+    # EPL_Set.csv (dates are dd/mm/yy and dd/mm/yyyy mixed)
+    "epl_set": {
+        "home": "HomeTeam", "away": "AwayTeam",
+        "home_goals": "FTHG", "away_goals": "FTAG",
+        "date": "Date", "season": "Season", "date_format": "mixed", "dayfirst": True,
+    },
+    # epl_final.csv
+    "epl_final": {
+        "home": "HomeTeam", "away": "AwayTeam",
+        "home_goals": "FullTimeHomeGoals", "away_goals": "FullTimeAwayGoals",
+        "date": "MatchDate", "season": "Season",
+    },
+    # match_infos_EPL_1920.csv (season is the starting year, e.g. 2019)
+    "match_infos": {
+        "home": "team_h", "away": "team_a",
+        "home_goals": "h_goals", "away_goals": "a_goals",
+        "date": "date", "season_start_year": "season",
+    },
+}
+
+RESULT_LABELS = np.array(["Loss", "Draw", "Win"])
+RESULT_POINTS = np.array([0, 1, 3])
+
+
+def detect_layout(df):
+    """Return the name of the first layout whose columns are all present in ``df``."""
+    for name, layout in MATCH_LAYOUTS.items():
+        columns = [v for k, v in layout.items() if k not in ("date_format", "dayfirst")]
+        if all(col in df.columns for col in columns):
+            return name
+    raise ValueError(f"Unrecognised match layout with columns: {list(df.columns)}")
+
+
+def season_label(start_year):
+    """Format season start years as '2019-20' labels."""
+    years = pd.Series(np.asarray(start_year, dtype=int))
+    labels = {year: f"{year}-{(year + 1) % 100:02d}" for year in years.unique()}
+    return years.map(labels).to_numpy()
+
+
+def enrich_matches(df, team="Liverpool", layout=None, team_matches_only=True):
+    """Add team-perspective columns to a frame of matches.
+
+    Adds Date (parsed), Venue, Opponent, GoalsFor, GoalsAgainst, GoalDifference,
+    Result, Points and, when the layout has no season label of its own, Season.
+    With ``team_matches_only`` the frame is first restricted to ``team``'s
+    matches; otherwise rows not involving ``team`` are labelled from the away
+    side, as the old row-wise code did.
+    """
+    spec = MATCH_LAYOUTS[layout or detect_layout(df)]
+    home_col, away_col = spec["home"], spec["away"]
+
+    if team_matches_only:
+        df = df[(df[home_col] == team) | (df[away_col] == team)]
+    df = df.copy()
+
+    is_home = (df[home_col] == team).to_numpy()
+    home_goals = df[spec["home_goals"]].to_numpy()
+    away_goals = df[spec["away_goals"]].to_numpy()
+
+    df[spec["date"]] = pd.to_datetime(
+        df[spec["date"]], format=spec.get("date_format"), dayfirst=spec.get("dayfirst", False)
+    )
+    df["Venue"] = np.where(is_home, "Home", "Away")
+    df["Opponent"] = np.where(is_home, df[away_col].to_numpy(), df[home_col].to_numpy())
+    df["GoalsFor"] = np.where(is_home, home_goals, away_goals)
+    df["GoalsAgainst"] = np.where(is_home, away_goals, home_goals)
+    df["GoalDifference"] = df["GoalsFor"] - df["GoalsAgainst"]
+
+    outcome = np.sign(df["GoalDifference"].to_numpy()).astype(int) + 1
+    df["Result"] = RESULT_LABELS[outcome]
+    df["Points"] = RESULT_POINTS[outcome]
+
+    if "season_end_year" in spec:
+        df["Season"] = season_label(df[spec["season_end_year"]].to_numpy() - 1)
+    elif "season_start_year" in spec:
+        df["Season"] = season_label(df[spec["season_start_year"]].to_numpy())
+    return df
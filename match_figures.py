@@ -0,0 +1,295 @@
+"""Per-match figures for the Dash match dashboard, built on demand.
+
+``dashboard/app.py`` reads its figures from a dict of
+``match label -> {"shot_map", "xg", "heatmap", "player_stats", "tactical"}``.
+Building that eagerly for every 2019-20 match would take minutes and hold
+hundreds of figures in memory. ``MatchFigureRegistry`` has the same read-only
+mapping interface, but its keys come from the match index alone and a match's
+figures are only built the first time it is looked up. The figures of the
+``max_matches`` most recently used matches are kept; older ones are dropped and
+rebuilt if requested again.
+
+When ``CALLBACK_CACHE_DIR`` is set (see ``callback_cache``), built figures are
+also memoised there by match id and data version, so worker processes share
+them; that cache is bounded to ``MAX_MATCHES`` entries as well.
+"""
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+import numpy as np
+import plotly.graph_objects as go
+
+from callback_cache import FileCache, memoize_callback
+from data_mirror import REPO_DIR
+from data_registry import dataset_version, load_dataset
+from match_store import match_rosters, match_shots
+from shot_density import density_panels
+
+MATCH_INFOS_PATH = os.path.join(REPO_DIR, "match_infos_EPL_1920.csv")
+SHOTS_PATH = os.path.join(REPO_DIR, "shots_EPL_1920.csv")
+ROSTERS_PATH = os.path.join(REPO_DIR, "rosters_EPL_1920.csv")
+
+FIGURE_NAMES = ("shot_map", "xg", "heatmap", "player_stats", "tactical")
+MAX_MATCHES = 16
+TEAM_COLOURS = {"h": "#C8102E", "a": "#1F4E9C"}
+
+
+def _pitch_shapes():
+    """Outline, halfway line and penalty boxes on understat's 0-1 pitch."""
+    line = dict(color="#9e9e9e", width=1)
+    return [
+        dict(type="rect", x0=0, y0=0, x1=1, y1=1, line=line),
+        dict(type="line", x0=0.5, y0=0, x1=0.5, y1=1, line=line),
+        dict(type="circle", x0=0.413, y0=0.365, x1=0.587, y1=0.635, line=line),
+        dict(type="rect", x0=0, y0=0.21, x1=0.17, y1=0.79, line=line),
+        dict(type="rect", x0=0.83, y0=0.21, x1=1, y1=0.79, line=line),
+        dict(type="rect", x0=0, y0=0.37, x1=0.058, y1=0.63, line=line),
+        dict(type="rect", x0=0.942, y0=0.37, x1=1, y1=0.63, line=line),
+    ]
+
+
+def shot_map_figure(info, shots):
+    """Both teams' shots on one pitch (home attacking right), one trace per player."""
+    fig = go.Figure()
+    for side, team in (("h", info["team_h"]), ("a", info["team_a"])):
+        team_shots = shots[shots["h_a"] == side]
+        # understat coordinates are from the shooter's side: mirror the away team
+        x = team_shots["X"] if side == "h" else 1 - team_shots["X"]
+        y = team_shots["Y"] if side == "h" else 1 - team_shots["Y"]
+        for player, rows in team_shots.groupby("player", observed=True).groups.items():
+            player_shots = team_shots.loc[rows]
+            goal = (player_shots["result"] == "Goal").to_numpy()
+            fig.add_trace(go.Scatter(
+                x=x.loc[rows], y=y.loc[rows], mode="markers", name=str(player),
+                legendgroup=team, legendgrouptitle_text=team,
+                marker=dict(
+                    size=8 + 30 * np.sqrt(player_shots["xG"].to_numpy(dtype=float)),
+                    color=TEAM_COLOURS[side], symbol=np.where(goal, "diamond", "circle"),
+                    opacity=0.75, line=dict(color="white", width=1),
+                ),
+                customdata=np.column_stack([
+                    player_shots["minute"], player_shots["xG"].round(2), player_shots["result"],
+                ]),
+                hovertemplate=f"<b>{player}</b><br>Minute %{{customdata[0]}}<br>"
+                              "xG %{customdata[1]}<br>%{customdata[2]}<extra></extra>",
+            ))
+    fig.update_layout(
+        title=f"Shot Map: {info['team_h']} {info['h_goals']}-{info['a_goals']} {info['team_a']}",
+        shapes=_pitch_shapes(), template="plotly_white", height=560,
+        xaxis=dict(range=[-0.02, 1.02], visible=False),
+        yaxis=dict(range=[1.02, -0.02], visible=False, scaleanchor="x", scaleratio=68 / 105),
+    )
+    return fig
+
+
+def xg_figure(info, shots):
+    """Cumulative xG by minute for both teams, with goals marked."""
+    fig = go.Figure()
+    end = max(90, int(shots["minute"].max()) if len(shots) else 90)
+    for side, team in (("h", info["team_h"]), ("a", info["team_a"])):
+        team_shots = shots[shots["h_a"] == side].sort_values("minute")
+        minutes = np.concatenate([[0], team_shots["minute"].to_numpy(dtype=int), [end]])
+        xg = np.concatenate([[0.0], team_shots["xG"].to_numpy(dtype=float).cumsum()])
+        xg = np.append(xg, xg[-1])
+        fig.add_trace(go.Scatter(
+            x=minutes, y=xg, mode="lines", line_shape="hv", name=team,
+            line=dict(color=TEAM_COLOURS[side], width=3),
+            hovertemplate=f"{team}<br>Minute %{{x}}<br>xG %{{y:.2f}}<extra></extra>",
+        ))
+        goals = team_shots["result"].to_numpy() == "Goal"
+        fig.add_trace(go.Scatter(
+            x=minutes[1:-1][goals], y=xg[1:-1][goals], mode="markers", name=f"{team} goals",
+            marker=dict(color=TEAM_COLOURS[side], size=12, symbol="star"),
+            text=team_shots["player"].astype(str).to_numpy()[goals],
+            hovertemplate="⚽ %{text}<br>Minute %{x}<extra></extra>",
+        ))
+    fig.update_layout(
+        title=f"Expected Goals: {info['team_h']} {float(info['h_xg']):.2f} - "
+              f"{float(info['a_xg']):.2f} {info['team_a']}",
+        xaxis_title="Minute", yaxis_title="Cumulative xG", template="plotly_white",
+        hovermode="x unified", height=500,
+    )
+    return fig
+
+
+def heatmap_figure(info, shots):
+    """Shot density of each team in its attacking third, on a shared colour scale."""
+    panels = [(info[f"team_{side}"], shots[shots["h_a"] == side]) for side in ("h", "a")]
+    return density_panels(panels, cols=2, title="Shot Density (xG-weighted)", weight="xG",
+                          shared_scale=True, height=450)
+
+
+def player_stats_figure(info, roster):
+    """xG and xA of every player who featured; clicking a bar selects the player."""
+    played = roster[roster["time"] > 0].copy()
+    played["Team"] = np.where(played["h_a"] == "h", info["team_h"], info["team_a"])
+    played["Involvement"] = played["xG"] + played["xA"]
+    played = played.sort_values("Involvement")
+    players = played["player"].astype(str).to_numpy()
+    customdata = np.column_stack([players, played["Team"], played["time"], played["shots"],
+                                  played["key_passes"]])
+    fig = go.Figure()
+    for metric, colour in (("xG", "#C8102E"), ("xA", "#00A398")):
+        fig.add_trace(go.Bar(
+            x=played[metric], y=[f"{p} ({t})" for p, t in zip(players, played["Team"])],
+            orientation="h", name=metric, marker_color=colour, customdata=customdata,
+            hovertemplate="<b>%{customdata[0]}</b> (%{customdata[1]})<br>"
+                          f"{metric} %{{x:.2f}}<br>Minutes %{{customdata[2]}}<br>"
+                          "Shots %{customdata[3]} · Key passes %{customdata[4]}<extra></extra>",
+        ))
+    fig.update_layout(
+        title="Player Statistics: xG + xA (click a player to highlight their shots)",
+        barmode="stack", template="plotly_white", height=max(500, 18 * len(played)),
+        xaxis_title="Expected goals + assists",
+    )
+    return fig
+
+
+def tactical_figure(info, shots):
+    """Side-by-side team comparison: volume, quality, pressing and shot situations."""
+    metrics = {
+        "Shots": ("h_shot", "a_shot"),
+        "On target": ("h_shotOnTarget", "a_shotOnTarget"),
+        "Deep completions": ("h_deep", "a_deep"),
+        "PPDA": ("h_ppda", "a_ppda"),
+        "xG": ("h_xg", "a_xg"),
+    }
+    fig = go.Figure()
+    for i, side in enumerate(("h", "a")):
+        team = info[f"team_{side}"]
+        values = [round(float(info[cols[i]]), 2) for cols in metrics.values()]
+        fig.add_trace(go.Bar(x=list(metrics), y=values, name=team, marker_color=TEAM_COLOURS[side],
+                             text=values, textposition="outside"))
+    situations = shots.groupby(["h_a", "situation"], observed=True).size().unstack(fill_value=0)
+    lines = [
+        f"{info[f'team_{side}']}: " + ", ".join(f"{k} {v}" for k, v in situations.loc[side].items())
+        for side in ("h", "a") if side in situations.index
+    ]
+    fig.update_layout(
+        title=f"Tactical Insights · pre-match odds H {float(info['h_w']):.0%} / "
+              f"D {float(info['h_d']):.0%} / A {float(info['h_l']):.0%}",
+        barmode="group", template="plotly_white", height=500, yaxis_title="Value",
+        annotations=[dict(text="<br>".join(lines), showarrow=False, xref="paper", yref="paper",
+                          x=0, y=-0.25, align="left")],
+        margin=dict(b=120),
+    )
+    return fig
+
+
+def data_version():
+    """Version token of the three files the match figures are built from."""
+    return dataset_version(MATCH_INFOS_PATH, SHOTS_PATH, ROSTERS_PATH)
+
+
+def build_match_figures(match_id):
+    """Every figure of one understat match, by ``FIGURE_NAMES`` (uncached)."""
+    infos = load_dataset(MATCH_INFOS_PATH)
+    info = infos[infos["id"] == match_id].to_dict("records")[0]
+    # Index seeks in the SQLite store when it is current, else filters of the shared frames
+    shots = match_shots(match_id)
+    roster = match_rosters(match_id)
+    return {
+        "shot_map": shot_map_figure(info, shots),
+        "xg": xg_figure(info, shots),
+        "heatmap": heatmap_figure(info, shots),
+        "player_stats": player_stats_figure(info, roster),
+        "tactical": tactical_figure(info, shots),
+    }
+
+
+def shared_figure_builder():
+    """``build_match_figures``, memoised across processes when ``CALLBACK_CACHE_DIR`` is set.
+
+    Entries live in their own subdirectory, bounded to ``MAX_MATCHES``. Without
+    a shared directory each registry is the only cache.
+    """
+    directory = os.environ.get("CALLBACK_CACHE_DIR")
+    if not directory:
+        return build_match_figures
+    backend = FileCache(os.path.join(directory, "match_figures"), MAX_MATCHES)
+    return memoize_callback(version=data_version, backend=backend)(build_match_figures)
+
+
+class MatchFigureRegistry(Mapping):
+    """Read-only ``{match label: {figure name: figure}}`` built lazily per match.
+
+    With ``team`` only that team's matches are listed and labelled from its
+    side (``"vs Arsenal (H) · 2019-12-26"``); otherwise every match of the
+    season is. The index and the built figures are refreshed when one of the
+    three CSV files changes. Figures returned by lookups are shared: callers
+    must not modify them in place.
+    """
+
+    def __init__(self, team=None, max_matches=MAX_MATCHES):
+        self.team = team
+        self.max_matches = max_matches
+        self._build_figures = shared_figure_builder()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._built = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_index()
+
+    def _load_index(self):
+        self._version = data_version()
+        infos = load_dataset(MATCH_INFOS_PATH).sort_values("date")
+        if self.team is not None:
+            infos = infos[(infos["team_h"] == self.team) | (infos["team_a"] == self.team)]
+        self._infos = {self._label(info): info for info in infos.to_dict("records")}
+        self._built.clear()
+
+    def _label(self, info):
+        date = str(info["date"])[:10]
+        if self.team is None:
+            return f"{info['team_h']} v {info['team_a']} · {date}"
+        home = info["team_h"] == self.team
+        return f"vs {info['team_a'] if home else info['team_h']} ({'H' if home else 'A'}) · {date}"
+
+    def options(self):
+        """Dropdown options for every match, without building any figure."""
+        return [{"label": label, "value": label} for label in self._infos]
+
+    def __getitem__(self, label):
+        if data_version() != self._version:
+            with self._lock:
+                self._load_index()
+        info = self._infos[label]
+        with self._lock:
+            figures = self._built.get(label)
+            if figures is not None:
+                self._built.move_to_end(label)
+                self.hits += 1
+                return figures
+            self.misses += 1
+        figures = self._build_figures(int(info["id"]))
+        with self._lock:
+            self._built[label] = figures
+            self._built.move_to_end(label)
+            while len(self._built) > self.max_matches:
+                self._built.popitem(last=False)
+                self.evictions += 1
+        return figures
+
+    def __iter__(self):
+        return iter(self._infos)
+
+    def __len__(self):
+        return len(self._infos)
+
+    def __contains__(self, label):
+        return label in self._infos
+
+    def stats(self):
+        """Return matches listed and built, and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "matches": len(self._infos),
+                "built": len(self._built),
+                "max_matches": self.max_matches,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,262 @@
+"""Indexed SQLite copy of every dataset, for point lookups.
+
+    python match_store.py             # (re)load tables whose source changed
+    python match_store.py --force     # reload everything
+    python match_store.py --list      # tables, row counts and indexes
+
+Every CSV in the repo becomes a table named as in ``sql_engine`` (e.g.
+``shots_epl_1920``, ``epl_set``), plus ``team_matches`` from
+``team_match_table``, in ``match_store.sqlite``. The tables hold the
+``load_dataset`` frames (canonical team names, per-file read options) and the
+``_columns`` table records their dtypes, so a lookup returns the same frame
+whether it reads the store or filters the shared frame. The columns the
+dashboards look rows up by are indexed (``INDEXES``), so one match's shots or
+one player's rosters are an index seek instead of a scan of the whole file.
+
+Ingesting is an explicit step (this CLI). A table is reloaded only when the
+content token of its source changes (recorded in the ``_ingested`` table).
+Loads are written to a copy of the store that then replaces it, so readers
+never see a half-loaded table. The lookup functions below never write: when
+the store is missing, or a table they need is stale, they filter the
+``load_dataset`` frame instead.
+"""
+import argparse
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import threading
+import time
+
+import pandas as pd
+
+from data_mirror import REPO_DIR, read_options
+from data_registry import dataset_version, load_dataset
+from sql_engine import dataset_tables
+from team_match_table import SOURCES as TEAM_MATCH_SOURCES, team_match_table
+
+STORE_PATH = os.path.join(REPO_DIR, "match_store.sqlite")
+
+# table name -> indexed column tuples
+INDEXES = {
+    "shots_epl_1920": [("match_id",), ("player_id",), ("h_team", "date"), ("a_team", "date")],
+    "rosters_epl_1920": [("match_id",), ("player_id",), ("team_id",)],
+    "match_infos_epl_1920": [("id",), ("team_h", "date"), ("team_a", "date"), ("season",)],
+    "epl_final": [("HomeTeam", "MatchDate"), ("AwayTeam", "MatchDate"), ("Season",)],
+    "epl_set": [("HomeTeam", "Date"), ("AwayTeam", "Date"), ("Season",), ("Div",)],
+    "liverpool_filtered_2015_onwards": [("HomeTeam", "Date"), ("AwayTeam", "Date"), ("Season",), ("Div",)],
+    "premier_league_matches": [("Home", "Date"), ("Away", "Date"), ("Season_End_Year",)],
+    "liverpool_2015_2023_matches": [("Home", "Date"), ("Away", "Date"), ("Season_End_Year",)],
+    "team_matches": [("Team", "Date"), ("Season",), ("MatchId",)],
+}
+
+_LOCAL = threading.local()
+_INGEST_LOCK = threading.Lock()
+
+
+def _table_sources():
+    """``{table name: (source paths, loader)}`` of every table in the store."""
+    sources = {name: ([path], lambda path=path: load_dataset(path, **read_options(path)))
+               for name, path in dataset_tables().items()}
+    sources["team_matches"] = (list(TEAM_MATCH_SOURCES.values()), team_match_table)
+    return sources
+
+
+def _stored_versions(con):
+    try:
+        return dict(con.execute("SELECT name, version FROM _ingested"))
+    except sqlite3.OperationalError:
+        return {}  # new store
+
+
+def _stored_columns(con):
+    """``{table name: [(column, dtype, categories JSON or None), ...]}`` of the stored tables."""
+    try:
+        rows = con.execute('SELECT name, "column", dtype, categories FROM _columns ORDER BY name, position')
+    except sqlite3.OperationalError:
+        return {}  # store written before dtypes were recorded: every table is stale
+    columns = {}
+    for name, column, dtype, categories in rows:
+        columns.setdefault(name, []).append((column, dtype, categories))
+    return columns
+
+
+def _restore_dtypes(df, columns):
+    """Give the columns read back from SQLite the dtypes they were stored with."""
+    for column, dtype, categories in columns:
+        if categories is not None:
+            df[column] = pd.Categorical(df[column], categories=json.loads(categories))
+        elif dtype.startswith("datetime64"):
+            df[column] = pd.to_datetime(df[column]).astype(dtype)
+        else:
+            df[column] = df[column].astype(dtype)
+    return df
+
+
+def _load_table(con, name, df):
+    con.execute(f'DROP TABLE IF EXISTS "{name}"')
+    con.execute("DELETE FROM _columns WHERE name = ?", (name,))
+    df.to_sql(name, con, index=False, chunksize=5000)
+    con.executemany("INSERT INTO _columns VALUES (?, ?, ?, ?, ?)", [
+        (name, position, column, str(dtype),
+         json.dumps(dtype.categories.tolist()) if isinstance(dtype, pd.CategoricalDtype) else None)
+        for position, (column, dtype) in enumerate(df.dtypes.items())
+    ])
+    for columns in INDEXES.get(name, []):
+        index = f"idx_{name}_{'_'.join(columns)}".lower()
+        quoted = ", ".join(f'"{column}"' for column in columns)
+        con.execute(f'CREATE INDEX "{index}" ON "{name}" ({quoted})')
+
+
+def ingest(names=None, force=False, path=STORE_PATH):
+    """Load the stale tables of ``names`` (default: all) into the store at ``path``.
+
+    Returns ``{"loaded": {name: seconds}, "skipped": [...]}``.
+    """
+    sources = _table_sources()
+    names = list(sources if names is None else names)
+    report = {"loaded": {}, "skipped": []}
+    with _INGEST_LOCK:
+        tmp = f"{path}.{os.getpid()}.tmp"
+        if os.path.exists(path):
+            shutil.copyfile(path, tmp)
+        con = sqlite3.connect(tmp)
+        try:
+            con.execute("CREATE TABLE IF NOT EXISTS _ingested "
+                        "(name TEXT PRIMARY KEY, version TEXT, rows INTEGER, seconds REAL)")
+            con.execute('CREATE TABLE IF NOT EXISTS _columns '
+                        '(name TEXT, position INTEGER, "column" TEXT, dtype TEXT, categories TEXT)')
+            described = _stored_columns(con)
+            stored = {} if force else {name: version for name, version in _stored_versions(con).items()
+                                       if name in described}
+            for name in names:
+                source_paths, loader = sources[name]
+                version = dataset_version(*source_paths)
+                if stored.get(name) == version:
+                    report["skipped"].append(name)
+                    continue
+                start = time.perf_counter()
+                df = loader()
+                with con:
+                    _load_table(con, name, df)
+                    seconds = time.perf_counter() - start
+                    con.execute("INSERT OR REPLACE INTO _ingested VALUES (?, ?, ?, ?)",
+                                (name, version, len(df), seconds))
+                report["loaded"][name] = seconds
+            if report["loaded"]:
+                con.execute("ANALYZE")
+        finally:
+            con.close()
+        if report["loaded"] or not os.path.exists(path):
+            os.replace(tmp, path)
+        else:
+            os.remove(tmp)
+    return report
+
+
+def _connection():
+    """This thread's read-only connection, reopened when the store file is replaced."""
+    stat = os.stat(STORE_PATH)
+    key = (stat.st_ino, stat.st_mtime_ns)
+    cached = getattr(_LOCAL, "connection", None)
+    if cached is None or cached[0] != key:
+        if cached is not None:
+            cached[1].close()
+        con = sqlite3.connect(f"file:{STORE_PATH}?mode=ro", uri=True)
+        cached = (key, con, _stored_versions(con), _stored_columns(con))
+        _LOCAL.connection = cached
+    return cached
+
+
+def query(sql, params, table, fallback):
+    """Rows of ``table`` selected by ``sql``, with the dtypes of its ``load_dataset`` frame.
+
+    ``sql`` must select every column of ``table`` (``SELECT *``). When the store
+    is missing, unreadable or holds a stale ``table``, returns
+    ``fallback(frame)`` on the shared frame instead; it must select the same
+    rows in the same order.
+    """
+    paths, loader = _table_sources()[table]
+    try:
+        _, con, versions, columns = _connection()
+        if versions.get(table) == dataset_version(*paths) and table in columns:
+            return _restore_dtypes(pd.read_sql_query(sql, con, params=params), columns[table])
+    except (sqlite3.Error, OSError):
+        pass  # no usable store (e.g. never ingested, or a read-only checkout)
+    return fallback(loader()).reset_index(drop=True)
+
+
+def _rows(table, column, value):
+    """Rows of ``table`` whose ``column`` equals ``value``, in file order."""
+    return query(f'SELECT * FROM {table} WHERE "{column}" = ? ORDER BY rowid', (value,), table,
+                 lambda df: df[df[column] == value])
+
+
+def match_shots(match_id):
+    """Every shot of one understat match, in file order."""
+    return _rows("shots_epl_1920", "match_id", int(match_id))
+
+
+def match_rosters(match_id):
+    """Both teams' roster rows of one understat match, in file order."""
+    return _rows("rosters_epl_1920", "match_id", int(match_id))
+
+
+def player_shots(player_id):
+    """Every shot taken by one player over the season, in file order."""
+    return _rows("shots_epl_1920", "player_id", int(player_id))
+
+
+def player_rosters(player_id):
+    """One player's roster row for every match they were named in, in file order."""
+    return _rows("rosters_epl_1920", "player_id", int(player_id))
+
+
+def team_fixtures(team, start=None, end=None):
+    """``team``'s rows of the long team-match table, optionally between two dates (inclusive)."""
+    lower = pd.Timestamp(start) if start is not None else None
+    upper = pd.Timestamp(end) + pd.Timedelta(days=1) if end is not None else None
+    # Bounds only when given: Date has numeric affinity, so a text sentinel would not compare as a date
+    conditions = ["Team = ?"] + ["Date >= ?"] * (lower is not None) + ["Date < ?"] * (upper is not None)
+    params = [team] + [str(bound) for bound in (lower, upper) if bound is not None]
+
+    def fallback(df):
+        rows = df["Team"] == team
+        if lower is not None:
+            rows &= df["Date"] >= lower
+        if upper is not None:
+            rows &= df["Date"] < upper
+        return df[rows].sort_values("Date", kind="stable")
+
+    return query(f"SELECT * FROM team_matches WHERE {' AND '.join(conditions)} ORDER BY Date, rowid",
+                 params, "team_matches", fallback)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--force", action="store_true", help="reload every table")
+    parser.add_argument("--list", action="store_true", help="list the stored tables and exit")
+    args = parser.parse_args(argv)
+
+    if not args.list:
+        start = time.perf_counter()
+        report = ingest(force=args.force)
+        for name, seconds in sorted(report["loaded"].items(), key=lambda item: -item[1]):
+            print(f"📥 {name}  {seconds:.2f}s")
+        print(f"✅ {len(report['loaded'])} loaded, {len(report['skipped'])} up to date "
+              f"in {time.perf_counter() - start:.1f}s -> {STORE_PATH}")
+        return 0
+
+    con = sqlite3.connect(STORE_PATH)
+    try:
+        for name, rows in con.execute("SELECT name, rows FROM _ingested ORDER BY name"):
+            indexes = [row[1] for row in con.execute(f'PRAGMA index_list("{name}")')]
+            print(f"{name:36s} {rows:>7,} rows  {', '.join(sorted(indexes)) or '-'}")
+    finally:
+        con.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
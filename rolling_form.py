@@ -0,0 +1,93 @@
+"""Rolling form of every team in every season, for several windows at once.
+
+The title tab rolled Liverpool's 2019-20 points and goals over five matches,
+and the 2020-21 section rolled goals again on its own; another team, season or
+window meant another pass. ``RollingForm`` sorts the long ``team_match_table``
+by team, season and date once and takes prefix sums of each metric, so the
+mean over the last ``w`` matches of a team-season is two lookups and a
+division, done for every row, window and metric in one numpy pass. Form
+restarts each season. Missing values (xG outside 2019-20) are skipped, as
+with ``rolling(w, min_periods=1).mean()``.
+"""
+import numpy as np
+
+from data_registry import derived_table
+from team_match_table import SOURCES as TEAM_MATCH_SOURCES, XG_PATH, team_match_table, team_match_xg
+
+WINDOWS = (3, 5, 10)
+METRICS = ("Points", "GoalsFor", "GoalsAgainst", "xGFor", "xGAgainst")
+
+
+def rolling_column(metric, window):
+    """Column of ``RollingForm.rows`` holding ``metric`` averaged over ``window`` matches."""
+    return f"{metric}_Rolling_{window}"
+
+
+class RollingForm:
+    """Rolling means of ``METRICS`` per team-season for each of ``windows``.
+
+    ``rows`` has one row per team per match, sorted by Team, Season and Date,
+    with SeasonMatch (1-based) and a ``rolling_column(metric, window)`` column
+    for every metric and window.
+    """
+
+    def __init__(self, matches, windows=WINDOWS):
+        rows = matches.sort_values(["Team", "Season", "Date"], kind="stable").reset_index(drop=True)
+        position = np.arange(len(rows))
+        team = rows["Team"].to_numpy()
+        season = rows["Season"].to_numpy()
+        new_group = np.ones(len(rows), dtype=bool)
+        new_group[1:] = (team[1:] != team[:-1]) | (season[1:] != season[:-1])
+        group_start = np.maximum.accumulate(np.where(new_group, position, 0))
+        rows["SeasonMatch"] = position - group_start + 1
+
+        values = rows[list(METRICS)].to_numpy(dtype=float)
+        valid = ~np.isnan(values)
+        zeros = np.zeros((1, len(METRICS)))
+        sums = np.vstack([zeros, np.cumsum(np.where(valid, values, 0.0), axis=0)])
+        counts = np.vstack([zeros, np.cumsum(valid, axis=0)])
+        end = position + 1
+        self.windows = tuple(windows)
+        for window in self.windows:
+            start = np.maximum(group_start, end - window)
+            with np.errstate(invalid="ignore"):
+                means = (sums[end] - sums[start]) / (counts[end] - counts[start])
+            for column, metric in enumerate(METRICS):
+                rows[rolling_column(metric, window)] = means[:, column]
+
+        self.rows = rows
+        self._teams = rows.groupby("Team", sort=False).indices
+
+    def team_form(self, team, seasons=None):
+        """``team``'s rows in date order, optionally limited to ``seasons``."""
+        rows = self.rows.take(self._teams.get(team, []))
+        if seasons is not None:
+            rows = rows[rows["Season"].isin(seasons)]
+        return rows.reset_index(drop=True)
+
+    def form_table(self, season, metric="Points", window=5):
+        """Every team's rolling ``metric`` in ``season``: SeasonMatch rows, one column per team."""
+        rows = self.rows[self.rows["Season"] == season]
+        return rows.pivot(index="SeasonMatch", columns="Team", values=rolling_column(metric, window))
+
+
+def build_rolling_form(windows=WINDOWS):
+    """Build the engine from the long table and the understat xG (uncached; see ``rolling_form``)."""
+    matches = team_match_table().merge(team_match_xg(), on=["Date", "Team"], how="left")
+    return RollingForm(matches, windows)
+
+
+def rolling_form(windows=WINDOWS):
+    """Return the shared ``RollingForm`` for ``windows``, rebuilt when a source changes."""
+    windows = tuple(sorted(windows))
+    sources = [*TEAM_MATCH_SOURCES.values(), XG_PATH]
+    return derived_table(f"rolling_form:{windows}", sources, lambda: build_rolling_form(windows))
+
+
+if __name__ == "__main__":
+    form = rolling_form()
+    print(f"✅ {len(form.rows):,} team-match rows, windows {form.windows}, "
+          f"{len(form.windows) * len(METRICS)} rolling columns")
+    latest = form.rows["Season"].max()
+    print(f"Last-5 points per game after the final round of {latest}:")
+    print(form.form_table(latest).iloc[-1].sort_values(ascending=False).round(2).to_string())
@@ -0,0 +1,134 @@
+"""Grid-based shot density maps.
+
+The shot heatmaps were drawn with ``sns.kdeplot(fill=True, levels=100)``, which
+evaluates a Gaussian KDE on a fresh grid and traces 100 filled contours for every
+panel. ``density_grid`` bins the shots onto a fixed pitch grid instead and
+smooths the counts with a separable Gaussian kernel (two small matrix products),
+optionally weighting each shot by its xG. Every panel shares the same grid, so
+home/away and player maps line up cell for cell and can share a colour scale.
+
+Run ``python benchmarks/shot_density_benchmark.py`` to compare against seaborn.
+"""
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+# Attacking third used by the dashboards' heatmaps (goal on the right)
+PITCH_EXTENT = ((0.7, 1.05), (0.2, 0.9))
+CELL_SIZE = 0.005
+# Kernels are truncated at this many bandwidths
+KERNEL_REACH = 4
+
+
+def scott_bandwidth(values, weights=None):
+    """Per-axis Scott's rule bandwidth, as used by ``sns.kdeplot`` by default."""
+    values = np.asarray(values, dtype=float)
+    weights = np.ones_like(values) if weights is None else np.asarray(weights, dtype=float)
+    total = weights.sum()
+    if len(values) < 2 or total <= 0:
+        return 0.0
+    n_eff = total ** 2 / (weights ** 2).sum()
+    mean = np.average(values, weights=weights)
+    std = np.sqrt(np.average((values - mean) ** 2, weights=weights))
+    return std * n_eff ** (-1 / 6)
+
+
+def _axis_centres(lo, hi, cell):
+    count = int(round((hi - lo) / cell))
+    return lo + cell * (np.arange(count) + 0.5)
+
+
+def _kernel_matrix(centres, bandwidth):
+    """Gaussian kernel between grid centres, scaled to integrate to one."""
+    offsets = centres[:, None] - centres[None, :]
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+    kernel[np.abs(offsets) > KERNEL_REACH * bandwidth] = 0.0
+    return kernel / (np.sqrt(2 * np.pi) * bandwidth)
+
+
+def density_grid(x, y, weights=None, bandwidth=None, extent=PITCH_EXTENT, cell=CELL_SIZE):
+    """Return ``(x_centres, y_centres, density)`` for shots at ``x``/``y``.
+
+    ``density`` has shape ``(len(y_centres), len(x_centres))`` and integrates to
+    the share of (weighted) shots inside ``extent``. ``bandwidth`` is an
+    ``(x, y)`` pair; by default it follows Scott's rule on each axis. Shots just
+    outside the extent still contribute their kernel tails, as in a KDE.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    weights = np.ones_like(x) if weights is None else np.asarray(weights, dtype=float)
+    (x_lo, x_hi), (y_lo, y_hi) = extent
+    x_centres = _axis_centres(x_lo, x_hi, cell)
+    y_centres = _axis_centres(y_lo, y_hi, cell)
+    density = np.zeros((len(y_centres), len(x_centres)))
+
+    total = weights.sum()
+    if bandwidth is None:
+        bandwidth = (scott_bandwidth(x, weights), scott_bandwidth(y, weights))
+    bw_x, bw_y = (max(bw, cell) for bw in bandwidth)
+    if len(x) == 0 or total <= 0:
+        return x_centres, y_centres, density
+
+    # Bin on a grid padded by the kernel reach, smooth, then crop to the extent
+    pad_x = int(np.ceil(KERNEL_REACH * bw_x / cell))
+    pad_y = int(np.ceil(KERNEL_REACH * bw_y / cell))
+    padded_x = _axis_centres(x_lo - pad_x * cell, x_hi + pad_x * cell, cell)
+    padded_y = _axis_centres(y_lo - pad_y * cell, y_hi + pad_y * cell, cell)
+    counts, _, _ = np.histogram2d(
+        y, x,
+        bins=(len(padded_y), len(padded_x)),
+        range=((padded_y[0] - cell / 2, padded_y[-1] + cell / 2),
+               (padded_x[0] - cell / 2, padded_x[-1] + cell / 2)),
+        weights=weights,
+    )
+    smoothed = _kernel_matrix(padded_y, bw_y) @ counts @ _kernel_matrix(padded_x, bw_x).T
+    density = smoothed[pad_y:pad_y + len(y_centres), pad_x:pad_x + len(x_centres)] / total
+    return x_centres, y_centres, density
+
+
+def _heatmap_trace(shots, weight, extent, cell, zmax=None, showscale=True):
+    x_centres, y_centres, density = density_grid(
+        shots["X"], shots["Y"],
+        weights=None if weight is None else shots[weight],
+        extent=extent, cell=cell,
+    )
+    return go.Heatmap(
+        x=x_centres, y=y_centres, z=density,
+        colorscale="Reds", zmin=0, zmax=zmax, showscale=showscale,
+        hovertemplate="X: %{x:.3f}<br>Y: %{y:.3f}<br>Density: %{z:.2f}<extra></extra>",
+    )
+
+
+def density_heatmap(shots, title=None, weight=None, extent=PITCH_EXTENT, cell=CELL_SIZE):
+    """Plotly heatmap of the shots in ``shots`` (columns ``X``/``Y``, optional ``weight``)."""
+    fig = go.Figure(_heatmap_trace(shots, weight, extent, cell))
+    fig.update_layout(title=title, template="plotly_white")
+    fig.update_xaxes(range=extent[0], title_text="Normalized X (Goal Right)")
+    fig.update_yaxes(range=extent[1][::-1], title_text="Normalized Y (Pitch Height)",
+                     scaleanchor="x", scaleratio=1)
+    return fig
+
+
+def density_panels(panels, cols=2, title=None, weight=None, shared_scale=False,
+                   extent=PITCH_EXTENT, cell=CELL_SIZE, height=None):
+    """Grid of shot heatmaps, one per ``(panel_title, shots)`` pair in ``panels``.
+
+    With ``shared_scale`` all panels use the same colour range, so intensities
+    are comparable between e.g. home and away or two players.
+    """
+    rows = int(np.ceil(len(panels) / cols))
+    fig = make_subplots(rows=rows, cols=cols, subplot_titles=[name for name, _ in panels],
+                        horizontal_spacing=0.08, vertical_spacing=0.1)
+    traces = [_heatmap_trace(shots, weight, extent, cell) for _, shots in panels]
+    if shared_scale:
+        zmax = max((np.max(trace.z) for trace in traces), default=None)
+        for trace in traces:
+            trace.update(zmax=zmax)
+    for i, trace in enumerate(traces):
+        # One colour bar only makes sense when the panels share a scale
+        trace.update(showscale=shared_scale and i == 0)
+        fig.add_trace(trace, row=i // cols + 1, col=i % cols + 1)
+    fig.update_xaxes(range=extent[0], title_text="Normalized X")
+    fig.update_yaxes(range=extent[1][::-1], title_text="Normalized Y")
+    fig.update_layout(title=title, template="plotly_white", height=height or 450 * rows)
+    return fig
@@ -0,0 +1,140 @@
+"""Optional embedded SQL over the repo's datasets (DuckDB, in-process, no server).
+
+    python sql_engine.py --tables
+    python sql_engine.py "SELECT Season, count(*) FROM epl_final GROUP BY 1 ORDER BY 1"
+
+Every CSV in the repo is a table named after its file, lower-cased with
+non-alphanumerics replaced by ``_`` (``premier-league-matches.csv`` ->
+``premier_league_matches``, ``EPL_Set.csv`` -> ``epl_set``), and
+``team_matches`` is the long table of ``team_match_table``. The tables are the
+``load_dataset`` frames (canonical team names, compact dtypes, per-file read
+options from ``data_mirror.READ_OPTIONS``) copied whole into in-memory DuckDB
+tables through Arrow, so the first query of a table pays for loading all of
+it. A table is loaded on first use and again only when its file's content
+token changes; later queries run on the copy.
+
+Without ``duckdb`` installed ``HAS_DUCKDB`` is False and ``sql`` raises
+``RuntimeError``; the dashboards keep using pandas.
+"""
+import glob
+import importlib.util
+import os
+import re
+import sys
+import threading
+
+from data_mirror import HAS_PYARROW, REPO_DIR, read_options
+from data_registry import dataset_version, load_dataset
+from team_match_table import SOURCES as TEAM_MATCH_SOURCES, team_match_table
+
+HAS_DUCKDB = importlib.util.find_spec("duckdb") is not None
+
+# table name -> version of the loaded table
+_TABLES = {}
+_CONNECTION = None
+_LOCK = threading.Lock()
+
+
+def table_name(path):
+    """SQL table name of a dataset file."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return re.sub(r"[^0-9a-z]+", "_", stem.lower()).strip("_")
+
+
+def dataset_tables():
+    """``{table name: CSV path}`` for every CSV in the repo."""
+    return {table_name(path): path for path in sorted(glob.glob(os.path.join(REPO_DIR, "*.csv")))}
+
+
+def _table_sources():
+    """``{table name: (source paths, loader)}`` of every queryable table."""
+    sources = {
+        name: ([path], lambda path=path: load_dataset(path, **read_options(path)))
+        for name, path in dataset_tables().items()
+    }
+    sources["team_matches"] = (list(TEAM_MATCH_SOURCES.values()), team_match_table)
+    return sources
+
+
+def _as_arrow(df):
+    # DuckDB copies Arrow tables without going through Python objects
+    if not HAS_PYARROW:
+        return df
+    import pyarrow as pa
+
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return df  # mixed-type object columns: let DuckDB read the frame
+
+
+def _referenced_tables(query, names):
+    words = set(re.findall(r"[0-9a-z_]+", query.lower()))
+    return [name for name in names if name in words]
+
+
+def connection(tables=None):
+    """Return the shared DuckDB connection with ``tables`` (default: all) registered and current.
+
+    The connection is not thread-safe on its own; ``sql`` serialises access.
+    """
+    global _CONNECTION
+    if not HAS_DUCKDB:
+        raise RuntimeError("The SQL engine needs duckdb: pip install duckdb")
+    import duckdb
+
+    if _CONNECTION is None:
+        _CONNECTION = duckdb.connect(":memory:")
+    sources = _table_sources()
+    for name in sources if tables is None else tables:
+        paths, loader = sources[name]
+        version = dataset_version(*paths)
+        if _TABLES.get(name) != version:
+            _CONNECTION.register("_incoming", _as_arrow(loader()))
+            try:
+                _CONNECTION.execute(f'CREATE OR REPLACE TABLE "{name}" AS SELECT * FROM _incoming')
+            finally:
+                _CONNECTION.unregister("_incoming")
+            _TABLES[name] = version
+    return _CONNECTION
+
+
+def sql(query, params=None):
+    """Run ``query`` (with optional ``?``/``$name`` ``params``) and return a DataFrame.
+
+    Only the tables the query mentions are loaded or refreshed.
+    """
+    with _LOCK:
+        con = connection(_referenced_tables(query, _table_sources()))
+        return con.execute(query, params).df()
+
+
+def home_win_rates(team=None, since=1993):
+    """Home win percentage per season end year since ``since``, league-wide or for ``team``."""
+    return sql(
+        """
+        SELECT Season_End_Year AS SeasonEndYear,
+               count(*) AS HomeMatches,
+               100.0 * avg(CASE WHEN HomeGoals > AwayGoals THEN 1 ELSE 0 END) AS HomeWinRate
+        FROM premier_league_matches
+        WHERE Season_End_Year >= $since AND ($team IS NULL OR Home = $team)
+        GROUP BY Season_End_Year
+        ORDER BY Season_End_Year
+        """,
+        {"since": since, "team": team},
+    )
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] == "--tables":
+        for name, path in dataset_tables().items():
+            print(f"{name:36s} {os.path.basename(path)}")
+        print(f"{'team_matches':36s} team_match_table()")
+        return 0
+    print(sql(" ".join(argv)).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
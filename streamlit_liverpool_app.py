@@ -8,6 +8,9 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from data_registry import load_dataset
+from eras import era_labels
+from shot_density import density_panels
 
 st.set_page_config(page_title="Liverpool Streamlit Dashboard", layout="wide")
 st.title("⚽ Liverpool Full Analysis Dashboard")
@@ -18,7 +21,7 @@ import plotly.express as px
 import plotly.io as pio
 
 # 1️⃣ Load your CSV
-df = pd.read_csv('Liverpool_2015_2023_Matches.csv')
+df = load_dataset('Liverpool_2015_2023_Matches.csv')
 
 # 2️⃣ Add Venue column
 df['Venue'] = df.apply(lambda row: 'Home' if row['Home'] == 'Liverpool' else 'Away', axis=1)
@@ -42,7 +45,7 @@ def get_result(row):
 df['Result'] = df.apply(get_result, axis=1)
 
 # 4️⃣ Create Summary Table
-summary = df.groupby('Venue').agg(
+summary = df.groupby('Venue', observed=True).agg(
     Total_Matches=('Result', 'count'),
     Wins=('Result', lambda x: (x == 'Win').sum())
 ).reset_index()
@@ -112,7 +115,7 @@ import plotly.express as px
 import plotly.io as pio
 
 # 1️⃣ Load the CSV
-df = pd.read_csv("Liverpool_2015_2023_Matches.csv")
+df = load_dataset("Liverpool_2015_2023_Matches.csv")
 
 # 2️⃣ Add Venue column
 df['Venue'] = df.apply(lambda row: 'Home' if row['Home'] == 'Liverpool' else 'Away', axis=1)
@@ -127,19 +130,12 @@ df['Result'] = df.apply(get_result, axis=1)
 
 # 4️⃣ Add CovidPeriod column
 df['Date'] = pd.to_datetime(df['Date'])
-def covid_period(date):
-    if date < pd.to_datetime('2020-03-01'):
-        return 'Pre-COVID'
-    elif date < pd.to_datetime('2021-07-01'):
-        return 'During COVID'
-    else:
-        return 'Post-COVID'
-df['CovidPeriod'] = df['Date'].apply(covid_period)
+df['CovidPeriod'] = era_labels(df['Date'], 'covid_seasons')
 
 # 5️⃣ Group and summarize data
-summary = df.groupby(['CovidPeriod', 'Venue', 'Result']).size().reset_index(name='Count')
+summary = df.groupby(['CovidPeriod', 'Venue', 'Result'], observed=True).size().reset_index(name='Count')
 summary['Result_Grouped'] = summary['Result'].apply(lambda x: 'Wins' if x == 'Win' else 'Other')
-stacked = summary.groupby(['CovidPeriod', 'Venue', 'Result_Grouped'])['Count'].sum().reset_index()
+stacked = summary.groupby(['CovidPeriod', 'Venue', 'Result_Grouped'], observed=True)['Count'].sum().reset_index()
 
 # 6️⃣ Modern stacked bar chart
 fig2 = px.bar(
@@ -185,7 +181,7 @@ import plotly.express as px
 import plotly.io as pio
 
 # 📂 Load dataset
-df = pd.read_csv('Liverpool_Filtered_2015_onwards.csv')
+df = load_dataset('Liverpool_Filtered_2015_onwards.csv')
 
 # 📌 Rename columns (if needed)
 rename_columns = {
@@ -205,19 +201,14 @@ df['Venue'] = df.apply(lambda row: 'Home' if row['HomeTeam'] == 'Liverpool' else
 
 # 📅 Date parsing + COVID period
 df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-def covid_period(date):
-    if pd.isnull(date): return 'Unknown'
-    elif date < pd.to_datetime('2020-03-01'): return 'Pre-COVID'
-    elif date < pd.to_datetime('2021-07-01'): return 'During COVID'
-    else: return 'Post-COVID'
-df['CovidPeriod'] = df['Date'].apply(covid_period)
+df['CovidPeriod'] = era_labels(df['Date'], 'covid_seasons', unknown='Unknown')
 
 # 🏁 Result column from FTR
 df['Result'] = df['FullTimeResult'].map({'H': 'Win', 'D': 'Draw', 'A': 'Loss'})
 df.loc[df['Venue'] == 'Away', 'Result'] = df['FullTimeResult'].map({'A': 'Win', 'D': 'Draw', 'H': 'Loss'})
 
 # 📊 Plot 1: Wins Home vs Away
-wins = df[df['Result'] == 'Win'].groupby('Venue').size().reset_index(name='Wins')
+wins = df[df['Result'] == 'Win'].groupby('Venue', observed=True).size().reset_index(name='Wins')
 fig3 = fig1 = px.bar(
     wins, x='Venue', y='Wins', text='Wins', color='Venue',
     title='🏠 Liverpool Wins (Home vs Away)',
@@ -232,8 +223,8 @@ fig2.update_layout(font=dict(size=14), title_font=dict(size=24))
 
 
 # 📊 Plot 2: 100% Stacked Result %
-outcome = df.groupby(['Venue', 'Result']).size().reset_index(name='Count')
-outcome['Percent'] = outcome['Count'] / outcome.groupby('Venue')['Count'].transform('sum') * 100
+outcome = df.groupby(['Venue', 'Result'], observed=True).size().reset_index(name='Count')
+outcome['Percent'] = outcome['Count'] / outcome.groupby('Venue', observed=True)['Count'].transform('sum') * 100
 fig3 = fig2 = px.bar(
     outcome, x='Venue', y='Percent', color='Result', text=outcome['Percent'].round(1),
     barmode='stack', title='⚖️ Result % Breakdown (Home vs Away)',
@@ -244,7 +235,7 @@ fig2.update_layout(font=dict(size=14), title_font=dict(size=24))
 st.plotly_chart(fig2, use_container_width=True)
 
 # 📊 Plot 3: COVID Result Breakdown
-covid_outcome = df.groupby(['CovidPeriod', 'Venue', 'Result']).size().reset_index(name='Count')
+covid_outcome = df.groupby(['CovidPeriod', 'Venue', 'Result'], observed=True).size().reset_index(name='Count')
 fig3 = px.bar(
     covid_outcome, x='Venue', y='Count', color='Result', barmode='stack',
     facet_col='CovidPeriod', title='🦠 Result Breakdown by Venue & COVID Period',
@@ -254,7 +245,7 @@ fig3.update_layout(font=dict(size=14), title_font=dict(size=24))
 
 # 📊 Plot 4: Wins Over Time
 df['Year'] = df['Date'].dt.year
-wins_time = df[df['Result'] == 'Win'].groupby(['Year', 'Venue']).size().reset_index(name='Wins')
+wins_time = df[df['Result'] == 'Win'].groupby(['Year', 'Venue'], observed=True).size().reset_index(name='Wins')
 fig3 = fig4 = px.line(
     wins_time, x='Year', y='Wins', color='Venue', markers=True,
     title='📈 Liverpool Wins Over Time (Home vs Away)',
@@ -284,10 +275,10 @@ import plotly.io as pio
 pio.renderers.default = 'notebook'  # or 'iframe', 'svg' if needed
 
 # 📂 Load dataset
-df = pd.read_csv('EPL_result.csv')
+df = load_dataset('EPL_result.csv')
 
 # 🧮 Group by home team: average xG and actual goals
-home_stats = df.groupby('Home').agg(
+home_stats = df.groupby('Home', observed=True).agg(
     Avg_xG_Home=('xG_Home', 'mean'),
     Avg_G_Home=('G_Home', 'mean')
 ).reset_index()
@@ -352,16 +343,16 @@ import plotly.io as pio
 
 # Optional: set default renderer if needed
 pio.renderers.default = 'notebook'
-df = pd.read_csv("EPL_result.csv")  # make sure this file is in the directory
+df = load_dataset("EPL_result.csv")  # make sure this file is in the directory
 
 team_abb = {
     'Everton': 'EVE', 'Aston Villa': 'AVL', 'Leicester City': 'LEI',
     'Arsenal': 'ARS', 'Liverpool': 'LIV', 'Tottenham': 'TOT',
-    'Chelsea': 'CHE', 'Leeds United': 'LEE', 'Newcastle Utd': 'NEW',
+    'Chelsea': 'CHE', 'Leeds United': 'LEE', 'Newcastle United': 'NEW',
     'West Ham': 'WHU', 'Southampton': 'SOU', 'Crystal Palace': 'CRY',
     'Wolves': 'WOL', 'Manchester City': 'MCI', 'Brighton': 'BHA',
-    'Manchester Utd': 'MUN', 'West Brom': 'WBA', 'Burnley': 'BUR',
-    'Sheffield Utd': 'SHU', 'Fulham': 'FUL'
+    'Manchester United': 'MUN', 'West Brom': 'WBA', 'Burnley': 'BUR',
+    'Sheffield United': 'SHU', 'Fulham': 'FUL'
 }
 
 df['Home'] = df['Home'].map(team_abb)
@@ -698,7 +689,7 @@ fig8.update_layout(
 st.plotly_chart(fig8, use_container_width=True)
 
 df['xG_diff'] = df['xG_Home'] - df['xG_Away']
-team_xg_diff = df.groupby('Home')['xG_diff'].mean().sort_values(ascending=False).reset_index()
+team_xg_diff = df.groupby('Home', observed=True)['xG_diff'].mean().sort_values(ascending=False).reset_index()
 
 fig9 = px.bar(team_xg_diff, x='Home', y='xG_diff',
              title='📊 Average xG Difference (Home Teams)',
@@ -706,7 +697,7 @@ fig9 = px.bar(team_xg_diff, x='Home', y='xG_diff',
 st.plotly_chart(fig9, use_container_width=True)
 
 import plotly.express as px
-stats_df = pd.read_csv("stats.csv")
+stats_df = load_dataset("stats.csv")
 
 # Filter only Liverpool data
 liverpool_stats = stats_df[stats_df['team'] == 'Liverpool']
@@ -745,7 +736,7 @@ import pandas as pd
 import plotly.express as px
 
 # Load manager data
-managers_df = pd.read_csv("liverpoolfc_managers.csv", sep=';')
+managers_df = load_dataset("liverpoolfc_managers.csv", sep=';')
 
 # Convert date strings
 managers_df['From'] = pd.to_datetime(managers_df['From'])
@@ -785,7 +776,7 @@ import pandas as pd
 import plotly.express as px
 
 # Load manager data
-managers_df = pd.read_csv("liverpoolfc_managers.csv", sep=';')
+managers_df = load_dataset("liverpoolfc_managers.csv", sep=';')
 
 # Convert date strings
 managers_df['From'] = pd.to_datetime(managers_df['From'])
@@ -871,7 +862,7 @@ import pandas as pd
 import plotly.express as px
 
 # Load your data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter only Liverpool matches
 liverpool_df = df[(df['HomeTeam'] == 'Liverpool') | (df['AwayTeam'] == 'Liverpool')].copy()
@@ -882,15 +873,7 @@ liverpool_df['Venue'] = liverpool_df['HomeTeam'].apply(lambda x: 'Home' if x ==
 # Parse match dates and assign COVID periods
 liverpool_df['MatchDate'] = pd.to_datetime(liverpool_df['MatchDate'])
 
-def covid_period(date):
-    if date < pd.to_datetime('2020-03-01'):
-        return 'Pre-COVID'
-    elif date <= pd.to_datetime('2021-07-01'):
-        return 'During-COVID'
-    else:
-        return 'Post-COVID'
-
-liverpool_df['CovidPeriod'] = liverpool_df['MatchDate'].apply(covid_period)
+liverpool_df['CovidPeriod'] = era_labels(liverpool_df['MatchDate'], 'covid_seasons').rename_categories({'During COVID': 'During-COVID'})
 
 # Add match stats from Liverpool's perspective
 liverpool_df['Goals'] = liverpool_df.apply(
@@ -909,7 +892,7 @@ liverpool_df['Win'] = liverpool_df.apply(
     lambda row: 1 if row['Goals'] > row['GoalsConceded'] else 0, axis=1)
 
 # Group and summarize
-summary = liverpool_df.groupby(['CovidPeriod', 'Venue']).agg({
+summary = liverpool_df.groupby(['CovidPeriod', 'Venue'], observed=True).agg({
     'Goals': 'mean',
     'GoalsConceded': 'mean',
     'Shots': 'mean',
@@ -1016,7 +999,7 @@ fig14.update_layout(
 )
 
 # ----- 3️⃣ Radar Chart: Overall Avg Comparison (Home vs Away) -----
-avg_metrics = summary.groupby('Venue')[['Goals', 'GoalsConceded', 'Shots', 'ShotsOnTarget', 'WinRate']].mean().reset_index()
+avg_metrics = summary.groupby('Venue', observed=True)[['Goals', 'GoalsConceded', 'Shots', 'ShotsOnTarget', 'WinRate']].mean().reset_index()
 
 fig14 = fig3 = go.Figure()
 
@@ -1044,11 +1027,11 @@ st.plotly_chart(fig14, use_container_width=True)
 
 
 
-team_performance = pd.read_csv("team_performance.csv")
+team_performance = load_dataset("team_performance.csv")
 print(team_performance.columns)
 
 
-df_copy = pd.read_csv("EPL_result.csv")
+df_copy = load_dataset("EPL_result.csv")
 df_copy["FullTimeResult"] = df_copy.apply(
     lambda row: "H" if row["G_Home"] > row["G_Away"]
     else "A" if row["G_Home"] < row["G_Away"]
@@ -1059,8 +1042,8 @@ df_copy["FullTimeResult"] = df_copy.apply(
 df_copy["AwayLoss"] = df_copy["FullTimeResult"] == "H"
 df_copy["HomeLoss"] = df_copy["FullTimeResult"] == "A"
 
-away_stats = df_copy.groupby("Away")[["AwayLoss"]].sum()
-home_stats = df_copy.groupby("Home")[["HomeLoss"]].sum()
+away_stats = df_copy.groupby("Away", observed=True)[["AwayLoss"]].sum()
+home_stats = df_copy.groupby("Home", observed=True)[["HomeLoss"]].sum()
 
 away_stats.columns = ["AwayLoss"]
 home_stats.columns = ["HomeLoss"]
@@ -1132,7 +1115,7 @@ df_copy["TeamLoss"] = (
 ).astype(int)
 
 team_losses_by_gw = (
-    df_copy.groupby("GW")["TeamLoss"].sum().sort_values(ascending=False)
+    df_copy.groupby("GW", observed=True)["TeamLoss"].sum().sort_values(ascending=False)
 )
 
 # Plot
@@ -1191,7 +1174,7 @@ team_analysis["LeadingTeam"] = team_analysis.apply(
 )
 
 # Group by leading team and calculate conversion rate
-team_conversion = team_analysis.groupby("LeadingTeam")["LeadHeld"].agg(["sum", "count"])
+team_conversion = team_analysis.groupby("LeadingTeam", observed=True)["LeadHeld"].agg(["sum", "count"])
 team_conversion["ConversionRate"] = (team_conversion["sum"] / team_conversion["count"]) * 100
 # Top 10 teams by conversion rate
 top_10 = team_conversion.sort_values("ConversionRate", ascending=False).head(10)
@@ -1219,7 +1202,7 @@ team_analysis["ComebackWin"] = (
 ).astype(int)
 
 # Group by team and compute remontada stats correctly
-remontada_stats = team_analysis.groupby("LeadingTeam").agg(
+remontada_stats = team_analysis.groupby("LeadingTeam", observed=True).agg(
     ComebackWins=('ComebackWin', 'sum'),
     TotalOpportunities=('ComebackWin', 'count')
 ).reset_index()
@@ -1251,7 +1234,7 @@ liverpool_leads = team_analysis[
 ]
 
 # Group by Season to compute sum and total
-liverpool_season_conversion = liverpool_leads.groupby("Season")["LeadHeld"].agg(["sum", "count"])
+liverpool_season_conversion = liverpool_leads.groupby("Season", observed=True)["LeadHeld"].agg(["sum", "count"])
 liverpool_season_conversion["ConversionRate"] = (
     liverpool_season_conversion["sum"] / liverpool_season_conversion["count"]
 ) * 100
@@ -1285,7 +1268,7 @@ df_copy["TotalShots"] = df_copy["HomeShots"] + df_copy["AwayShots"]
 df_copy["WinMargin"] = abs(df_copy["FullTimeHomeGoals"] - df_copy["FullTimeAwayGoals"])
 
 # Step 2: Group by Season and calculate average
-attack_trend = df_copy.groupby("Season")[
+attack_trend = df_copy.groupby("Season", observed=True)[
     ["TotalGoals", "TotalShots", "WinMargin"]
 ].mean()
 attack_trend = attack_trend.sort_index()
@@ -1327,7 +1310,7 @@ liverpool_only["TotalShots"] = liverpool_only["HomeShots"] + liverpool_only["Awa
 liverpool_only["WinMargin"] = abs(liverpool_only["FullTimeHomeGoals"] - liverpool_only["FullTimeAwayGoals"])
 
 # Step 3: Group by season and calculate mean trends
-liverpool_trend = liverpool_only.groupby("Season")[["TotalGoals", "TotalShots", "WinMargin"]].mean()
+liverpool_trend = liverpool_only.groupby("Season", observed=True)[["TotalGoals", "TotalShots", "WinMargin"]].mean()
 liverpool_trend = liverpool_trend.sort_index()
 
 # Step 4: Plot
@@ -1349,7 +1332,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load your dataset (update filename if needed)
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Step 1: Filter only Liverpool games (home or away)
 liverpool_only = df[
@@ -1365,7 +1348,7 @@ liverpool_only["TotalShots"] = liverpool_only["HomeShots"] + liverpool_only["Awa
 liverpool_only["WinMargin"] = abs(liverpool_only["FullTimeHomeGoals"] - liverpool_only["FullTimeAwayGoals"])
 
 # Step 4: Group by Season and Venue
-grouped = liverpool_only.groupby(["Season", "Venue"])[["TotalGoals", "TotalShots", "WinMargin"]].mean().reset_index()
+grouped = liverpool_only.groupby(["Season", "Venue"], observed=True)[["TotalGoals", "TotalShots", "WinMargin"]].mean().reset_index()
 
 # Step 5: Pivot to prepare for plotting
 pivot_goals = grouped.pivot(index="Season", columns="Venue", values="TotalGoals")
@@ -1452,7 +1435,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load your data (update file name if needed)
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Step 1: Filter only Liverpool matches
 liverpool_df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1462,7 +1445,7 @@ liverpool_df["TotalGoals"] = liverpool_df["FullTimeHomeGoals"] + liverpool_df["F
 liverpool_df["TotalShots"] = liverpool_df["HomeShots"] + liverpool_df["AwayShots"]
 
 # Step 3: Group by Season and calculate averages
-attack_trend = liverpool_df.groupby("Season")[["TotalGoals", "TotalShots"]].mean()
+attack_trend = liverpool_df.groupby("Season", observed=True)[["TotalGoals", "TotalShots"]].mean()
 
 # Step 4: Calculate shot conversion rate (%)
 attack_trend["ShotConversion"] = (attack_trend["TotalGoals"] / attack_trend["TotalShots"]) * 100
@@ -1523,7 +1506,7 @@ df_copy["TotalFouls"] = df_copy["HomeFouls"] + df_copy["AwayFouls"]
 df_copy["TotalYellowCards"] = df_copy["HomeYellowCards"] + df_copy["AwayYellowCards"]
 df_copy["TotalRedCards"] = df_copy["HomeRedCards"] + df_copy["AwayRedCards"]
 
-physical_trends = df_copy.groupby("Season")[
+physical_trends = df_copy.groupby("Season", observed=True)[
     ["TotalFouls", "TotalYellowCards", "TotalRedCards"]
 ].mean()
 
@@ -1551,7 +1534,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load your dataset
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Step 1: Filter Liverpool matches
 liverpool_df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1562,7 +1545,7 @@ liverpool_df["TotalYellowCards"] = liverpool_df["HomeYellowCards"] + liverpool_d
 liverpool_df["TotalRedCards"] = liverpool_df["HomeRedCards"] + liverpool_df["AwayRedCards"]
 
 # Step 3: Group by season and calculate average per match
-physical_trends = liverpool_df.groupby("Season")[["TotalFouls", "TotalYellowCards", "TotalRedCards"]].mean()
+physical_trends = liverpool_df.groupby("Season", observed=True)[["TotalFouls", "TotalYellowCards", "TotalRedCards"]].mean()
 
 # Step 4: Plot
 fig, axes = plt.subplots(1, 3, figsize=(18, 6), sharex=True)
@@ -1590,7 +1573,7 @@ import matplotlib.pyplot as plt
 import pandas as pd
 
 # Load data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter Liverpool games
 liverpool_df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1640,10 +1623,10 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load data (replace with your actual DataFrame if already loaded)
-df_copy = pd.read_csv("epl_final.csv")
+df_copy = load_dataset("epl_final.csv")
 
 # Home discipline
-home_cards = df_copy.groupby("HomeTeam").agg(
+home_cards = df_copy.groupby("HomeTeam", observed=True).agg(
     HomeYellows=("HomeYellowCards", "sum"),
     HomeReds=("HomeRedCards", "sum"),
     HomeFouls=("HomeFouls", "sum"),
@@ -1651,7 +1634,7 @@ home_cards = df_copy.groupby("HomeTeam").agg(
 )
 
 # Away discipline
-away_cards = df_copy.groupby("AwayTeam").agg(
+away_cards = df_copy.groupby("AwayTeam", observed=True).agg(
     AwayYellows=("AwayYellowCards", "sum"),
     AwayReds=("AwayRedCards", "sum"),
     AwayFouls=("AwayFouls", "sum"),
@@ -1735,14 +1718,14 @@ df_reds["RedCardOutcome"] = df_reds.apply(red_card_outcome, axis=1)
 df_with_red = df_reds[df_reds["RedCardTeam"] != "No Red"]
  #Add percent for each red card team category
 summary = (
-    df_with_red.groupby(["RedCardTeam", "RedCardOutcome"])
+    df_with_red.groupby(["RedCardTeam", "RedCardOutcome"], observed=True)
     .size()
     .reset_index(name="MatchCount")
 )
 
 summary["Percentage"] = (
     summary["MatchCount"]
-    / summary.groupby("RedCardTeam")["MatchCount"].transform("sum")
+    / summary.groupby("RedCardTeam", observed=True)["MatchCount"].transform("sum")
     * 100
 )
 
@@ -1781,7 +1764,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter Liverpool matches
 df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1813,12 +1796,12 @@ df["LiverpoolResult"] = df.apply(lfc_result, axis=1)
 df_red_only = df[df["RedCardTo"] != "No Red"]
 
 # Aggregate
-summary = df_red_only.groupby(["RedCardTo", "LiverpoolResult"]).size().reset_index(name="MatchCount")
+summary = df_red_only.groupby(["RedCardTo", "LiverpoolResult"], observed=True).size().reset_index(name="MatchCount")
 
 # Percentage
 summary["Percentage"] = (
     summary["MatchCount"] /
-    summary.groupby("RedCardTo")["MatchCount"].transform("sum")
+    summary.groupby("RedCardTo", observed=True)["MatchCount"].transform("sum")
 ) * 100
 
 # Plot
@@ -1855,7 +1838,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter only Liverpool matches
 df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1902,7 +1885,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 
 # Load dataset
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 
 # Filter Liverpool matches
 df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
@@ -1988,21 +1971,21 @@ lfc_reds[["Season", "LFC_RedCardVenue", "LiverpoolResult"]].to_csv("liverpool_re
 # defensive_ranking = team_def.sort_values("ConcededPerShot",ascending=False)
 # Defensive stats calculation using correct column names
 # Load the dataset
-df_copy = pd.read_csv("EPL_result.csv")
+df_copy = load_dataset("EPL_result.csv")
 
 # Optional: View the columns to verify
 print(df_copy.columns.tolist())
 
 # Group and sum goals conceded
-home_def = df_copy.groupby("Home")[["G_Away"]].sum().rename(columns={"G_Away": "GoalsConceded_Home"})
-away_def = df_copy.groupby("Away")[["G_Home"]].sum().rename(columns={"G_Home": "GoalsConceded_Away"})
+home_def = df_copy.groupby("Home", observed=True)[["G_Away"]].sum().rename(columns={"G_Away": "GoalsConceded_Home"})
+away_def = df_copy.groupby("Away", observed=True)[["G_Home"]].sum().rename(columns={"G_Home": "GoalsConceded_Away"})
 
 # Merge both into one DataFrame
 team_def = pd.concat([home_def, away_def], axis=1)
 
 # Calculate shots faced
-home_shots_faced = df_copy.groupby("Home")[["xG_Away"]].sum()
-away_shots_faced = df_copy.groupby("Away")[["xG_Home"]].sum()
+home_shots_faced = df_copy.groupby("Home", observed=True)[["xG_Away"]].sum()
+away_shots_faced = df_copy.groupby("Away", observed=True)[["xG_Home"]].sum()
 
 team_def["ShotsFaced"] = (home_shots_faced["xG_Away"] + away_shots_faced["xG_Home"])
 team_def["GoalsConceded"] = team_def["GoalsConceded_Home"] + team_def["GoalsConceded_Away"]
@@ -2054,8 +2037,8 @@ df_copy["FullTimeResult"] = df_copy.apply(get_result, axis=1)
 
 df_copy["IsDraw"] = df_copy["FullTimeResult"] == "D"
 draws = (
-    df_copy.groupby("Home")["IsDraw"].sum()
-    + df_copy.groupby("Away")["IsDraw"].sum()
+    df_copy.groupby("Home", observed=True)["IsDraw"].sum()
+    + df_copy.groupby("Away", observed=True)["IsDraw"].sum()
 )
 draws = draws.sort_values(ascending=False)
 
@@ -2075,7 +2058,7 @@ df_copy["HomeWin"] = (df_copy["FullTimeResult"] == "H").astype(int)
 df_copy["AwayWin"] = (df_copy["FullTimeResult"] == "A").astype(int)
 
 # 2. Group home stats
-home_stats = df_copy.groupby("HomeTeam").agg(
+home_stats = df_copy.groupby("HomeTeam", observed=True).agg(
     Goals_Home=("FullTimeHomeGoals", "sum"),
     Shots_Home=("HomeShots", "sum"),
     ShotsOnTarget_Home=("HomeShotsOnTarget", "sum"),
@@ -2087,7 +2070,7 @@ home_stats = df_copy.groupby("HomeTeam").agg(
 )
 
 # 3. Group away stats
-away_stats = df_copy.groupby("AwayTeam").agg(
+away_stats = df_copy.groupby("AwayTeam", observed=True).agg(
     Goals_Away=("FullTimeAwayGoals", "sum"),
     Shots_Away=("AwayShots", "sum"),
     ShotsOnTarget_Away=("AwayShotsOnTarget", "sum"),
@@ -2166,7 +2149,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load data
-df = pd.read_csv("epl_final.csv")
+df = load_dataset("epl_final.csv")
 print(df_copy.columns.tolist())
 print(df.head())              # See sample data
    # See actual column names
@@ -2189,7 +2172,7 @@ def get_result(row):
 lfc_df["Result"] = lfc_df.apply(get_result, axis=1)
 
 # Calculate win ratios for each venue
-venue_stats = lfc_df.groupby("Venue")["Result"].value_counts().unstack().fillna(0)
+venue_stats = lfc_df.groupby("Venue", observed=True)["Result"].value_counts().unstack().fillna(0)
 venue_stats["Total"] = venue_stats.sum(axis=1)
 venue_stats["Win Ratio"] = venue_stats["Win"] / venue_stats["Total"]
 
@@ -2275,7 +2258,7 @@ st.pyplot(plt)
 
 
 # Filter Liverpool shots
-liverpool_shots = pd.read_csv("shots_EPL_1920.csv")
+liverpool_shots = load_dataset("shots_EPL_1920.csv")
 
 # Filter only Liverpool shots (home team = Liverpool)
 liverpool_shots = liverpool_shots[liverpool_shots["h_team"] == "Liverpool"]
@@ -2284,11 +2267,11 @@ liverpool_shots = liverpool_shots[liverpool_shots["h_team"] == "Liverpool"]
 liverpool_goals = liverpool_shots[liverpool_shots["result"] == "Goal"]
 
 # Top 10 scorers
-top_scorers = liverpool_goals.groupby("player")["result"].count().sort_values(ascending=False).head(10)
+top_scorers = liverpool_goals.groupby("player", observed=True)["result"].count().sort_values(ascending=False).head(10)
 
 # Top 10 assist providers
 top_assists = liverpool_shots[liverpool_shots["player_assisted"].notna()]\
-    .groupby("player_assisted")["id"].count().sort_values(ascending=False).head(10)
+    .groupby("player_assisted", observed=True)["id"].count().sort_values(ascending=False).head(10)
 
 
 fig, axs = plt.subplots(1, 2, figsize=(16, 5))
@@ -2310,7 +2293,7 @@ import seaborn as sns
 import streamlit as st
 
 # Load data and filter by year
-liverpool_shots = pd.read_csv("shots_EPL_1920.csv")
+liverpool_shots = load_dataset("shots_EPL_1920.csv")
 liverpool_shots["date"] = pd.to_datetime(liverpool_shots["date"], errors="coerce")
 liverpool_shots = liverpool_shots[liverpool_shots["date"].dt.year.isin([2019, 2020])]
 
@@ -2346,7 +2329,7 @@ st.pyplot(fig)
 
 # ==== 2. Shot Type Bar Chart ====
 plt.figure(figsize=(12, 6))
-shot_types = liverpool_shots.groupby(["Venue", "shotType"])["id"].count().unstack().fillna(0)
+shot_types = liverpool_shots.groupby(["Venue", "shotType"], observed=True)["id"].count().unstack().fillna(0)
 shot_types.T.plot(kind='bar')
 plt.title("Liverpool Shot Types: Home vs Away")
 plt.ylabel("Number of Shots")
@@ -2355,15 +2338,15 @@ st.pyplot(plt)
 
 # ==== 3. Shot Situations Bar Chart ====
 plt.figure(figsize=(12, 6))
-situations = liverpool_shots.groupby(["Venue", "situation"])["id"].count().unstack().fillna(0)
+situations = liverpool_shots.groupby(["Venue", "situation"], observed=True)["id"].count().unstack().fillna(0)
 situations.T.plot(kind='bar')
 plt.title("Shot Situations: Home vs Away")
 plt.ylabel("Number of Shots")
 plt.tight_layout()
 st.pyplot(plt)
 
-home_xg = liverpool_shots[liverpool_shots["Venue"] == "Home"].groupby("player")["xG"].sum().sort_values(ascending=False).head(5)
-away_xg = liverpool_shots[liverpool_shots["Venue"] == "Away"].groupby("player")["xG"].sum().sort_values(ascending=False).head(5)
+home_xg = liverpool_shots[liverpool_shots["Venue"] == "Home"].groupby("player", observed=True)["xG"].sum().sort_values(ascending=False).head(5)
+away_xg = liverpool_shots[liverpool_shots["Venue"] == "Away"].groupby("player", observed=True)["xG"].sum().sort_values(ascending=False).head(5)
 
 fig, axs = plt.subplots(1, 2, figsize=(16, 5))
 sns.barplot(x=home_xg.values, y=home_xg.index, ax=axs[0])
@@ -2382,7 +2365,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load the dataset
-shots = pd.read_csv("shots_EPL_1920.csv")
+shots = load_dataset("shots_EPL_1920.csv")
 
 # Filter Liverpool shots
 liverpool_shots = shots[(shots["h_team"] == "Liverpool") | (shots["a_team"] == "Liverpool")].copy()
@@ -2392,38 +2375,20 @@ liverpool_shots["Venue"] = liverpool_shots.apply(
     lambda row: "Home" if row["h_team"] == "Liverpool" else "Away", axis=1
 )
 
-# Plotting heatmaps
-fig, axes = plt.subplots(1, 2, figsize=(18, 7))
-
-for ax, venue in zip(axes, ["Home", "Away"]):
-    subset = liverpool_shots[liverpool_shots["Venue"] == venue]
-    sns.kdeplot(
-        data=subset,
-        x="X",
-        y="Y",
-        fill=True,
-        thresh=0,
-        levels=100,
-        cmap="Reds",
-        ax=ax
-    )
-    ax.set_title(f"Liverpool Shot Density – {venue} Matches")
-    ax.set_xlim(0.7, 1.05)
-    ax.set_ylim(0.2, 0.9)
-    ax.set_aspect('equal')
-    ax.invert_yaxis()
-    ax.set_xlabel("Normalized X (Goal on the Right)")
-    ax.set_ylabel("Normalized Y (Pitch Height)")
-
-plt.tight_layout()
-st.pyplot(plt)
+# Plotting heatmaps (shared pitch grid and colour scale)
+fig = density_panels(
+    [(f"Liverpool Shot Density – {venue} Matches", liverpool_shots[liverpool_shots["Venue"] == venue])
+     for venue in ["Home", "Away"]],
+    shared_scale=True
+)
+st.plotly_chart(fig, use_container_width=True)
 
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load shot data
-shots = pd.read_csv("shots_EPL_1920.csv")
+shots = load_dataset("shots_EPL_1920.csv")
 
 # Filter Liverpool shots
 liverpool_shots = shots[(shots["h_team"] == "Liverpool") | (shots["a_team"] == "Liverpool")].copy()
@@ -2438,32 +2403,13 @@ key_players = ["Mohamed Salah", "Roberto Firmino"]
 player_shots = liverpool_shots[liverpool_shots["player"].isin(key_players)]
 
 # Plot: 2x2 grid (Home vs Away for each player)
-fig, axes = plt.subplots(2, 2, figsize=(16, 12), sharex=True, sharey=True)
-
-for i, player in enumerate(key_players):
-    for j, venue in enumerate(["Home", "Away"]):
-        subset = player_shots[(player_shots["player"] == player) & (player_shots["Venue"] == venue)]
-        ax = axes[i][j]
-        sns.kdeplot(
-            data=subset,
-            x="X",
-            y="Y",
-            fill=True,
-            thresh=0,
-            levels=100,
-            cmap="Reds",
-            ax=ax
-        )
-        ax.set_title(f"{player} – {venue} Matches", fontsize=12)
-        ax.set_xlim(0.7, 1.05)
-        ax.set_ylim(0.2, 0.9)
-        ax.set_aspect('equal')
-        ax.invert_yaxis()
-        ax.set_xlabel("Normalized X")
-        ax.set_ylabel("Normalized Y")
-
-plt.suptitle("Shot Density Heatmap: Mohamed Salah vs Roberto Firmino (Home & Away)", fontsize=16)
-plt.tight_layout(rect=[0, 0, 1, 0.96])
-st.pyplot(plt)
+fig = density_panels(
+    [(f"{player} – {venue} Matches",
+      player_shots[(player_shots["player"] == player) & (player_shots["Venue"] == venue)])
+     for player in key_players for venue in ["Home", "Away"]],
+    title="Shot Density Heatmap: Mohamed Salah vs Roberto Firmino (Home & Away)",
+    shared_scale=True
+)
+st.plotly_chart(fig, use_container_width=True)
 
 
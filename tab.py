@@ -5,6 +5,10 @@ import plotly.graph_objects as go
 from PIL import Image
 import matplotlib.pyplot as plt
 import seaborn as sns
+from data_registry import load_dataset
+from eras import era_labels
+from match_enrichment import enrich_matches
+from shot_density import density_panels
 
 # ---------- PAGE CONFIG & LOGO ----------
 st.set_page_config(page_title="Liverpool FC Dashboard", layout="wide")
@@ -18,25 +22,9 @@ theme = st.sidebar.radio("🎨 Select Theme", ["Light", "Dark"], index=0)
 plotly_template = "seaborn" if theme == "Light" else "plotly_dark"
 
 # ---------- DATA PREPARATION ----------
-df = pd.read_csv('Liverpool_2015_2023_Matches.csv')
-df['Date'] = pd.to_datetime(df['Date'])
-df['Venue'] = df.apply(lambda row: 'Home' if row['Home'] == 'Liverpool' else 'Away', axis=1)
-
-def get_result(row):
-    if row['Venue'] == 'Home':
-        return 'Win' if row['HomeGoals'] > row['AwayGoals'] else 'Draw' if row['HomeGoals'] == row['AwayGoals'] else 'Loss'
-    else:
-        return 'Win' if row['AwayGoals'] > row['HomeGoals'] else 'Draw' if row['AwayGoals'] == row['HomeGoals'] else 'Loss'
-df['Result'] = df.apply(get_result, axis=1)
-
-def covid_period(date):
-    if date < pd.to_datetime('2020-03-01'):
-        return 'Pre-COVID'
-    elif date < pd.to_datetime('2021-07-01'):
-        return 'During COVID'
-    else:
-        return 'Post-COVID'
-df['CovidPeriod'] = df['Date'].apply(covid_period)
+df = enrich_matches(load_dataset('Liverpool_2015_2023_Matches.csv'))
+
+df['CovidPeriod'] = era_labels(df['Date'], 'covid_seasons')
 
 # ---------- TABS ----------
 tab1, tab2, tab3, tab4,tab5,tab6,tab7,tab8,tab9= st.tabs(["📊 Venue Win Stats", "🦠 COVID Period Breakdown", "📈 Timeline & Goals", "📊 EPL xG Comparison,","🕰️ Club Trends & Manager Era","📊 Team Momentum & Conversion","🔥 Attacking Trends","🛡️ Physicality & Discipline","🏆 Liverpool's 2019 & 2020 Title-Winning Performance"])
@@ -44,7 +32,7 @@ tab1, tab2, tab3, tab4,tab5,tab6,tab7,tab8,tab9= st.tabs(["📊 Venue Win Stats"
 # ================= TAB 1 =================
 with tab1:
     st.subheader("🏠 Liverpool Venue Win Summary (2015–2023)")
-    summary = df.groupby('Venue').agg(
+    summary = df.groupby('Venue', observed=True).agg(
         Total_Matches=('Result', 'count'),
         Wins=('Result', lambda x: (x == 'Win').sum())
     ).reset_index()
@@ -76,9 +64,9 @@ with tab2:
 
     with col1:
         st.markdown("#### 📊 Result Stack by COVID Period")
-        summary = df.groupby(['CovidPeriod', 'Venue', 'Result']).size().reset_index(name='Count')
+        summary = df.groupby(['CovidPeriod', 'Venue', 'Result'], observed=True).size().reset_index(name='Count')
         summary['Result_Grouped'] = summary['Result'].apply(lambda x: 'Wins' if x == 'Win' else 'Other')
-        stacked = summary.groupby(['CovidPeriod', 'Venue', 'Result_Grouped'])['Count'].sum().reset_index()
+        stacked = summary.groupby(['CovidPeriod', 'Venue', 'Result_Grouped'], observed=True)['Count'].sum().reset_index()
 
         fig3 = px.bar(stacked, x='Venue', y='Count', color='Result_Grouped',
                       facet_col='CovidPeriod', barmode='stack',
@@ -89,8 +77,8 @@ with tab2:
 
     with col2:
         st.markdown("#### ⚖️ Result % Breakdown")
-        outcome = df.groupby(['Venue', 'Result']).size().reset_index(name='Count')
-        outcome['Percent'] = outcome['Count'] / outcome.groupby('Venue')['Count'].transform('sum') * 100
+        outcome = df.groupby(['Venue', 'Result'], observed=True).size().reset_index(name='Count')
+        outcome['Percent'] = outcome['Count'] / outcome.groupby('Venue', observed=True)['Count'].transform('sum') * 100
 
         fig4 = px.bar(outcome, x='Venue', y='Percent', color='Result', text=outcome['Percent'].round(1),
                       barmode='stack', template=plotly_template)
@@ -105,7 +93,7 @@ with tab3:
     with col1:
         st.markdown("#### ⏳ Wins Over Time")
         df['Year'] = df['Date'].dt.year
-        wins_time = df[df['Result'] == 'Win'].groupby(['Year', 'Venue']).size().reset_index(name='Wins')
+        wins_time = df[df['Result'] == 'Win'].groupby(['Year', 'Venue'], observed=True).size().reset_index(name='Wins')
         fig5 = px.line(wins_time, x='Year', y='Wins', color='Venue', markers=True,
                        color_discrete_map={'Home': '#FF4136', 'Away': '#2ECC40'},
                        template=plotly_template)
@@ -113,7 +101,6 @@ with tab3:
 
     with col2:
         st.markdown("#### 🎯 Goals per Match")
-        df['GoalsFor'] = df.apply(lambda row: row['HomeGoals'] if row['Venue'] == 'Home' else row['AwayGoals'], axis=1)
         fig6 = px.box(df, x='Venue', y='GoalsFor', points='all',
                       color='Venue',
                       color_discrete_map={'Home': '#FF4136', 'Away': '#2ECC40'},
@@ -121,7 +108,7 @@ with tab3:
         st.plotly_chart(fig6, use_container_width=True)
 
     st.markdown("#### 🧬 COVID Period Result Breakdown")
-    covid_outcome = df.groupby(['CovidPeriod', 'Venue', 'Result']).size().reset_index(name='Count')
+    covid_outcome = df.groupby(['CovidPeriod', 'Venue', 'Result'], observed=True).size().reset_index(name='Count')
     fig7 = px.bar(covid_outcome, x='Venue', y='Count', color='Result', barmode='stack',
                   facet_col='CovidPeriod',
                   color_discrete_sequence=px.colors.qualitative.Bold,
@@ -137,8 +124,8 @@ with tab3:
 # ================= TAB 4 =================
 with tab4:
     st.subheader("📊 EPL 2020/21 xG Comparison")
-    df_raw = pd.read_csv("EPL_result.csv")
-    home_stats = df_raw.groupby('Home').agg(
+    df_raw = load_dataset("EPL_result.csv")
+    home_stats = df_raw.groupby('Home', observed=True).agg(
         Avg_xG_Home=('xG_Home', 'mean'),
         Avg_G_Home=('G_Home', 'mean')
     ).reset_index()
@@ -179,11 +166,11 @@ with tab4:
     )
     home_stats_melted.sort_values(by='Goals', ascending=False, inplace=True)
     st.plotly_chart(fig44, use_container_width=True)
-    df = pd.read_csv("EPL_result.csv")
+    df = load_dataset("EPL_result.csv")
     team_abb = { 'Everton': 'EVE', 'Aston Villa': 'AVL', 'Leicester City': 'LEI', 'Arsenal': 'ARS', 'Liverpool': 'LIV', 'Tottenham': 'TOT',
-        'Chelsea': 'CHE', 'Leeds United': 'LEE', 'Newcastle Utd': 'NEW', 'West Ham': 'WHU', 'Southampton': 'SOU', 'Crystal Palace': 'CRY',
-        'Wolves': 'WOL', 'Manchester City': 'MCI', 'Brighton': 'BHA', 'Manchester Utd': 'MUN', 'West Brom': 'WBA', 'Burnley': 'BUR',
-        'Sheffield Utd': 'SHU', 'Fulham': 'FUL' }
+        'Chelsea': 'CHE', 'Leeds United': 'LEE', 'Newcastle United': 'NEW', 'West Ham': 'WHU', 'Southampton': 'SOU', 'Crystal Palace': 'CRY',
+        'Wolves': 'WOL', 'Manchester City': 'MCI', 'Brighton': 'BHA', 'Manchester United': 'MUN', 'West Brom': 'WBA', 'Burnley': 'BUR',
+        'Sheffield United': 'SHU', 'Fulham': 'FUL' }
 
     df['Home'] = df['Home'].map(team_abb)
     df['Away'] = df['Away'].map(team_abb)
@@ -270,7 +257,7 @@ with tab4:
 
     st.markdown("#### 🔢 Avg xG Diff by Home Team")
     df['xG_diff'] = df['xG_Home'] - df['xG_Away']
-    team_xg_diff = df.groupby('Home')['xG_diff'].mean().sort_values(ascending=False).reset_index()
+    team_xg_diff = df.groupby('Home', observed=True)['xG_diff'].mean().sort_values(ascending=False).reset_index()
     fig8 = px.bar(team_xg_diff, x='Home', y='xG_diff', template=plotly_template)
     st.plotly_chart(fig8, use_container_width=True)
 with tab5:
@@ -278,7 +265,7 @@ with tab5:
 
     col1, col2 = st.columns(2)
     with col1:
-        stats_df = pd.read_csv("stats.csv")
+        stats_df = load_dataset("stats.csv")
         liverpool_stats = stats_df[stats_df['team'] == 'Liverpool']
         liverpool_stats = liverpool_stats[['season', 'total_scoring_att', 'ontarget_scoring_att', 'goals', 'wins']]
         liverpool_melted = liverpool_stats.melt(id_vars='season', var_name='Metric', value_name='Value')
@@ -296,7 +283,7 @@ with tab5:
         st.plotly_chart(fig10, use_container_width=True)
 
     with col2:
-        managers_df = pd.read_csv("liverpoolfc_managers.csv", sep=';')
+        managers_df = load_dataset("liverpoolfc_managers.csv", sep=';')
         managers_df['From'] = pd.to_datetime(managers_df['From'])
         managers_df['To'] = pd.to_datetime(managers_df['To'])
         managers_df['Days'] = (managers_df['To'] - managers_df['From']).dt.days
@@ -389,27 +376,18 @@ with tab5:
     st.plotly_chart(fig0, use_container_width=True)
 
     # ----- COVID Period Analysis & Radar Chart -----
-    df = pd.read_csv("epl_final.csv")
-    liverpool_df = df[(df['HomeTeam'] == 'Liverpool') | (df['AwayTeam'] == 'Liverpool')].copy()
-    liverpool_df['Venue'] = liverpool_df['HomeTeam'].apply(lambda x: 'Home' if x == 'Liverpool' else 'Away')
-    liverpool_df['MatchDate'] = pd.to_datetime(liverpool_df['MatchDate'])
-
-    def covid_period(date):
-        if date < pd.to_datetime('2020-03-01'):
-            return 'Pre-COVID'
-        elif date <= pd.to_datetime('2021-07-01'):
-            return 'During-COVID'
-        else:
-            return 'Post-COVID'
-
-    liverpool_df['CovidPeriod'] = liverpool_df['MatchDate'].apply(covid_period)
-    liverpool_df['Goals'] = liverpool_df.apply(lambda row: row['FullTimeHomeGoals'] if row['Venue'] == 'Home' else row['FullTimeAwayGoals'], axis=1)
-    liverpool_df['GoalsConceded'] = liverpool_df.apply(lambda row: row['FullTimeAwayGoals'] if row['Venue'] == 'Home' else row['FullTimeHomeGoals'], axis=1)
-    liverpool_df['Shots'] = liverpool_df.apply(lambda row: row['HomeShots'] if row['Venue'] == 'Home' else row['AwayShots'], axis=1)
-    liverpool_df['ShotsOnTarget'] = liverpool_df.apply(lambda row: row['HomeShotsOnTarget'] if row['Venue'] == 'Home' else row['AwayShotsOnTarget'], axis=1)
-    liverpool_df['Win'] = liverpool_df.apply(lambda row: 1 if row['Goals'] > row['GoalsConceded'] else 0, axis=1)
-
-    summary = liverpool_df.groupby(['CovidPeriod', 'Venue']).agg({
+    df = load_dataset("epl_final.csv")
+    liverpool_df = enrich_matches(df)
+
+    liverpool_df['CovidPeriod'] = era_labels(liverpool_df['MatchDate'], 'covid_seasons').rename_categories({'During COVID': 'During-COVID'})
+    liverpool_df['Goals'] = liverpool_df['GoalsFor']
+    liverpool_df['GoalsConceded'] = liverpool_df['GoalsAgainst']
+    is_home = liverpool_df['Venue'] == 'Home'
+    liverpool_df['Shots'] = liverpool_df['HomeShots'].where(is_home, liverpool_df['AwayShots'])
+    liverpool_df['ShotsOnTarget'] = liverpool_df['HomeShotsOnTarget'].where(is_home, liverpool_df['AwayShotsOnTarget'])
+    liverpool_df['Win'] = (liverpool_df['Result'] == 'Win').astype(int)
+
+    summary = liverpool_df.groupby(['CovidPeriod', 'Venue'], observed=True).agg({
         'Goals': 'mean',
         'GoalsConceded': 'mean',
         'Shots': 'mean',
@@ -450,7 +428,7 @@ with tab5:
         st.plotly_chart(fig13, use_container_width=True)
 
     with col6:
-        avg_metrics = summary.groupby('Venue')[['Goals', 'GoalsConceded', 'Shots', 'ShotsOnTarget', 'WinRate']].mean().reset_index()
+        avg_metrics = summary.groupby('Venue', observed=True)[['Goals', 'GoalsConceded', 'Shots', 'ShotsOnTarget', 'WinRate']].mean().reset_index()
         fig14 = go.Figure()
         for _, row in avg_metrics.iterrows():
             fig14.add_trace(go.Scatterpolar(
@@ -474,7 +452,7 @@ with tab5:
 with tab6:
     st.subheader("📊 Team Momentum & Conversion")
 
-    df_copy = pd.read_csv("EPL_result.csv")
+    df_copy = load_dataset("EPL_result.csv")
     df_copy["FullTimeResult"] = df_copy.apply(
         lambda row: "H" if row["G_Home"] > row["G_Away"]
         else "A" if row["G_Home"] < row["G_Away"]
@@ -484,8 +462,8 @@ with tab6:
     df_copy["AwayLoss"] = df_copy["FullTimeResult"] == "H"
     df_copy["HomeLoss"] = df_copy["FullTimeResult"] == "A"
 
-    away_stats = df_copy.groupby("Away")["AwayLoss"].sum()
-    home_stats = df_copy.groupby("Home")["HomeLoss"].sum()
+    away_stats = df_copy.groupby("Away", observed=True)["AwayLoss"].sum()
+    home_stats = df_copy.groupby("Home", observed=True)["HomeLoss"].sum()
     team_performance_l = pd.concat([home_stats, away_stats], axis=1).fillna(0)
 
     col1, col2 = st.columns(2)
@@ -512,7 +490,7 @@ with tab6:
             ((team_analysis["HalfTimeResult"] == "A") & (team_analysis["FullTimeResult"] == "A"))
         ).astype(int)
         team_analysis["LeadingTeam"] = team_analysis.apply(lambda row: row["HomeTeam"] if row["HalfTimeResult"] == "H" else row["AwayTeam"], axis=1)
-        team_conversion = team_analysis.groupby("LeadingTeam")["LeadHeld"].agg(["sum", "count"])
+        team_conversion = team_analysis.groupby("LeadingTeam", observed=True)["LeadHeld"].agg(["sum", "count"])
         team_conversion["ConversionRate"] = (team_conversion["sum"] / team_conversion["count"]) * 100
         top_10 = team_conversion.sort_values("ConversionRate", ascending=False).head(10)
         fig8, ax8 = plt.subplots(figsize=(6, 4))
@@ -529,7 +507,7 @@ with tab6:
             ((team_analysis["HalfTimeResult"] == "A") & (team_analysis["FullTimeResult"] == "H")) |
             ((team_analysis["HalfTimeResult"] == "H") & (team_analysis["FullTimeResult"] == "A"))
         ).astype(int)
-        remontada_stats = team_analysis.groupby("LeadingTeam").agg(ComebackWins=('ComebackWin', 'sum'), TotalOpportunities=('ComebackWin', 'count')).reset_index()
+        remontada_stats = team_analysis.groupby("LeadingTeam", observed=True).agg(ComebackWins=('ComebackWin', 'sum'), TotalOpportunities=('ComebackWin', 'count')).reset_index()
         remontada_stats["RemontadaRate"] = (remontada_stats["ComebackWins"] / remontada_stats["TotalOpportunities"]) * 100
         top_remontadas = remontada_stats.sort_values("RemontadaRate", ascending=False).tail(10)
         fig9, ax9 = plt.subplots(figsize=(6, 4))
@@ -545,7 +523,7 @@ with tab6:
             (((team_analysis["HalfTimeResult"] == "H") & (team_analysis["HomeTeam"] == "Liverpool")) |
              ((team_analysis["HalfTimeResult"] == "A") & (team_analysis["AwayTeam"] == "Liverpool")))
         ]
-        liverpool_season_conversion = liverpool_leads.groupby("Season")["LeadHeld"].agg(["sum", "count"])
+        liverpool_season_conversion = liverpool_leads.groupby("Season", observed=True)["LeadHeld"].agg(["sum", "count"])
         liverpool_season_conversion["ConversionRate"] = (
             liverpool_season_conversion["sum"] / liverpool_season_conversion["count"]
         ) * 100
@@ -558,13 +536,13 @@ with tab6:
 with tab7:
     st.subheader("🔥 Attacking Trends: League & Liverpool")
 
-    df_full = pd.read_csv("epl_final.csv")
+    df_full = load_dataset("epl_final.csv")
     df_copy = df_full.copy()
 
     df_copy["TotalGoals"] = df_copy["FullTimeHomeGoals"] + df_copy["FullTimeAwayGoals"]
     df_copy["TotalShots"] = df_copy["HomeShots"] + df_copy["AwayShots"]
     df_copy["WinMargin"] = abs(df_copy["FullTimeHomeGoals"] - df_copy["FullTimeAwayGoals"])
-    attack_trend = df_copy.groupby("Season")[["TotalGoals", "TotalShots", "WinMargin"]].mean().sort_index()
+    attack_trend = df_copy.groupby("Season", observed=True)[["TotalGoals", "TotalShots", "WinMargin"]].mean().sort_index()
 
     col1, col2 = st.columns(2)
     with col1:
@@ -585,7 +563,7 @@ with tab7:
         lfc_only["TotalGoals"] = lfc_only["FullTimeHomeGoals"] + lfc_only["FullTimeAwayGoals"]
         lfc_only["TotalShots"] = lfc_only["HomeShots"] + lfc_only["AwayShots"]
         lfc_only["WinMargin"] = abs(lfc_only["FullTimeHomeGoals"] - lfc_only["FullTimeAwayGoals"])
-        lfc_trend = lfc_only.groupby("Season")[["TotalGoals", "TotalShots", "WinMargin"]].mean().sort_index()
+        lfc_trend = lfc_only.groupby("Season", observed=True)[["TotalGoals", "TotalShots", "WinMargin"]].mean().sort_index()
         fig2, ax2 = plt.subplots(figsize=(6, 4))
         ax2.plot(lfc_trend.index, lfc_trend["TotalGoals"], marker="o", color="red", label="Goals")
         ax2.plot(lfc_trend.index, lfc_trend["TotalShots"], marker="s", color="blue", label="Shots")
@@ -598,7 +576,7 @@ with tab7:
 
     st.markdown("### 🏠 Home vs Away Breakdown for Liverpool")
     lfc_only["Venue"] = lfc_only["HomeTeam"].apply(lambda x: "Home" if x == "Liverpool" else "Away")
-    grouped = lfc_only.groupby(["Season", "Venue"])[["TotalGoals", "TotalShots", "WinMargin"]].mean().reset_index()
+    grouped = lfc_only.groupby(["Season", "Venue"], observed=True)[["TotalGoals", "TotalShots", "WinMargin"]].mean().reset_index()
 
     pivot_goals = grouped.pivot(index="Season", columns="Venue", values="TotalGoals")
     pivot_shots = grouped.pivot(index="Season", columns="Venue", values="TotalShots")
@@ -644,7 +622,7 @@ with tab8:
         df_copy["TotalFouls"] = df_copy["HomeFouls"] + df_copy["AwayFouls"]
         df_copy["TotalYellowCards"] = df_copy["HomeYellowCards"] + df_copy["AwayYellowCards"]
         df_copy["TotalRedCards"] = df_copy["HomeRedCards"] + df_copy["AwayRedCards"]
-        physical_trends = df_copy.groupby("Season")[["TotalFouls", "TotalYellowCards", "TotalRedCards"]].mean()
+        physical_trends = df_copy.groupby("Season", observed=True)[["TotalFouls", "TotalYellowCards", "TotalRedCards"]].mean()
 
         fig, axes = plt.subplots(1, 3, figsize=(18, 6), sharex=True)
         metrics = ["TotalFouls", "TotalYellowCards", "TotalRedCards"]
@@ -668,7 +646,7 @@ with tab8:
         liverpool_df["TotalFouls"] = liverpool_df["HomeFouls"] + liverpool_df["AwayFouls"]
         liverpool_df["TotalYellowCards"] = liverpool_df["HomeYellowCards"] + liverpool_df["AwayYellowCards"]
         liverpool_df["TotalRedCards"] = liverpool_df["HomeRedCards"] + liverpool_df["AwayRedCards"]
-        physical_trends_lfc = liverpool_df.groupby("Season")[["TotalFouls", "TotalYellowCards", "TotalRedCards"]].mean()
+        physical_trends_lfc = liverpool_df.groupby("Season", observed=True)[["TotalFouls", "TotalYellowCards", "TotalRedCards"]].mean()
 
         fig_lfc, axes_lfc = plt.subplots(1, 3, figsize=(18, 6), sharex=True)
         for i, ax in enumerate(axes_lfc):
@@ -684,11 +662,11 @@ with tab8:
 
         # 🔴 Liverpool-specific line plots
     st.markdown("#### 🟥 Liverpool Physicality Trends")
-    liverpool_df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
+    liverpool_df = enrich_matches(df)
     liverpool_df["TotalFouls"] = liverpool_df["HomeFouls"] + liverpool_df["AwayFouls"]
     liverpool_df["TotalYellowCards"] = liverpool_df["HomeYellowCards"] + liverpool_df["AwayYellowCards"]
     liverpool_df["TotalRedCards"] = liverpool_df["HomeRedCards"] + liverpool_df["AwayRedCards"]
-    physical_trends_lfc = liverpool_df.groupby("Season")[["TotalFouls", "TotalYellowCards", "TotalRedCards"]].mean()
+    physical_trends_lfc = liverpool_df.groupby("Season", observed=True)[["TotalFouls", "TotalYellowCards", "TotalRedCards"]].mean()
 
     fig_lfc, axes_lfc = plt.subplots(1, 3, figsize=(18, 6), sharex=True)
     for i, ax in enumerate(axes_lfc):
@@ -704,14 +682,6 @@ with tab8:
 
     # 📊 Seaborn catplots: Liverpool Physicality by Venue & Result
     st.markdown("#### ⚖️ Liverpool Physicality Split by Venue & Result")
-    liverpool_df["Venue"] = liverpool_df["HomeTeam"].apply(lambda x: "Home" if x == "Liverpool" else "Away")
-    liverpool_df["GoalsFor"] = liverpool_df.apply(
-        lambda row: row["FullTimeHomeGoals"] if row["Venue"] == "Home" else row["FullTimeAwayGoals"], axis=1)
-    liverpool_df["GoalsAgainst"] = liverpool_df.apply(
-        lambda row: row["FullTimeAwayGoals"] if row["Venue"] == "Home" else row["FullTimeHomeGoals"], axis=1)
-    liverpool_df["Result"] = liverpool_df.apply(
-        lambda row: "Win" if row["GoalsFor"] > row["GoalsAgainst"] else
-        ("Loss" if row["GoalsFor"] < row["GoalsAgainst"] else "Draw"), axis=1)
 
     liverpool_df["Fouls"] = liverpool_df["HomeFouls"] + liverpool_df["AwayFouls"]
     liverpool_df["YellowCards"] = liverpool_df["HomeYellowCards"] + liverpool_df["AwayYellowCards"]
@@ -740,8 +710,8 @@ with tab8:
 
     with col2:
         st.subheader("Discipline: Away vs Home (Aggression Delta)")
-        home_cards = df.groupby("HomeTeam").agg(HomeYellows=("HomeYellowCards", "sum"), HomeReds=("HomeRedCards", "sum"), HomeGames=("HomeTeam", "count"))
-        away_cards = df.groupby("AwayTeam").agg(AwayYellows=("AwayYellowCards", "sum"), AwayReds=("AwayRedCards", "sum"), AwayGames=("AwayTeam", "count"))
+        home_cards = df.groupby("HomeTeam", observed=True).agg(HomeYellows=("HomeYellowCards", "sum"), HomeReds=("HomeRedCards", "sum"), HomeGames=("HomeTeam", "count"))
+        away_cards = df.groupby("AwayTeam", observed=True).agg(AwayYellows=("AwayYellowCards", "sum"), AwayReds=("AwayRedCards", "sum"), AwayGames=("AwayTeam", "count"))
         discipline = home_cards.join(away_cards)
         discipline["CardsPerGame_Home"] = (discipline["HomeYellows"] + discipline["HomeReds"]) / discipline["HomeGames"]
         discipline["CardsPerGame_Away"] = (discipline["AwayYellows"] + discipline["AwayReds"]) / discipline["AwayGames"]
@@ -784,12 +754,12 @@ with tab8:
     col5, col6 = st.columns(2)
     with col5:
         st.markdown("#### Defensive Efficiency (Goals Conceded / xG Faced)")
-        df_copy = pd.read_csv("EPL_result.csv")
-        home_def = df_copy.groupby("Home")[["G_Away"]].sum().rename(columns={"G_Away": "GoalsConceded_Home"})
-        away_def = df_copy.groupby("Away")[["G_Home"]].sum().rename(columns={"G_Home": "GoalsConceded_Away"})
+        df_copy = load_dataset("EPL_result.csv")
+        home_def = df_copy.groupby("Home", observed=True)[["G_Away"]].sum().rename(columns={"G_Away": "GoalsConceded_Home"})
+        away_def = df_copy.groupby("Away", observed=True)[["G_Home"]].sum().rename(columns={"G_Home": "GoalsConceded_Away"})
         team_def = pd.concat([home_def, away_def], axis=1).fillna(0)
-        home_shots = df_copy.groupby("Home")[["xG_Away"]].sum()
-        away_shots = df_copy.groupby("Away")[["xG_Home"]].sum()
+        home_shots = df_copy.groupby("Home", observed=True)[["xG_Away"]].sum()
+        away_shots = df_copy.groupby("Away", observed=True)[["xG_Home"]].sum()
         team_def["ShotsFaced"] = home_shots["xG_Away"] + away_shots["xG_Home"]
         team_def["GoalsConceded"] = team_def["GoalsConceded_Home"] + team_def["GoalsConceded_Away"]
         team_def["ConcededPerShot"] = team_def["GoalsConceded"] / team_def["ShotsFaced"]
@@ -804,7 +774,7 @@ with tab8:
         st.markdown("#### Teams with Most Draws")
         df_copy["FullTimeResult"] = df_copy.apply(lambda row: "H" if row["G_Home"] > row["G_Away"] else "A" if row["G_Home"] < row["G_Away"] else "D", axis=1)
         df_copy["IsDraw"] = df_copy["FullTimeResult"] == "D"
-        draws = df_copy.groupby("Home")["IsDraw"].sum() + df_copy.groupby("Away")["IsDraw"].sum()
+        draws = df_copy.groupby("Home", observed=True)["IsDraw"].sum() + df_copy.groupby("Away", observed=True)["IsDraw"].sum()
         draws = draws.sort_values(ascending=False)
         fig, ax = plt.subplots(figsize=(10, 6))
         sns.barplot(x=draws.head(10).values, y=draws.head(10).index, palette="Blues_d", ax=ax)
@@ -820,18 +790,9 @@ with tab9:
     grid_col1, grid_col2 = st.columns(2)
 
     with grid_col1:
-        df = pd.read_csv("epl_final.csv")
-        lfc_df = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
-        lfc_df["Venue"] = lfc_df["HomeTeam"].apply(lambda x: "Home" if x == "Liverpool" else "Away")
-
-        def get_result(row):
-            if row["HomeTeam"] == "Liverpool":
-                return "Win" if row["FullTimeResult"] == "H" else "Draw" if row["FullTimeResult"] == "D" else "Loss"
-            else:
-                return "Win" if row["FullTimeResult"] == "A" else "Draw" if row["FullTimeResult"] == "D" else "Loss"
-
-        lfc_df["Result"] = lfc_df.apply(get_result, axis=1)
-        venue_stats = lfc_df.groupby("Venue")["Result"].value_counts().unstack().fillna(0)
+        df = load_dataset("epl_final.csv")
+        lfc_df = enrich_matches(df)
+        venue_stats = lfc_df.groupby("Venue", observed=True)["Result"].value_counts().unstack().fillna(0)
         venue_stats["Total"] = venue_stats.sum(axis=1)
         venue_stats["Win Ratio"] = venue_stats["Win"] / venue_stats["Total"]
         venue_stats_reset = venue_stats.reset_index()
@@ -847,13 +808,10 @@ with tab9:
         st.pyplot(plt)
 
     with grid_col2:
-        liverpool_matches = df[(df["HomeTeam"] == "Liverpool") | (df["AwayTeam"] == "Liverpool")].copy()
-        liverpool_matches["MatchDate"] = pd.to_datetime(liverpool_matches["MatchDate"], errors="coerce")
+        liverpool_matches = enrich_matches(df)
         liverpool_matches = liverpool_matches[liverpool_matches["MatchDate"].dt.year.isin([2019, 2020])].sort_values("MatchDate")
-        liverpool_matches["Liverpool Goals"] = liverpool_matches.apply(
-            lambda row: row["FullTimeHomeGoals"] if row["HomeTeam"] == "Liverpool" else row["FullTimeAwayGoals"], axis=1)
-        liverpool_matches["Opponent Goals"] = liverpool_matches.apply(
-            lambda row: row["FullTimeAwayGoals"] if row["HomeTeam"] == "Liverpool" else row["FullTimeHomeGoals"], axis=1)
+        liverpool_matches["Liverpool Goals"] = liverpool_matches["GoalsFor"]
+        liverpool_matches["Opponent Goals"] = liverpool_matches["GoalsAgainst"]
 
         plt.figure(figsize=(14, 5))
         plt.plot(liverpool_matches["MatchDate"], liverpool_matches["Liverpool Goals"], label="Liverpool Goals", marker="o")
@@ -868,7 +826,7 @@ with tab9:
         st.pyplot(plt)
 
     # Load Liverpool shot data
-    liverpool_shots = pd.read_csv("shots_EPL_1920.csv")
+    liverpool_shots = load_dataset("shots_EPL_1920.csv")
     liverpool_shots["date"] = pd.to_datetime(liverpool_shots["date"], errors="coerce")
     liverpool_shots = liverpool_shots[liverpool_shots["date"].dt.year.isin([2019, 2020])]
     liverpool_shots = liverpool_shots[
@@ -879,8 +837,8 @@ with tab9:
     liverpool_shots["isGoal"] = liverpool_shots["result"] == "Goal"
 
     # Top Scorers and Assists
-    top_scorers = liverpool_shots[liverpool_shots["result"] == "Goal"].groupby("player")["result"].count().sort_values(ascending=False).head(10)
-    top_assists = liverpool_shots[liverpool_shots["player_assisted"].notna()].groupby("player_assisted")["id"].count().sort_values(ascending=False).head(10)
+    top_scorers = liverpool_shots[liverpool_shots["result"] == "Goal"].groupby("player", observed=True)["result"].count().sort_values(ascending=False).head(10)
+    top_assists = liverpool_shots[liverpool_shots["player_assisted"].notna()].groupby("player_assisted", observed=True)["id"].count().sort_values(ascending=False).head(10)
 
     fig, axs = plt.subplots(1, 2, figsize=(16, 5))
     sns.barplot(x=top_scorers.values, y=top_scorers.index, ax=axs[0])
@@ -909,7 +867,7 @@ with tab9:
 
     # Shot Types
     plt.figure(figsize=(12, 6))
-    shot_types = liverpool_shots.groupby(["Venue", "shotType"])["id"].count().unstack().fillna(0)
+    shot_types = liverpool_shots.groupby(["Venue", "shotType"], observed=True)["id"].count().unstack().fillna(0)
     shot_types.T.plot(kind='bar')
     plt.title("Liverpool Shot Types: Home vs Away")
     plt.ylabel("Number of Shots")
@@ -918,7 +876,7 @@ with tab9:
 
     # Shot Situations
     plt.figure(figsize=(12, 6))
-    situations = liverpool_shots.groupby(["Venue", "situation"])["id"].count().unstack().fillna(0)
+    situations = liverpool_shots.groupby(["Venue", "situation"], observed=True)["id"].count().unstack().fillna(0)
     situations.T.plot(kind='bar')
     plt.title("Shot Situations: Home vs Away")
     plt.ylabel("Number of Shots")
@@ -926,8 +884,8 @@ with tab9:
     st.pyplot(plt)
 
     # xG Top Contributors
-    home_xg = liverpool_shots[liverpool_shots["Venue"] == "Home"].groupby("player")["xG"].sum().sort_values(ascending=False).head(5)
-    away_xg = liverpool_shots[liverpool_shots["Venue"] == "Away"].groupby("player")["xG"].sum().sort_values(ascending=False).head(5)
+    home_xg = liverpool_shots[liverpool_shots["Venue"] == "Home"].groupby("player", observed=True)["xG"].sum().sort_values(ascending=False).head(5)
+    away_xg = liverpool_shots[liverpool_shots["Venue"] == "Away"].groupby("player", observed=True)["xG"].sum().sort_values(ascending=False).head(5)
 
     fig, axs = plt.subplots(1, 2, figsize=(16, 5))
     sns.barplot(x=home_xg.values, y=home_xg.index, ax=axs[0])
@@ -940,39 +898,23 @@ with tab9:
     st.pyplot(plt)
 
     # Team Shot Density Heatmaps
-    fig, axes = plt.subplots(1, 2, figsize=(18, 7))
-    for ax, venue in zip(axes, ["Home", "Away"]):
-        subset = liverpool_shots[liverpool_shots["Venue"] == venue]
-        sns.kdeplot(data=subset, x="X", y="Y", fill=True, thresh=0, levels=100, cmap="Reds", ax=ax)
-        ax.set_title(f"Liverpool Shot Density – {venue} Matches")
-        ax.set_xlim(0.7, 1.05)
-        ax.set_ylim(0.2, 0.9)
-        ax.set_aspect('equal')
-        ax.invert_yaxis()
-        ax.set_xlabel("Normalized X (Goal Right)")
-        ax.set_ylabel("Normalized Y (Pitch Height)")
-    plt.tight_layout()
-    st.pyplot(plt)
+    fig = density_panels(
+        [(f"Liverpool Shot Density – {venue} Matches", liverpool_shots[liverpool_shots["Venue"] == venue])
+         for venue in ["Home", "Away"]],
+        shared_scale=True
+    )
+    st.plotly_chart(fig, use_container_width=True)
 
     # Salah vs Firmino Shot Density
     key_players = ["Mohamed Salah", "Roberto Firmino"]
     player_shots = liverpool_shots[liverpool_shots["player"].isin(key_players)]
 
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12), sharex=True, sharey=True)
-    for i, player in enumerate(key_players):
-        for j, venue in enumerate(["Home", "Away"]):
-            subset = player_shots[(player_shots["player"] == player) & (player_shots["Venue"] == venue)]
-            ax = axes[i][j]
-            sns.kdeplot(data=subset, x="X", y="Y", fill=True, thresh=0, levels=100, cmap="Reds", ax=ax)
-            ax.set_title(f"{player} – {venue} Matches", fontsize=12)
-            ax.set_xlim(0.7, 1.05)
-            ax.set_ylim(0.2, 0.9)
-            ax.set_aspect('equal')
-            ax.invert_yaxis()
-            ax.set_xlabel("Normalized X")
-            ax.set_ylabel("Normalized Y")
-
-    plt.suptitle("Shot Density Heatmap: Mohamed Salah vs Roberto Firmino (Home & Away)", fontsize=16)
-    plt.tight_layout(rect=[0, 0, 1, 0.96])
-    st.pyplot(plt)
+    fig = density_panels(
+        [(f"{player} – {venue} Matches",
+          player_shots[(player_shots["player"] == player) & (player_shots["Venue"] == venue)])
+         for player in key_players for venue in ["Home", "Away"]],
+        title="Shot Density Heatmap: Mohamed Salah vs Roberto Firmino (Home & Away)",
+        shared_scale=True
+    )
+    st.plotly_chart(fig, use_container_width=True)
 
@@ -0,0 +1,182 @@
+"""Canonical long table with one row per team per match.
+
+Every tab used to rebuild ``HomeTeam == 'Liverpool' | AwayTeam == 'Liverpool'``
+masks and then branch on home/away to get the team's goals, shots and cards.
+``team_match_table`` stacks the home and away perspectives of every Premier
+League match once, so a team-level view is a lookup plus a groupby.
+
+Each season is taken from the most complete file, preferring ``epl_final.csv``
+(2000-01 onwards, with shots, corners, fouls and cards), then ``EPL_Set.csv``
+(half-time scores from 1995-96), then ``premier-league-matches.csv``.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_mirror import REPO_DIR
+from data_registry import derived_table, load_dataset
+from match_enrichment import RESULT_LABELS, RESULT_POINTS
+from teams import canonical_team, team_ids
+
+# Highest priority first
+SOURCES = {
+    "epl_final": os.path.join(REPO_DIR, "epl_final.csv"),
+    "epl_set": os.path.join(REPO_DIR, "EPL_Set.csv"),
+    "matches": os.path.join(REPO_DIR, "premier-league-matches.csv"),
+}
+
+# Per-team statistics present in at least one source, as (home, away) columns
+STAT_COLUMNS = {
+    "Shots": ("HomeShots", "AwayShots"),
+    "ShotsOnTarget": ("HomeShotsOnTarget", "AwayShotsOnTarget"),
+    "Corners": ("HomeCorners", "AwayCorners"),
+    "Fouls": ("HomeFouls", "AwayFouls"),
+    "YellowCards": ("HomeYellowCards", "AwayYellowCards"),
+    "RedCards": ("HomeRedCards", "AwayRedCards"),
+}
+
+HT_STATES = np.array(["Trailing", "Level", "Leading"])
+
+# understat match summaries (2019-20), the only dated per-match xG
+XG_PATH = os.path.join(REPO_DIR, "match_infos_EPL_1920.csv")
+
+
+def _normalise_source(name, df):
+    """Return a wide frame with shared column names for one source file."""
+    if name == "epl_final":
+        wide = pd.DataFrame({
+            "Season": df["Season"].str.replace("/", "-"),
+            "Date": pd.to_datetime(df["MatchDate"]),
+            "HomeTeam": df["HomeTeam"], "AwayTeam": df["AwayTeam"],
+            "HomeGoals": df["FullTimeHomeGoals"], "AwayGoals": df["FullTimeAwayGoals"],
+            "HTHomeGoals": df["HalfTimeHomeGoals"], "HTAwayGoals": df["HalfTimeAwayGoals"],
+        })
+        for home_col, away_col in STAT_COLUMNS.values():
+            wide[home_col] = df[home_col]
+            wide[away_col] = df[away_col]
+        return wide
+    if name == "epl_set":
+        return pd.DataFrame({
+            "Season": df["Season"],
+            "Date": pd.to_datetime(df["Date"], format="mixed", dayfirst=True),
+            "HomeTeam": df["HomeTeam"], "AwayTeam": df["AwayTeam"],
+            "HomeGoals": df["FTHG"], "AwayGoals": df["FTAG"],
+            "HTHomeGoals": df["HTHG"], "HTAwayGoals": df["HTAG"],
+        })
+    start = df["Season_End_Year"].to_numpy() - 1
+    return pd.DataFrame({
+        "Season": [f"{year}-{(year + 1) % 100:02d}" for year in start],
+        "Date": pd.to_datetime(df["Date"]),
+        "HomeTeam": df["Home"], "AwayTeam": df["Away"],
+        "HomeGoals": df["HomeGoals"], "AwayGoals": df["AwayGoals"],
+    })
+
+
+def _wide_matches():
+    """Every match once, each season taken from its most complete source.
+
+    epl_final.csv is missing fixtures in 2003-04 and 2004-05, so a season comes
+    from whichever source has the most matches for it, ties going to priority.
+    """
+    frames = []
+    for rank, (name, path) in enumerate(SOURCES.items()):
+        wide = _normalise_source(name, load_dataset(path))
+        wide.insert(0, "Source", name)
+        wide["_rank"] = rank
+        frames.append(wide)
+    wide = pd.concat(frames, ignore_index=True)
+
+    coverage = wide.groupby(["Season", "Source"], sort=False, observed=True).agg(
+        matches=("HomeTeam", "size"), rank=("_rank", "first")
+    ).reset_index()
+    best = coverage.sort_values(["matches", "rank"], ascending=[False, True]).drop_duplicates("Season")
+    keep = pd.MultiIndex.from_frame(wide[["Season", "Source"]]).isin(
+        pd.MultiIndex.from_frame(best[["Season", "Source"]])
+    )
+    wide = wide[keep].drop(columns="_rank").sort_values(["Date", "HomeTeam"], kind="stable")
+    wide = wide.reset_index(drop=True)
+    wide.insert(0, "MatchId", np.arange(len(wide)))
+    return wide
+
+
+def _perspective(wide, venue):
+    """One row per match from the home (``venue='Home'``) or away side."""
+    side, other = ("Home", "Away") if venue == "Home" else ("Away", "Home")
+    long = pd.DataFrame({
+        "MatchId": wide["MatchId"], "Source": wide["Source"],
+        "Season": wide["Season"], "Date": wide["Date"],
+        "Team": wide[f"{side}Team"], "Opponent": wide[f"{other}Team"],
+        "TeamId": team_ids(wide[f"{side}Team"]), "OpponentId": team_ids(wide[f"{other}Team"]),
+        "Venue": venue,
+        "GoalsFor": wide[f"{side}Goals"], "GoalsAgainst": wide[f"{other}Goals"],
+        "HTGoalsFor": wide[f"HT{side}Goals"], "HTGoalsAgainst": wide[f"HT{other}Goals"],
+    })
+    for stat, (home_col, away_col) in STAT_COLUMNS.items():
+        own, opp = (home_col, away_col) if venue == "Home" else (away_col, home_col)
+        long[f"{stat}For"] = wide[own]
+        long[f"{stat}Against"] = wide[opp]
+    return long
+
+
+def build_team_match_table():
+    """Build the long table from the source files (uncached; see ``team_match_table``)."""
+    wide = _wide_matches()
+    long = pd.concat([_perspective(wide, "Home"), _perspective(wide, "Away")], ignore_index=True)
+    long = long.sort_values(["MatchId", "Venue"], ascending=[True, False], kind="stable")
+    long = long.reset_index(drop=True)
+
+    goal_difference = (long["GoalsFor"] - long["GoalsAgainst"]).to_numpy()
+    outcome = np.sign(goal_difference).astype(int) + 1
+    long["GoalDifference"] = goal_difference
+    long["Result"] = RESULT_LABELS[outcome]
+    long["Points"] = RESULT_POINTS[outcome]
+
+    ht_difference = (long["HTGoalsFor"] - long["HTGoalsAgainst"]).to_numpy(dtype=float)
+    ht_known = ~np.isnan(ht_difference)
+    ht_state = np.full(len(long), None, dtype=object)
+    ht_state[ht_known] = HT_STATES[np.sign(ht_difference[ht_known]).astype(int) + 1]
+    long["HTState"] = ht_state
+    return long
+
+
+def _table_with_index():
+    table = build_team_match_table()
+    return table, table.groupby("Team", sort=True, observed=True).indices
+
+
+def team_match_table():
+    """Return the shared long table, built once per process and on source changes.
+
+    Treat the result as read-only; copy before modifying columns in place.
+    """
+    return derived_table("team_match_table", SOURCES.values(), _table_with_index)[0]
+
+
+def team_match_xg():
+    """Both perspectives of the understat matches: Date, Team, xGFor, xGAgainst.
+
+    Dates are midnight, so the rows join onto the long table on Date and Team.
+    """
+    infos = load_dataset(XG_PATH)
+    dates = pd.to_datetime(infos["date"]).dt.normalize()
+    return pd.concat([
+        pd.DataFrame({"Date": dates, "Team": infos[team], "xGFor": infos[own], "xGAgainst": infos[other]})
+        for team, own, other in (("team_h", "h_xg", "a_xg"), ("team_a", "a_xg", "h_xg"))
+    ], ignore_index=True)
+
+
+def team_matches(team, seasons=None):
+    """Return ``team``'s rows of the long table, optionally limited to ``seasons``."""
+    table, positions = derived_table("team_match_table", SOURCES.values(), _table_with_index)
+    rows = table.take(positions.get(canonical_team(team), []))
+    if seasons is not None:
+        rows = rows[rows["Season"].isin(seasons)]
+    return rows.reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    table = team_match_table()
+    print(f"✅ {len(table):,} team-match rows, {table['MatchId'].nunique():,} matches, "
+          f"{table['Team'].nunique()} teams, seasons {table['Season'].min()} to {table['Season'].max()}")
+    print(table.groupby("Source", observed=True)["Season"].agg(["min", "max", "nunique"]))
@@ -0,0 +1,122 @@
+"""Canonical team dimension shared by every dataset.
+
+The match files spell the same clubs differently ("Man City", "Manchester City",
+"Newcastle Utd", "Newcastle"...). ``TEAMS`` lists each club once with a stable
+integer id (its position), a three-letter abbreviation and its known aliases.
+Lookups go through one hash map, and ``canonicalize_teams`` is applied by
+``data_registry.load_dataset`` when a file is read, so every frame the
+dashboards see already uses the canonical names.
+"""
+import pandas as pd
+
+# (canonical name, abbreviation, aliases). The id of a team is its index:
+# append new clubs at the end so existing ids never change.
+TEAMS = [
+    ("Arsenal", "ARS", ()),
+    ("Aston Villa", "AVL", ()),
+    ("Barnsley", "BAR", ()),
+    ("Birmingham City", "BIR", ("Birmingham",)),
+    ("Blackburn", "BLB", ("Blackburn Rovers",)),
+    ("Blackpool", "BLP", ()),
+    ("Bolton", "BOL", ("Bolton Wanderers",)),
+    ("Bournemouth", "BOU", ("AFC Bournemouth",)),
+    ("Bradford City", "BRA", ("Bradford",)),
+    ("Brentford", "BRE", ()),
+    ("Brighton", "BHA", ("Brighton and Hove Albion", "Brighton & Hove Albion")),
+    ("Burnley", "BUR", ()),
+    ("Cardiff City", "CAR", ("Cardiff",)),
+    ("Charlton Athletic", "CHA", ("Charlton", "Charlton Ath")),
+    ("Chelsea", "CHE", ()),
+    ("Coventry City", "COV", ("Coventry",)),
+    ("Crystal Palace", "CRY", ()),
+    ("Derby County", "DER", ("Derby",)),
+    ("Everton", "EVE", ()),
+    ("Fulham", "FUL", ()),
+    ("Huddersfield", "HUD", ("Huddersfield Town",)),
+    ("Hull City", "HUL", ("Hull",)),
+    ("Ipswich Town", "IPS", ("Ipswich",)),
+    ("Leeds United", "LEE", ("Leeds",)),
+    ("Leicester City", "LEI", ("Leicester",)),
+    ("Liverpool", "LIV", ()),
+    ("Luton Town", "LUT", ("Luton",)),
+    ("Manchester City", "MCI", ("Man City",)),
+    ("Manchester United", "MUN", ("Man United", "Manchester Utd")),
+    ("Middlesbrough", "MID", ("Middlesboro",)),
+    ("Newcastle United", "NEW", ("Newcastle", "Newcastle Utd")),
+    ("Norwich City", "NOR", ("Norwich",)),
+    ("Nottingham Forest", "NFO", ("Nott'm Forest", "Nott'ham Forest")),
+    ("Oldham Athletic", "OLD", ("Oldham",)),
+    ("Portsmouth", "POR", ()),
+    ("QPR", "QPR", ("Queens Park Rangers",)),
+    ("Reading", "REA", ()),
+    ("Sheffield United", "SHU", ("Sheffield Utd",)),
+    ("Sheffield Wednesday", "SHW", ("Sheffield Weds",)),
+    ("Southampton", "SOU", ()),
+    ("Stoke City", "STK", ("Stoke",)),
+    ("Sunderland", "SUN", ()),
+    ("Swansea City", "SWA", ("Swansea",)),
+    ("Swindon Town", "SWI", ("Swindon",)),
+    ("Tottenham", "TOT", ("Tottenham Hotspur",)),
+    ("Watford", "WAT", ()),
+    ("West Brom", "WBA", ("West Bromwich Albion",)),
+    ("West Ham", "WHU", ("West Ham United",)),
+    ("Wigan Athletic", "WIG", ("Wigan",)),
+    ("Wimbledon", "WIM", ()),
+    ("Wolves", "WOL", ("Wolverhampton Wanderers",)),
+]
+
+# Columns holding team names in the repo's datasets
+TEAM_COLUMNS = (
+    "HomeTeam", "AwayTeam", "Home", "Away", "h_team", "a_team",
+    "team_h", "team_a", "Team", "Opponent", "team",
+)
+
+TEAM_IDS = {name: team_id for team_id, (name, _, _) in enumerate(TEAMS)}
+ABBREVIATIONS = {name: abb for name, abb, _ in TEAMS}
+
+# Normalised spelling -> canonical name
+_ALIASES = {
+    alias.strip().lower(): name
+    for name, _, aliases in TEAMS
+    for alias in (name,) + aliases
+}
+
+
+def canonical_team(name):
+    """Return the canonical name for ``name``, or ``name`` itself if the club is unknown."""
+    if not isinstance(name, str):
+        return name
+    return _ALIASES.get(name.strip().lower(), name)
+
+
+def canonicalize(names):
+    """Vectorised ``canonical_team`` over a Series (one lookup per distinct name)."""
+    names = pd.Series(names)
+    mapping = {name: canonical_team(name) for name in names.dropna().unique()}
+    return names.map(mapping).where(names.notna(), names)
+
+
+def team_id(name):
+    """Stable integer id of a team under any of its spellings (-1 when unknown)."""
+    return TEAM_IDS.get(canonical_team(name), -1)
+
+
+def team_ids(names):
+    """Vectorised ``team_id``: an int array aligned with ``names``."""
+    names = pd.Series(names)
+    mapping = {name: team_id(name) for name in names.dropna().unique()}
+    return names.map(mapping).fillna(-1).to_numpy(dtype=int)
+
+
+def team_abbreviation(name):
+    """Three-letter abbreviation of a team under any of its spellings."""
+    canonical = canonical_team(name)
+    return ABBREVIATIONS.get(canonical, canonical)
+
+
+def canonicalize_teams(df):
+    """Rewrite every team-name column of ``df`` to canonical names, in place."""
+    for column in TEAM_COLUMNS:
+        if column in df.columns and pd.api.types.is_string_dtype(df[column]):
+            df[column] = canonicalize(df[column]).to_numpy()
+    return df
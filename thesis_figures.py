@@ -0,0 +1,580 @@
+"""Builders for the static thesis figures exported to PNG.
+
+Each ``@thesis_figure`` function builds one Plotly figure from the repo's
+datasets and registers it in ``THESIS_FIGURES`` with its output file name, the
+CSV files it reads and its ``write_image`` options. ``export_figures`` renders
+the registry; the figures match the ones ``liverpool_full_dashboard_all_real.py``
+used to write one at a time.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from data_mirror import REPO_DIR
+from data_registry import load_dataset
+from eras import era_labels
+from match_enrichment import enrich_matches
+from teams import team_abbreviation
+from xg_table import gameweek_xg_table
+
+# file name -> ThesisFigure
+THESIS_FIGURES = {}
+
+# The xG figures show the table after this gameweek
+XG_GAMEWEEK = 7
+
+COVID_ORDER = ['Pre-COVID', 'During-COVID', 'Post-COVID']
+
+
+class ThesisFigure:
+    """A registered figure builder: ``build()`` returns the figure to write to ``filename``."""
+
+    def __init__(self, filename, build, sources, image_options):
+        self.filename = filename
+        self.build = build
+        self.sources = [os.path.join(REPO_DIR, source) for source in sources]
+        self.image_options = image_options
+
+
+def thesis_figure(filename, sources, **image_options):
+    """Register the decorated builder as the source of ``filename``.
+
+    ``sources`` are the CSV files the figure is built from and
+    ``image_options`` are passed to ``write_image`` (width, height, scale).
+    """
+    def register(build):
+        if filename in THESIS_FIGURES:
+            raise ValueError(f"Duplicate thesis figure: {filename}")
+        THESIS_FIGURES[filename] = ThesisFigure(filename, build, sources, image_options)
+        return build
+    return register
+
+
+def _covid_period(dates, during="During COVID", unknown=None):
+    """Label each date Pre-COVID, ``during`` or Post-COVID (the figures differ on the label)."""
+    return era_labels(dates, 'covid_seasons', unknown).rename_categories({'During COVID': during})
+
+
+# ---- Home vs Away (Liverpool_2015_2023_Matches.csv) ----
+
+def _venue_summary():
+    df = enrich_matches(load_dataset('Liverpool_2015_2023_Matches.csv'))
+    summary = df.groupby('Venue', observed=True).agg(
+        Total_Matches=('Result', 'count'),
+        Wins=('Result', lambda x: (x == 'Win').sum())
+    ).reset_index()
+    summary['Win_Percentage'] = (summary['Wins'] / summary['Total_Matches'] * 100).round(1)
+    return summary
+
+
+@thesis_figure("liverpool_wins_home_away.png", ["Liverpool_2015_2023_Matches.csv"], width=1000, height=600)
+def liverpool_wins_home_away():
+    summary = _venue_summary()
+    fig = px.bar(
+        summary, x='Venue', y='Wins', text='Wins', color='Venue',
+        color_discrete_map={'Home': 'red', 'Away': 'green'},
+        labels={'Wins': 'Number of Wins', 'Venue': 'Venue'},
+        template='plotly_white',
+        title=f"⚽ Liverpool Wins (2015–2023) — Home vs Away<br>Total Games: {summary['Total_Matches'].sum()}"
+    )
+    fig.update_traces(
+        textposition='outside',
+        customdata=summary[['Total_Matches', 'Win_Percentage']].values,
+        hovertemplate='<b>Venue:</b> %{x}<br>' +
+                      '<b>Wins:</b> %{y}<br>' +
+                      '<b>Total Games:</b> %{customdata[0]}<br>' +
+                      '<b>Win %:</b> %{customdata[1]}%'
+    )
+    fig.update_layout(
+        title_font=dict(size=22), xaxis_title='Venue', yaxis_title='Number of Wins',
+        xaxis=dict(title_font=dict(size=18)), yaxis=dict(title_font=dict(size=18)),
+        showlegend=False
+    )
+    return fig
+
+
+@thesis_figure("liverpool_matches_vs_wins_grouped.png", ["Liverpool_2015_2023_Matches.csv"], width=1000, height=600)
+def liverpool_matches_vs_wins_grouped():
+    summary_melted = _venue_summary().melt(id_vars='Venue', value_vars=['Total_Matches', 'Wins'])
+    fig = px.bar(
+        summary_melted, x='Venue', y='value', color='variable', barmode='group', text='value',
+        title='⚽ Liverpool (2015–2023): Matches Played vs Wins (Home & Away)',
+        labels={'value': 'Number of Matches', 'Venue': 'Venue', 'variable': 'Metric'},
+        color_discrete_map={'Total_Matches': 'royalblue', 'Wins': 'crimson'},
+        template='plotly_white'
+    )
+    fig.update_traces(textposition='outside')
+    fig.update_layout(
+        title_font=dict(size=22),
+        xaxis=dict(title_font=dict(size=18)), yaxis=dict(title_font=dict(size=18)),
+        legend_title_text='Metric'
+    )
+    return fig
+
+
+@thesis_figure("liverpool_covid_stacked_modern.png", ["Liverpool_2015_2023_Matches.csv"], width=1200, height=600)
+def liverpool_covid_stacked_modern():
+    df = enrich_matches(load_dataset("Liverpool_2015_2023_Matches.csv"))
+    df['CovidPeriod'] = _covid_period(df['Date'])
+    df['Result_Grouped'] = np.where(df['Result'] == 'Win', 'Wins', 'Other')
+    stacked = df.groupby(['CovidPeriod', 'Venue', 'Result_Grouped'], observed=True).size().reset_index(name='Count')
+
+    fig = px.bar(
+        stacked, x='Venue', y='Count', color='Result_Grouped', barmode='stack', facet_col='CovidPeriod',
+        color_discrete_map={'Wins': '#D7263D', 'Other': '#7F7F7F'},
+        title='⚽ Liverpool Results by Venue & COVID Period (2015–2023)',
+        labels={'Count': 'Matches', 'Venue': 'Venue', 'Result_Grouped': 'Outcome'},
+        template='plotly_white'
+    )
+    fig.update_layout(
+        font=dict(family='Segoe UI', size=14),
+        title_font=dict(size=24, color='#1f1f1f'),
+        legend=dict(title='Outcome', orientation='h', yanchor='bottom', y=-0.2, xanchor='center', x=0.5),
+        margin=dict(t=80, b=80), plot_bgcolor='white', paper_bgcolor='white'
+    )
+    fig.update_traces(
+        marker_line_width=1.5, marker_line_color='white', textposition='inside',
+        hovertemplate='<b>Venue:</b> %{x}<br>' +
+                      '<b>Outcome:</b> %{legendgroup}<br>' +
+                      '<b>Matches:</b> %{y}<extra></extra>'
+    )
+    return fig
+
+
+# ---- Home vs Away, 2015 onwards (Liverpool_Filtered_2015_onwards.csv) ----
+
+def _filtered_matches():
+    df = load_dataset('Liverpool_Filtered_2015_onwards.csv')
+    is_home = df['HomeTeam'] == 'Liverpool'
+    df['Venue'] = np.where(is_home, 'Home', 'Away')
+    df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
+    df['CovidPeriod'] = _covid_period(df['Date'], unknown='Unknown')
+    home_result = df['FTR'].map({'H': 'Win', 'D': 'Draw', 'A': 'Loss'})
+    away_result = df['FTR'].map({'A': 'Win', 'D': 'Draw', 'H': 'Loss'})
+    df['Result'] = home_result.where(is_home, away_result)
+    df['GoalsFor'] = df['FTHG'].where(is_home, df['FTAG'])
+    return df
+
+
+@thesis_figure("wins_home_away.png", ["Liverpool_Filtered_2015_onwards.csv"], width=1000, height=600)
+def wins_home_away():
+    df = _filtered_matches()
+    wins = df[df['Result'] == 'Win'].groupby('Venue', observed=True).size().reset_index(name='Wins')
+    fig = px.bar(
+        wins, x='Venue', y='Wins', text='Wins', color='Venue',
+        title='🏠 Liverpool Wins (Home vs Away)',
+        color_discrete_map={'Home': '#FF4136', 'Away': '#2ECC40'},
+        template='plotly_white'
+    )
+    fig.update_traces(marker_line_color='white', marker_line_width=1.5, textposition='outside')
+    fig.update_layout(font=dict(size=14), title_font=dict(size=24))
+    return fig
+
+
+@thesis_figure("result_percent_stacked.png", ["Liverpool_Filtered_2015_onwards.csv"], width=1000, height=600)
+def result_percent_stacked():
+    outcome = _filtered_matches().groupby(['Venue', 'Result'], observed=True).size().reset_index(name='Count')
+    outcome['Percent'] = outcome['Count'] / outcome.groupby('Venue', observed=True)['Count'].transform('sum') * 100
+    fig = px.bar(
+        outcome, x='Venue', y='Percent', color='Result', text=outcome['Percent'].round(1),
+        barmode='stack', title='⚖️ Result % Breakdown (Home vs Away)',
+        color_discrete_sequence=px.colors.qualitative.Safe, template='plotly_white'
+    )
+    fig.update_layout(font=dict(size=14), title_font=dict(size=24))
+    return fig
+
+
+@thesis_figure("result_covid_venue.png", ["Liverpool_Filtered_2015_onwards.csv"], width=1200, height=600)
+def result_covid_venue():
+    covid_outcome = _filtered_matches().groupby(
+        ['CovidPeriod', 'Venue', 'Result'], observed=True).size().reset_index(name='Count')
+    fig = px.bar(
+        covid_outcome, x='Venue', y='Count', color='Result', barmode='stack',
+        facet_col='CovidPeriod', title='🦠 Result Breakdown by Venue & COVID Period',
+        color_discrete_sequence=px.colors.qualitative.Bold, template='plotly_white'
+    )
+    fig.update_layout(font=dict(size=14), title_font=dict(size=24))
+    return fig
+
+
+@thesis_figure("wins_over_time.png", ["Liverpool_Filtered_2015_onwards.csv"], width=1000, height=600)
+def wins_over_time():
+    df = _filtered_matches()
+    df['Year'] = df['Date'].dt.year
+    wins_time = df[df['Result'] == 'Win'].groupby(['Year', 'Venue'], observed=True).size().reset_index(name='Wins')
+    fig = px.line(
+        wins_time, x='Year', y='Wins', color='Venue', markers=True,
+        title='📈 Liverpool Wins Over Time (Home vs Away)',
+        color_discrete_map={'Home': '#FF4136', 'Away': '#2ECC40'},
+        template='plotly_white'
+    )
+    fig.update_layout(font=dict(size=14), title_font=dict(size=24))
+    return fig
+
+
+@thesis_figure("boxplot_goals.png", ["Liverpool_Filtered_2015_onwards.csv"], width=1000, height=600)
+def boxplot_goals():
+    fig = px.box(
+        _filtered_matches(), x='Venue', y='GoalsFor', points='all',
+        title='🎯 Goals Scored per Match (Home vs Away)',
+        color='Venue',
+        color_discrete_map={'Home': '#FF4136', 'Away': '#2ECC40'},
+        template='plotly_white'
+    )
+    fig.update_layout(font=dict(size=14), title_font=dict(size=24))
+    return fig
+
+
+# ---- EPL 2020/21 xG (EPL_result.csv) ----
+
+def _xg_table():
+    engine = gameweek_xg_table()
+    df_temp = engine.table(XG_GAMEWEEK)
+    df_temp['Team'] = df_temp['Team'].map(team_abbreviation)
+    return df_temp
+
+
+@thesis_figure("xg_home_vs_away.png", ["EPL_result.csv"], scale=3)
+def xg_home_vs_away():
+    df_temp = _xg_table().sort_values(by='xG_h', ascending=False)
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=df_temp['xG_h'], y=df_temp['Team'], name='xG at Home', orientation='h',
+        marker=dict(color='firebrick'),
+        hovertemplate='Team: %{y}<br>xG at Home: %{x}<extra></extra>'
+    ))
+    fig.add_trace(go.Bar(
+        x=df_temp['xG_a'], y=df_temp['Team'], name='xG Away', orientation='h',
+        marker=dict(color='darkblue'),
+        hovertemplate='Team: %{y}<br>xG Away: %{x}<extra></extra>'
+    ))
+    fig.update_layout(
+        title='⚽ EPL 2020/21: xG Scored per Match — Home vs Away',
+        barmode='group', yaxis=dict(autorange="reversed"), template='plotly_white',
+        xaxis_title='xG per Match', height=700
+    )
+    return fig
+
+
+@thesis_figure("delta_xG_home_away_bar.png", ["EPL_result.csv"], scale=3)
+def delta_xg_home_away_bar():
+    df_sorted = _xg_table().sort_values(by='delta_xG_ha', ascending=False)
+    fig = px.bar(
+        df_sorted, x='delta_xG_ha', y='Team', orientation='h',
+        title='⚽ EPL 2020/21: xG Difference (Home - Away)',
+        labels={'delta_xG_ha': 'ΔxG (Home - Away)', 'Team': 'Team'},
+        template='plotly_white', text='delta_xG_ha',
+        color='delta_xG_ha', color_continuous_scale='RdBu'
+    )
+    fig.update_traces(texttemplate='%{x:.2f}', textposition='outside')
+    fig.update_layout(
+        xaxis_title='xG Difference (Home - Away)', yaxis=dict(autorange='reversed'),
+        coloraxis_showscale=False, title_font=dict(size=20), margin=dict(t=60, b=40)
+    )
+    return fig
+
+
+@thesis_figure("average_xg_difference_home_teams.png", ["EPL_result.csv"])
+def average_xg_difference_home_teams():
+    df = load_dataset('EPL_result.csv')
+    df['Home'] = df['Home'].map(team_abbreviation)
+    df['xG_diff'] = df['xG_Home'] - df['xG_Away']
+    team_xg_diff = df.groupby('Home', observed=True)['xG_diff'].mean().sort_values(ascending=False).reset_index()
+    return px.bar(team_xg_diff, x='Home', y='xG_diff',
+                  title='📊 Average xG Difference (Home Teams)',
+                  template='plotly_white')
+
+
+@thesis_figure("plot_xg_vs_xga_horizontal.png", ["EPL_result.csv"], scale=3)
+def plot_xg_vs_xga_horizontal():
+    df_temp = _xg_table().sort_values(by='xGpm', ascending=False)
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=df_temp['xGpm'], y=df_temp['Team'], name='xG per Match', orientation='h',
+        marker=dict(color='crimson'),
+        hovertemplate='Team: %{y}<br>xG: %{x}<extra></extra>'
+    ))
+    fig.add_trace(go.Bar(
+        x=df_temp['xGApm'], y=df_temp['Team'], name='xGA per Match', orientation='h',
+        marker=dict(color='dodgerblue'),
+        hovertemplate='Team: %{y}<br>xGA: %{x}<extra></extra>'
+    ))
+    fig.update_layout(
+        title='⚽ EPL 2020/21: xG vs xGA per Match (Side-by-Side)',
+        barmode='group', yaxis=dict(autorange="reversed"), template='plotly_white', height=700
+    )
+    return fig
+
+
+@thesis_figure("plot_xg_vs_xga_grouped.png", ["EPL_result.csv"], scale=3)
+def plot_xg_vs_xga_grouped():
+    df_temp = _xg_table().sort_values(by='xGpm', ascending=False)
+    df_grouped = df_temp[['Team', 'xGpm', 'xGApm']].melt(id_vars='Team', var_name='Metric', value_name='PerMatch')
+    fig = px.bar(
+        df_grouped, x='Team', y='PerMatch', color='Metric', barmode='group',
+        title='⚽ EPL 2020/21: xG vs xGA per Match (Grouped)',
+        template='plotly_white',
+        color_discrete_map={'xGpm': 'crimson', 'xGApm': 'dodgerblue'},
+        labels={'PerMatch': 'Per Match Value'}
+    )
+    fig.update_layout(xaxis_tickangle=-45, height=600)
+    return fig
+
+
+@thesis_figure("plot_xg_vs_xga_dotplot.png", ["EPL_result.csv"], scale=3)
+def plot_xg_vs_xga_dotplot():
+    df_temp = _xg_table().sort_values(by='xGpm', ascending=False)
+    fig = go.Figure()
+    for i, row in df_temp.iterrows():
+        fig.add_trace(go.Scatter(
+            x=[row['xGApm'], row['xGpm']], y=[row['Team'], row['Team']], mode='lines',
+            line=dict(color='gray', width=2), hoverinfo='skip', showlegend=False
+        ))
+        fig.add_trace(go.Scatter(
+            x=[row['xGApm']], y=[row['Team']], mode='markers',
+            marker=dict(color='dodgerblue', size=12), name='xGA' if i == 0 else None,
+            hovertemplate='Team: %{y}<br>xGA: %{x}<extra></extra>'
+        ))
+        fig.add_trace(go.Scatter(
+            x=[row['xGpm']], y=[row['Team']], mode='markers',
+            marker=dict(color='crimson', size=12), name='xG' if i == 0 else None,
+            hovertemplate='Team: %{y}<br>xG: %{x}<extra></extra>'
+        ))
+    fig.update_layout(
+        title="⚽ EPL 2020/21: xG vs xGA per Match (Dot Plot)",
+        template="plotly_white", xaxis_title="Per Match Value", height=800
+    )
+    return fig
+
+
+@thesis_figure("delta_xg_bar.png", ["EPL_result.csv"], scale=3)
+def delta_xg_bar():
+    df_sorted = _xg_table().sort_values(by='delta_xGpm', ascending=False)
+    fig = px.bar(
+        df_sorted, x='delta_xGpm', y='Team', orientation='h', text='delta_xGpm',
+        title='⚽ EPL 2020/21: Delta xG (Scored - Conceded)',
+        labels={'delta_xGpm': 'Delta xG per Match', 'Team': 'Team'},
+        template='plotly_white', color='delta_xGpm', color_continuous_scale='RdYlGn'
+    )
+    fig.update_traces(texttemplate='%{x:.2f}', textposition='outside')
+    fig.update_layout(
+        xaxis_title='ΔxG per Match', yaxis=dict(autorange='reversed'),
+        title_font=dict(size=20), coloraxis_showscale=False, margin=dict(t=60, b=40)
+    )
+    return fig
+
+
+@thesis_figure("home_xg_vs_goals_liverpool_highlight.png", ["EPL_result.csv"], width=1200, height=700)
+def home_xg_vs_goals_liverpool_highlight():
+    df = load_dataset('EPL_result.csv')
+    home_stats = df.groupby('Home', observed=True).agg(
+        Avg_xG_Home=('xG_Home', 'mean'),
+        Avg_G_Home=('G_Home', 'mean')
+    ).reset_index()
+    home_stats_melted = home_stats.melt(
+        id_vars='Home', value_vars=['Avg_xG_Home', 'Avg_G_Home'], var_name='Metric', value_name='Goals'
+    )
+    fig = px.bar(
+        home_stats_melted, x='Home', y='Goals', color='Metric', barmode='group', text='Goals',
+        title='⚽ Average Home xG vs Actual Goals per Team (Highlight: Liverpool)',
+        template='plotly_white',
+        color_discrete_map={'Avg_xG_Home': '#1f77b4', 'Avg_G_Home': '#d62728'}
+    )
+    fig.update_traces(texttemplate='%{text:.2f}', textposition='outside',
+                      marker_line_color='white', marker_line_width=1.2)
+    fig.update_layout(
+        xaxis_title='Club (Home Games)', yaxis_title='Goals (Average)',
+        font=dict(size=14), title_font=dict(size=22), xaxis_tickangle=45, bargap=0.25
+    )
+    return fig
+
+
+# ---- COVID performance (epl_final.csv) ----
+
+def _covid_summary():
+    liverpool_df = enrich_matches(load_dataset("epl_final.csv"))
+    liverpool_df['CovidPeriod'] = _covid_period(liverpool_df['MatchDate'], 'During-COVID')
+    is_home = liverpool_df['Venue'] == 'Home'
+    liverpool_df['Goals'] = liverpool_df['GoalsFor']
+    liverpool_df['GoalsConceded'] = liverpool_df['GoalsAgainst']
+    liverpool_df['Shots'] = liverpool_df['HomeShots'].where(is_home, liverpool_df['AwayShots'])
+    liverpool_df['ShotsOnTarget'] = liverpool_df['HomeShotsOnTarget'].where(is_home, liverpool_df['AwayShotsOnTarget'])
+    liverpool_df['Win'] = (liverpool_df['Result'] == 'Win').astype(int)
+    return liverpool_df.groupby(['CovidPeriod', 'Venue'], observed=True).agg({
+        'Goals': 'mean',
+        'GoalsConceded': 'mean',
+        'Shots': 'mean',
+        'ShotsOnTarget': 'mean',
+        'Win': 'mean'
+    }).reset_index().rename(columns={'Win': 'WinRate'}).round(2)
+
+
+def _facet_titles(fig):
+    fig.for_each_annotation(lambda a: a.update(text=a.text.split("=")[-1].replace("WinRate", "Win Rate")))
+    return fig
+
+
+@thesis_figure("Liverpool_COVID_Performance_FacetBar.png", ["epl_final.csv"], width=1200, height=600)
+def liverpool_covid_performance_facet_bar():
+    melted_summary = _covid_summary().melt(
+        id_vars=['CovidPeriod', 'Venue'],
+        value_vars=['Goals', 'GoalsConceded', 'Shots', 'ShotsOnTarget', 'WinRate'],
+        var_name='Metric', value_name='Value'
+    )
+    fig = px.bar(
+        melted_summary, x='CovidPeriod', y='Value', color='Venue', barmode='group', facet_col='Metric',
+        category_orders={'CovidPeriod': COVID_ORDER},
+        title='📊 Liverpool Performance Breakdown by COVID Period and Venue',
+        labels={'Value': 'Average per Match', 'CovidPeriod': 'Period', 'Venue': 'Venue'},
+        template='plotly_white', height=600
+    )
+    fig.update_layout(
+        title_font=dict(size=24), font=dict(size=13), legend_title_text='Venue',
+        legend=dict(orientation='h', y=1.15, x=0.3), margin=dict(l=60, r=60, t=100, b=60)
+    )
+    return _facet_titles(fig)
+
+
+@thesis_figure("Liverpool_Bar_Goals_WinRate.png", ["epl_final.csv"], width=1100, height=500)
+def liverpool_bar_goals_win_rate():
+    bar_data = _covid_summary().melt(
+        id_vars=['CovidPeriod', 'Venue'], value_vars=['Goals', 'WinRate'],
+        var_name='Metric', value_name='Value'
+    )
+    fig = px.bar(
+        bar_data, x='CovidPeriod', y='Value', color='Venue', barmode='group', facet_col='Metric',
+        category_orders={'CovidPeriod': COVID_ORDER},
+        title='📊 Liverpool Goals & Win Rate by COVID Period and Venue',
+        labels={'Value': 'Metric Value', 'CovidPeriod': 'Period'},
+        template='plotly_white', height=500
+    )
+    fig.update_layout(
+        title_font=dict(size=22), font=dict(size=12), legend_title_text='Venue',
+        margin=dict(l=60, r=60, t=80, b=60)
+    )
+    return _facet_titles(fig)
+
+
+@thesis_figure("Liverpool_WinRate_Trend.png", ["epl_final.csv"], width=800, height=500)
+def liverpool_win_rate_trend():
+    fig = px.line(
+        _covid_summary(), x='CovidPeriod', y='WinRate', color='Venue', markers=True,
+        title='📈 Liverpool Win Rate Trend by Venue',
+        labels={'WinRate': 'Win Rate (%)', 'CovidPeriod': 'COVID Period'},
+        category_orders={'CovidPeriod': COVID_ORDER},
+        template='plotly_white'
+    )
+    fig.update_layout(
+        yaxis_tickformat='.0%', title_font=dict(size=22), font=dict(size=12),
+        legend_title_text='Venue', margin=dict(l=60, r=60, t=80, b=60)
+    )
+    return fig
+
+
+@thesis_figure("Liverpool_Radar_Performance_Home_Away.png", ["epl_final.csv"], width=700, height=600)
+def liverpool_radar_performance_home_away():
+    metrics = ['Goals', 'GoalsConceded', 'Shots', 'ShotsOnTarget', 'WinRate']
+    avg_metrics = _covid_summary().groupby('Venue', observed=True)[metrics].mean().reset_index()
+    fig = go.Figure()
+    for _, row in avg_metrics.iterrows():
+        fig.add_trace(go.Scatterpolar(
+            r=row[metrics].values, theta=metrics, fill='toself', name=row['Venue'], line=dict(width=2)
+        ))
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, avg_metrics[metrics].max().max() * 1.2])),
+        title='🛡️ Overall Performance Radar: Home vs Away',
+        template='plotly_white', title_font=dict(size=22), font=dict(size=12),
+        margin=dict(l=60, r=60, t=80, b=60)
+    )
+    return fig
+
+
+# ---- Season stats (stats.csv) ----
+
+@thesis_figure("Liverpool Performance by Season.png", ["stats.csv"], width=1000, height=600)
+def liverpool_performance_by_season():
+    stats_df = load_dataset("stats.csv")
+    liverpool_stats = stats_df[stats_df['team'] == 'Liverpool'][
+        ['season', 'total_scoring_att', 'ontarget_scoring_att', 'goals', 'wins']]
+    liverpool_melted = liverpool_stats.melt(id_vars='season', var_name='Metric', value_name='Value')
+    fig = px.line(
+        liverpool_melted, x='season', y='Value', color='Metric', markers=True,
+        title='Liverpool Performance by Season: Shots, Shots on Target, Goals, Wins',
+        labels={'Value': 'Count', 'season': 'Season'},
+        template='plotly_white'
+    )
+    fig.update_layout(title_font=dict(size=22), legend_title_text='Metric',
+                      margin=dict(l=60, r=60, t=80, b=60))
+    return fig
+
+
+# ---- Managers (liverpoolfc_managers.csv) ----
+
+def _managers():
+    managers_df = load_dataset("liverpoolfc_managers.csv", sep=';')
+    managers_df['From'] = pd.to_datetime(managers_df['From'])
+    managers_df['To'] = pd.to_datetime(managers_df['To'])
+    managers_df['Days'] = (managers_df['To'] - managers_df['From']).dt.days
+    managers_df['Years'] = (managers_df['Days'] / 365).round(1)
+    return managers_df.sort_values(by='From')
+
+
+@thesis_figure("manager.png", ["liverpoolfc_managers.csv"])
+def manager_tenure():
+    fig = px.bar(
+        _managers(), x='Years', y='Name', color='win_perc', text='win_perc', orientation='h',
+        title="🔴 Liverpool Managers: Tenure Duration vs Win %",
+        labels={'Years': 'Years in Charge', 'win_perc': 'Win %'},
+        color_continuous_scale='RdYlGn', template='plotly_white'
+    )
+    fig.update_layout(xaxis_title='Years Managed', yaxis_title='Manager',
+                      coloraxis_colorbar=dict(title="Win %"), height=700)
+    return fig
+
+
+@thesis_figure("liverpool_managers_win_trend.png", ["liverpoolfc_managers.csv"], width=1000, height=600)
+def liverpool_managers_win_trend():
+    fig = px.line(
+        _managers(), x='From', y='win_perc', text='Name', markers=True,
+        title='📈 Liverpool Managers Over Time: Win % Trend',
+        labels={'From': 'Start Year', 'win_perc': 'Win Percentage'},
+        template='plotly_white'
+    )
+    fig.update_traces(textposition='top center', marker=dict(size=10, color='red'))
+    fig.update_layout(
+        title_font=dict(size=22), margin=dict(l=60, r=60, t=80, b=60), xaxis_tickformat='%Y',
+        xaxis_title='Start Year', yaxis_title='Win Percentage (%)', hovermode='x unified'
+    )
+    return fig
+
+
+@thesis_figure("liverpool_managers_bubble.png", ["liverpoolfc_managers.csv"], width=1000, height=600)
+def liverpool_managers_bubble():
+    fig = px.scatter(
+        _managers(), x='P', y='win_perc', size='Years', color='win_perc', text='Name',
+        title='⚽ Win % vs Games Managed (Bubble = Tenure)',
+        labels={'P': 'Games Managed', 'win_perc': 'Win %', 'Years': 'Tenure (Years)'},
+        color_continuous_scale='Blues', template='plotly_white'
+    )
+    fig.update_traces(textposition='top center')
+    fig.update_layout(
+        title_font=dict(size=22), margin=dict(l=60, r=60, t=80, b=60),
+        xaxis_title='Games Managed', yaxis_title='Win Percentage (%)', hovermode='closest'
+    )
+    return fig
+
+
+@thesis_figure("liverpool_managers_pie.png", ["liverpoolfc_managers.csv"], width=800, height=600)
+def liverpool_managers_pie():
+    managers_df = _managers()
+    fig = px.pie(
+        managers_df, names='Name', values='P',
+        title='🧩 Games Managed by Each Liverpool Manager',
+        template='plotly_white', hole=0.3
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label', pull=[0.05] * len(managers_df))
+    fig.update_layout(title_font=dict(size=22), margin=dict(l=60, r=60, t=80, b=60))
+    return fig
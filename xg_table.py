@@ -0,0 +1,96 @@
+"""Gameweek-indexed cumulative xG table for EPL_result.csv.
+
+The xG tab used to build its league table with one masked scan of the results
+per team per metric, for a single hard-coded gameweek. ``GameweekXGTable``
+accumulates every metric into per-team, per-gameweek prefix sums once, so the
+table "after gameweek N" is a row lookup for any N.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_mirror import REPO_DIR
+from data_registry import derived_table, load_dataset
+
+EPL_RESULT_PATH = os.path.join(REPO_DIR, "EPL_result.csv")
+
+# metric -> (column for the home side, column for the away side)
+METRICS = {
+    "M": (None, None),  # matches played
+    "xG": ("xG_Home", "xG_Away"),
+    "xGA": ("xG_Away", "xG_Home"),
+    "G": ("G_Home", "G_Away"),
+    "GA": ("G_Away", "G_Home"),
+    "Pts": ("Pts_Home", "Pts_Away"),
+}
+
+
+class GameweekXGTable:
+    """Per-team prefix sums of matches, xG, xGA, goals and points, home and away.
+
+    ``cumulative[(metric, side)]`` is a ``(gameweeks + 1, teams)`` array whose
+    row ``g`` holds each team's total over gameweeks ``1..g``.
+    """
+
+    def __init__(self, results):
+        played = results[results["G_Home"].notna() & results["G_Away"].notna()].copy()
+        goal_difference = (played["G_Home"] - played["G_Away"]).to_numpy()
+        played["Pts_Home"] = np.select([goal_difference > 0, goal_difference < 0], [3, 0], 1)
+        played["Pts_Away"] = np.select([goal_difference > 0, goal_difference < 0], [0, 3], 1)
+
+        self.teams = np.array(sorted(set(results["Home"]) | set(results["Away"])), dtype=object)
+        self._positions = {team: i for i, team in enumerate(self.teams)}
+        self.last_gameweek = int(played["GW"].max()) if len(played) else 0
+        gameweek = played["GW"].to_numpy()
+        home = np.searchsorted(self.teams, played["Home"].to_numpy())
+        away = np.searchsorted(self.teams, played["Away"].to_numpy())
+
+        self.cumulative = {}
+        for metric, (home_col, away_col) in METRICS.items():
+            for side, rows, col in (("h", home, home_col), ("a", away, away_col)):
+                totals = np.zeros((self.last_gameweek + 1, len(self.teams)))
+                values = 1.0 if col is None else played[col].to_numpy(dtype=float)
+                np.add.at(totals, (gameweek, rows), values)
+                self.cumulative[(metric, side)] = totals.cumsum(axis=0)
+
+    def _position(self, team):
+        try:
+            return self._positions[team]
+        except KeyError:
+            raise KeyError(f"No results for team {team!r}") from None
+
+    def table(self, gw_last=None, teams=None):
+        """Return the league table after ``gw_last`` (default: latest played gameweek).
+
+        Columns follow the xG tab: ``M``, ``xG``, ``xGA``, ``G``, ``GA`` and
+        ``Pts`` with ``_h``/``_a`` splits, per-match rates ``xGpm``/``xGApm``
+        (and their splits) and the ``delta_xGpm``/``delta_xG_ha`` differences.
+        Rows follow ``teams`` when given; a team not in the results raises
+        ``KeyError``.
+        """
+        gw = self.last_gameweek if gw_last is None else int(np.clip(gw_last, 0, self.last_gameweek))
+        order = np.arange(len(self.teams)) if teams is None else np.array(
+            [self._position(team) for team in teams], dtype=int)
+
+        df = pd.DataFrame({"Team": self.teams[order]})
+        for metric in METRICS:
+            df[f"{metric}_h"] = self.cumulative[(metric, "h")][gw, order]
+            df[f"{metric}_a"] = self.cumulative[(metric, "a")][gw, order]
+            df[metric] = df[f"{metric}_h"] + df[f"{metric}_a"]
+        df[["M_h", "M_a", "M"]] = df[["M_h", "M_a", "M"]].astype(int)
+
+        for metric in ("xG", "xGA"):
+            for suffix in ("_h", "_a", ""):
+                df[f"{metric}pm{suffix}"] = df[f"{metric}{suffix}"] / df[f"M{suffix}"]
+        df["delta_xGpm"] = df["xGpm"] - df["xGApm"]
+        df["delta_xG_ha"] = df["xG_h"] - df["xG_a"]
+        return df
+
+
+def gameweek_xg_table(path=EPL_RESULT_PATH):
+    """Return the shared ``GameweekXGTable`` for ``path``, rebuilt when the file changes."""
+    return derived_table(
+        f"gameweek_xg_table:{os.path.abspath(path)}", [path],
+        lambda: GameweekXGTable(load_dataset(path)),
+    )
@@ -0,0 +1,156 @@
+"""Convert the CSV datasets to ``converted_xlsx/`` and build ``combined_data.xlsx``.
+
+    python xlsx_export.py            # convert new or changed CSVs
+    python xlsx_export.py --force    # convert everything
+
+Each CSV is converted only when its SHA-256 differs from the one recorded in
+the manifest of the previous run. Conversions run in a process pool and are
+written with openpyxl's write-only workbook, which streams rows to disk
+instead of holding every cell object in memory. The combined workbook used by
+the Tableau dashboards (one sheet per CSV) is built from the Parquet mirror
+frames directly, not by reading the per-file workbooks back.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from openpyxl import Workbook
+
+from data_manifest import manifest_entry
+from data_mirror import REPO_DIR, read_mirrored
+
+OUTPUT_DIR = os.path.join(REPO_DIR, "converted_xlsx")
+COMBINED_NAME = "combined_data.xlsx"
+MANIFEST_NAME = ".xlsx_manifest.json"
+
+
+def sheet_name(csv_path):
+    """Sheet name of a CSV in the combined workbook (Excel allows 31 characters)."""
+    return os.path.splitext(os.path.basename(csv_path))[0][:31]
+
+
+def _column_values(series):
+    # Missing values become empty cells, as with DataFrame.to_excel
+    values = series.astype(object).to_numpy(copy=True)
+    values[series.isna().to_numpy()] = None
+    return values
+
+
+def write_sheet(workbook, title, df):
+    """Append ``df`` (header row first) to a new sheet of a write-only workbook."""
+    sheet = workbook.create_sheet(title)
+    sheet.append([str(column) for column in df.columns])
+    for row in zip(*(_column_values(df[column]) for column in df.columns)):
+        sheet.append(row)
+
+
+def save_workbook(sheets, path):
+    """Write ``[(title, frame), ...]`` to ``path`` through a temporary file."""
+    workbook = Workbook(write_only=True)
+    for title, df in sheets:
+        write_sheet(workbook, title, df)
+    tmp = path + ".tmp"
+    workbook.save(tmp)
+    os.replace(tmp, path)
+
+
+def _convert(csv_path, xlsx_path):
+    df, _ = read_mirrored(csv_path)
+    save_workbook([(sheet_name(csv_path), df)], xlsx_path)
+    return xlsx_path
+
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(out_dir, manifest):
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+
+def combined_fingerprint(digests):
+    """Hash of every input CSV's name and digest, in sheet order."""
+    return hashlib.sha256(json.dumps(sorted(digests.items())).encode()).hexdigest()
+
+
+def export_xlsx(csv_paths=None, out_dir=OUTPUT_DIR, force=False, jobs=None):
+    """Convert stale CSVs and rebuild the combined workbook if any input changed.
+
+    Returns ``{"converted": [...], "skipped": [...], "failed": {name: error},
+    "combined": bool}``. The manifest is updated for every file that converted.
+    """
+    csv_paths = sorted(csv_paths or glob.glob(os.path.join(REPO_DIR, "*.csv")))
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = {} if force else load_manifest(out_dir)
+    digests = {os.path.basename(path): manifest_entry(path)["sha256"] for path in csv_paths}
+
+    report = {"converted": [], "skipped": [], "failed": {}, "combined": False}
+    stale = []
+    for path in csv_paths:
+        name = os.path.basename(path)
+        xlsx_path = os.path.join(out_dir, name[:-len(".csv")] + ".xlsx")
+        if manifest.get(name) == digests[name] and os.path.exists(xlsx_path):
+            report["skipped"].append(name)
+        else:
+            stale.append((path, xlsx_path))
+
+    if stale:
+        jobs = max(1, min(jobs or os.cpu_count() or 1, len(stale)))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(_convert, path, xlsx_path): os.path.basename(path)
+                       for path, xlsx_path in stale}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    report["failed"][name] = str(e)
+                    continue
+                manifest[name] = digests[name]
+                report["converted"].append(name)
+
+    fingerprint = combined_fingerprint(digests)
+    combined_path = os.path.join(out_dir, COMBINED_NAME)
+    if manifest.get(COMBINED_NAME) != fingerprint or not os.path.exists(combined_path):
+        save_workbook([(sheet_name(path), read_mirrored(path)[0]) for path in csv_paths],
+                      combined_path)
+        manifest[COMBINED_NAME] = fingerprint
+        report["combined"] = True
+    save_manifest(out_dir, manifest)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=OUTPUT_DIR, help="output folder (default: converted_xlsx/)")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="convert even if nothing changed")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    report = export_xlsx(out_dir=args.out, force=args.force, jobs=args.jobs)
+    for name in sorted(report["converted"]):
+        print(f"✅ Converted {name}")
+    for name, error in sorted(report["failed"].items()):
+        print(f"❌ Failed to convert {name}: {error}")
+    if report["combined"]:
+        print(f"🎉 Rebuilt {os.path.join(args.out, COMBINED_NAME)}")
+    print(f"{len(report['converted'])} converted, {len(report['skipped'])} unchanged, "
+          f"{len(report['failed'])} failed in {time.perf_counter() - start:.1f}s")
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())